@@ -1,10 +1,13 @@
 import os
-import boto3
 import sentry_sdk
 from sentry_sdk.integrations.chalice import ChaliceIntegration
 
-from chalice.app import Chalice, Cron, Rate
+from chalice.app import Chalice, Cron
 from chalicelib.modules.supabase_client import SupabaseClient
+from chalicelib.modules.secret_provider import auth_secret
+from chalicelib.config import get_settings
+from chalicelib.request_context import request_scope
+from chalicelib.handlers.query_trace import report_query_trace
 
 
 # API imports
@@ -16,7 +19,7 @@ from chalicelib.api.events_member import events_member_api
 from chalicelib.api.events_rush import events_rush_api
 from chalicelib.api.accountability import accountability_api
 from chalicelib.api.monitoring import monitoring_api
-from chalicelib.repositories.repository_factory import RepositoryFactory
+from chalicelib.container import build_container
 from chalicelib.api import (
     listings,
     applicants,
@@ -27,31 +30,37 @@ from chalicelib.api import (
     accountability,
     monitoring,
 )
-from chalicelib.services.ListingService import ListingService
-from chalicelib.services.ApplicantService import ApplicantService
-from chalicelib.services.MemberService import MemberService
-from chalicelib.services.EventsMemberService import EventsMemberService
-from chalicelib.services.EventsRushService import EventsRushService
-from chalicelib.services.InsightsService import InsightsService
-from chalicelib.services.AccountabilityService import AccountabilityService
 from chalicelib.events.test import test_events
 
 
 app = Chalice(app_name="zap")
 
+# Repositories and services are lazy singletons shared through the container,
+# so a request only builds what its route actually uses.
+container = build_container()
+
 
 def initialize_app():
 
+    ################################################################
+    # Load configuration (single batched SSM fetch)
+    ################################################################
+    # Deliberately eager: one batched GetParameters call on cold start is cheaper
+    # than a lazy per-setting fetch on the first request that needs each value,
+    # even though most routes only read a few of them.
+    settings = get_settings()
+    env = settings.env
+
+    if settings.auth_secret:
+        auth_secret.prime(settings.auth_secret)
+
     ################################################################
     # Configure and initialize sentry
     ################################################################
-    env = os.environ.get("ENV", "local")
 
     if env != "local":  # only init for staging/prod
         sentry_sdk.init(
-            dsn=boto3.client("ssm").get_parameter(
-                Name="/Zap/sentry/dsn", WithDecryption=True
-            )["Parameter"]["Value"],
+            dsn=settings.sentry_dsn,
             integrations=[ChaliceIntegration()],
             # Set traces_sample_rate to 1.0 to capture 100%
             # of transactions for performance monitoring.
@@ -67,57 +76,27 @@ def initialize_app():
     #  Dependency injection (services injected into api)
     ################################################################
 
-    listing_service = ListingService(
-        listings_repo=RepositoryFactory.listings(),
-        applications_repo=RepositoryFactory.applications(),
-        event_timeframes_rush_repo=RepositoryFactory.event_timeframes_rush(),
-    )
-
-    insights_service = InsightsService(
-        applications_repo=RepositoryFactory.applications()
-    )
-
-    member_service = MemberService(
-        users_repo=RepositoryFactory.users(),
-        user_roles_repo=RepositoryFactory.user_roles(),
-        roles_repo=RepositoryFactory.roles(),
-    )
-
-    events_member_service = EventsMemberService(
-        events_member_repo=RepositoryFactory.events_member(),
-        event_timeframes_member_repo=RepositoryFactory.event_timeframes_member(),
-        events_member_attendees_repo=RepositoryFactory.events_member_attendees(),
-        event_tags_repo=RepositoryFactory.event_tags(),
-        tags_repo=RepositoryFactory.tags(),
-        users_repo=RepositoryFactory.users(),
-    )
-
-    events_rush_service = EventsRushService(
-        event_timeframes_rush_repo=RepositoryFactory.event_timeframes_rush(),
-        events_rush_repo=RepositoryFactory.events_rush(),
-        events_rush_attendees_repo=RepositoryFactory.events_rush_attendees(),
-        rushees_repo=RepositoryFactory.rushees(),
-    )
-
-    applicant_service = ApplicantService(
-        listings_repo=RepositoryFactory.listings(),
-        applications_repo=RepositoryFactory.applications(),
-        event_timeframes_rush_repo=RepositoryFactory.event_timeframes_rush(),
-        events_rush_service=events_rush_service,
-    )
-
-    accountability_service = AccountabilityService()
+    # Provisioned-concurrency init runs before any request arrives, so build everything up front
+    # (a scheduled handler could not do this: it runs in its own Lambda function, not the API's)
+    if os.environ.get("AWS_LAMBDA_INITIALIZATION_TYPE") == "provisioned-concurrency":
+        container.warm()
 
     ################################################################
     # Register routes
     ################################################################
 
-    listings.register_routes(listing_service=listing_service)
-    applicants.register_routes(applicant_service=applicant_service)
-    insights.register_routes(insights_service=insights_service)
-    members.register_routes(member_service=member_service)
-    events_member.register_routes(events_member_service=events_member_service)
-    events_rush.register_routes(events_rush_service=events_rush_service)
+    listings.register_routes(listing_service=container.provider("listing_service"))
+    applicants.register_routes(
+        applicant_service=container.provider("applicant_service")
+    )
+    insights.register_routes(insights_service=container.provider("insights_service"))
+    members.register_routes(member_service=container.provider("member_service"))
+    events_member.register_routes(
+        events_member_service=container.provider("events_member_service")
+    )
+    events_rush.register_routes(
+        events_rush_service=container.provider("events_rush_service")
+    )
 
     ################################################################
     # Register blueprints
@@ -144,6 +123,17 @@ if os.environ.get("CHALICE_TESTING") != "1":
     initialize_app()
 
 
+@app.middleware("http")
+def scope_request(event, get_response):
+    # Rows loaded through repositories are shared for the duration of one request only
+    with request_scope() as scope:
+        try:
+            return get_response(event)
+        finally:
+            # `path` is the route pattern (e.g. /listings/{id}), so budgets apply per route
+            report_query_trace(event.path, scope.queries)
+
+
 @app.route("/")
 def index():
     return {"hello": "world"}
@@ -171,3 +161,4 @@ def supabase_ping(event):
     except Exception as e:
         print("Supabase ping failed:", e)
         return {"ok": False, "error": str(e)}
+
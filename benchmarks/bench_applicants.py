@@ -0,0 +1,64 @@
+from benchmarks.bench_events_rush import events_rush_service
+from tests.fakes.reference import applicants_from_listing_in_python
+from chalicelib.repositories.repository_factory import RepositoryFactory
+from chalicelib.services.ApplicantService import ApplicantService
+from chalicelib.utils.utils import hash_value
+
+
+def applicant_service(supabase) -> ApplicantService:
+    return ApplicantService(
+        applications_repo=RepositoryFactory.applications(client=supabase),
+        listings_repo=RepositoryFactory.listings(client=supabase),
+        events_rush_service=events_rush_service(supabase),
+    )
+
+
+def test_get_all_from_listing(benchmark, dataset, supabase, round_trips):
+    service = applicant_service(supabase)
+    listing_id = dataset.listing_ids[0]
+
+    round_trips(service.get_all_from_listing, listing_id)
+    applications = benchmark(service.get_all_from_listing, listing_id)
+
+    assert len(applications) == dataset.scale.applications_per_listing
+    assert any("threshold" in application for application in applications)
+
+
+def test_get_all_from_listing_cold_cache(benchmark, dataset, supabase):
+    """The listing is not cached yet: its lookup overlaps the applicants query."""
+    service = applicant_service(supabase)
+    listing_id = dataset.listing_ids[0]
+    service.get_all_from_listing(listing_id)  # builds the rushee attendance
+
+    applications = benchmark.pedantic(
+        service.get_all_from_listing,
+        args=(listing_id,),
+        setup=service.listings_repo.invalidate,
+        rounds=10,
+    )
+
+    assert len(applications) == dataset.scale.applications_per_listing
+
+
+def test_get_all_from_listing_python_join(benchmark, dataset, supabase, round_trips):
+    service = applicant_service(supabase)
+    args = (
+        service.listings_repo,
+        service.applications_repo,
+        RepositoryFactory.event_timeframes_rush(client=supabase),
+        service.events_rush_service,
+        dataset.listing_ids[0],
+    )
+
+    round_trips(applicants_from_listing_in_python, *args)
+    applications = benchmark(applicants_from_listing_in_python, *args)
+
+    assert len(applications) == dataset.scale.applications_per_listing
+
+
+def test_hash_value(benchmark, dataset):
+    applications = dataset.applications_for(dataset.listing_ids[0])
+
+    hashed = benchmark(hash_value, applications)
+
+    assert len(hashed) == len(applications)
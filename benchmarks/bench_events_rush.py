@@ -0,0 +1,52 @@
+import pytest
+
+from tests.fakes.reference import rush_analytics_linear_scan
+from tests.fakes.synthetic import Scale, SyntheticDataset
+from chalicelib.repositories.repository_factory import RepositoryFactory
+from chalicelib.services.EventsRushService import EventsRushService, build_rush_analytics
+from tests.fakes import FakeSupabaseClient
+
+
+def events_rush_service(supabase) -> EventsRushService:
+    return EventsRushService(
+        event_timeframes_rush_repo=RepositoryFactory.event_timeframes_rush(client=supabase),
+        events_rush_repo=RepositoryFactory.events_rush(client=supabase),
+        events_rush_attendees_repo=RepositoryFactory.events_rush_attendees(client=supabase),
+        rushees_repo=RepositoryFactory.rushees(client=supabase),
+        rushee_attendance_repo=RepositoryFactory.rushee_attendance(client=supabase),
+    )
+
+
+def test_get_rush_timeframe_analytics(benchmark, dataset, supabase, round_trips):
+    service = events_rush_service(supabase)
+    timeframe_id = dataset.timeframe_ids[0]
+
+    round_trips(service.get_rush_timeframe_analytics, timeframe_id)
+    analytics = benchmark(service.get_rush_timeframe_analytics, timeframe_id)
+
+    assert len(analytics["events"]) == dataset.scale.events_per_timeframe
+    assert analytics["rushees"]
+
+
+@pytest.fixture(scope="module", params=[1_000, 10_000], ids=["1k", "10k"])
+def rush_events(request):
+    """One timeframe's events with their embedded rushees (realistic and 10x rush cycle)."""
+    dataset = SyntheticDataset(Scale(listings=1, applications_per_listing=0, rushees=request.param))
+    service = events_rush_service(dataset.load_into(FakeSupabaseClient()))
+    events = service.events_rush_repo.get_with_custom_select(
+        filters={"timeframe_id": dataset.timeframe_ids[0]}, select_query="*, rushees(*)"
+    )
+    events.sort(key=lambda e: e.get("date", ""))
+    return events
+
+
+@pytest.mark.parametrize(
+    "analytics", [rush_analytics_linear_scan, build_rush_analytics], ids=["linear_scan", "bitmask"]
+)
+def test_rush_analytics(benchmark, rush_events, analytics):
+    rushee_count = len({rushee["id"] for event in rush_events for rushee in event["rushees"]})
+    benchmark.group = f"rush_analytics[{rushee_count}]"
+
+    rushees, events = benchmark.pedantic(analytics, args=(rush_events,), rounds=3)
+
+    assert len(rushees) == rushee_count
@@ -0,0 +1,101 @@
+import json
+
+import pytest
+
+from tests.fakes.reference import pie_chart_insights_linear_scan
+from tests.fakes.synthetic import Scale, SyntheticDataset
+from chalicelib.repositories.repository_factory import RepositoryFactory
+from chalicelib.services.InsightsService import MAX_COMPARED_LISTINGS, InsightsService
+from chalicelib.utils.insight_stats import numeric_stats
+
+
+def insights_service(supabase) -> InsightsService:
+    return InsightsService(
+        applications_repo=RepositoryFactory.applications(client=supabase),
+        listing_insights_repo=RepositoryFactory.listing_insights(client=supabase),
+        listings_repo=RepositoryFactory.listings(client=supabase),
+    )
+
+
+def test_get_insights_from_listing(benchmark, dataset, supabase, round_trips):
+    service = insights_service(supabase)
+    listing_id = dataset.listing_ids[0]
+
+    round_trips(service.get_insights_from_listing, listing_id)
+    dashboard, distribution = benchmark(service.get_insights_from_listing, listing_id)
+
+    assert dashboard["applicantCount"] == dataset.scale.applications_per_listing
+    assert sum(bucket["value"] for bucket in distribution["major"]) == dashboard["applicantCount"]
+
+
+@pytest.fixture(scope="module", params=[5_000, 50_000], ids=["5k", "50k"])
+def applicants(request):
+    dataset = SyntheticDataset(Scale(listings=1, applications_per_listing=0, rushees=0), seed=request.param)
+    return [{"id": str(i), **dataset.application("listing")} for i in range(request.param)]
+
+
+@pytest.mark.parametrize(
+    "aggregate",
+    [pie_chart_insights_linear_scan, InsightsService(applications_repo=object(), listing_insights_repo=object(), listings_repo=object())._get_pie_chart_insights],
+    ids=["linear_scan", "dict_keyed"],
+)
+def test_pie_chart_insights(benchmark, applicants, aggregate):
+    benchmark.group = f"pie_chart_insights[{len(applicants)}]"
+
+    distribution = benchmark.pedantic(aggregate, args=(applicants,), rounds=3)
+
+    assert sum(bucket["value"] for bucket in distribution["major"]) == len(applicants)
+
+
+def test_numeric_stats(benchmark, applicants):
+    benchmark.group = f"numeric_stats[{len(applicants)}]"
+
+    stats = benchmark(numeric_stats, applicants)
+
+    assert stats["gradYear"]["count"] == len(applicants)
+
+
+@pytest.mark.parametrize("response_format", ["full", "compact", "summary"])
+def test_insights_payload(benchmark, dataset, supabase, response_format):
+    service = insights_service(supabase)
+    listing_id = dataset.listing_ids[0]
+
+    def serialize():
+        return json.dumps(service.get_insights_from_listing(listing_id, response_format))
+
+    payload = benchmark(serialize)
+
+    benchmark.extra_info["payload_bytes"] = len(payload)
+
+
+def test_get_listing_dashboard(benchmark, dataset, supabase, round_trips):
+    service = insights_service(supabase)
+    listing_id = dataset.listing_ids[0]
+    service.rebuild_listing_aggregates(listing_id)
+
+    round_trips(service.get_listing_dashboard, listing_id)
+    dashboard = benchmark(service.get_listing_dashboard, listing_id)
+
+    assert dashboard["applicantCount"] == dataset.scale.applications_per_listing
+
+
+def test_compare_listings(benchmark, dataset, supabase, round_trips):
+    service = insights_service(supabase)
+    listing_ids = dataset.listing_ids[:MAX_COMPARED_LISTINGS]
+
+    round_trips(service.compare_listings, listing_ids)
+    comparison = benchmark(service.compare_listings, listing_ids)
+
+    assert comparison["dashboard"]["applicantCount"] == [dataset.scale.applications_per_listing] * len(listing_ids)
+
+
+def test_compare_listings_one_call_per_listing(benchmark, dataset, supabase, round_trips):
+    """Baseline of `test_compare_listings`: what the frontend did before `/insights/compare`."""
+    service = insights_service(supabase)
+    listing_ids = dataset.listing_ids[:MAX_COMPARED_LISTINGS]
+
+    def per_listing():
+        return [service.get_insights_from_listing(listing_id) for listing_id in listing_ids]
+
+    round_trips(per_listing)
+    benchmark(per_listing)
@@ -0,0 +1,38 @@
+from unittest.mock import patch
+
+import pytest
+
+from chalicelib.repositories.repository_factory import RepositoryFactory
+from chalicelib.services.ListingService import ListingService
+
+# smallest valid payloads: the upload itself is mocked out
+PNG = "data:image/png;base64,iVBORw0KGgo="
+PDF = "data:application/pdf;base64,JVBERi0xLjQK"
+
+
+@pytest.fixture
+def listing_service(supabase):
+    with patch("chalicelib.services.ListingService.s3") as mock_s3, patch(
+        "chalicelib.services.ListingService.ses"
+    ):
+        mock_s3.upload_binary_data.side_effect = lambda path, data: f"https://bucket.s3.amazonaws.com/{path}"
+        yield ListingService(
+            listings_repo=RepositoryFactory.listings(client=supabase),
+            applications_repo=RepositoryFactory.applications(client=supabase),
+            event_timeframes_rush_repo=RepositoryFactory.event_timeframes_rush(client=supabase),
+            listing_insights_repo=RepositoryFactory.listing_insights(client=supabase),
+        )
+
+
+def test_apply(benchmark, dataset, listing_service, round_trips):
+    listing_id = dataset.listing_ids[0]
+
+    def apply():
+        application = dataset.application(listing_id)
+        application.update(resume=PDF, image=PNG)
+        return listing_service.apply(application)
+
+    round_trips(apply)
+    result = benchmark(apply)
+
+    assert result["msg"] is True
@@ -0,0 +1,44 @@
+import pytest
+
+from tests.fakes.synthetic import Scale, SyntheticDataset
+from tests.fakes import FakeSupabaseClient
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--fake-latency-ms",
+        type=float,
+        default=0.0,
+        help="Simulated round-trip latency of the fake Supabase client (default: 0).",
+    )
+
+
+@pytest.fixture(scope="session")
+def dataset() -> SyntheticDataset:
+    return SyntheticDataset(Scale())
+
+
+@pytest.fixture
+def supabase(request, dataset) -> FakeSupabaseClient:
+    client = FakeSupabaseClient(
+        latency_seconds=request.config.getoption("--fake-latency-ms") / 1000
+    )
+    return dataset.load_into(client)
+
+
+@pytest.fixture
+def round_trips(benchmark, supabase):
+    """
+    Calls `func` once outside the timed rounds and records how many round trips it
+    made (and to which tables) in the benchmark report.
+    """
+
+    def count(func, *args, **kwargs):
+        supabase.reset_stats()
+        func(*args, **kwargs)
+        stats = supabase.stats()
+        benchmark.extra_info["round_trips"] = stats["round_trips"]
+        benchmark.extra_info["calls"] = stats["by_call"]
+        return stats["round_trips"]
+
+    return count
@@ -3,6 +3,7 @@ from chalicelib.services.ApplicantService import ApplicantService
 from chalicelib.handlers.error_handler import handle_exceptions
 from chalicelib.decorators import auth
 from chalicelib.models.roles import Roles
+from chalicelib.utils.pagination import get_page_params
 
 
 applicants_api = Blueprint(__name__)
@@ -21,7 +22,8 @@ def register_routes(applicant_service: ApplicantService):
     @auth(applicants_api, roles=[Roles.ADMIN, Roles.MEMBER])
     @handle_exceptions
     def get_applicants():
-        return applicant_service.get_all()
+        limit, cursor = get_page_params(applicants_api.current_request.query_params)
+        return applicant_service.get_all(limit=limit, cursor=cursor)
 
     @applicants_api.route("/applicants/{listing_id}", methods=["GET"], cors=True)
     @auth(applicants_api, roles=[Roles.ADMIN, Roles.MEMBER])
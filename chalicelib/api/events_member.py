@@ -3,6 +3,7 @@ from chalicelib.decorators import auth
 from chalicelib.services.EventsMemberService import EventsMemberService
 from chalicelib.handlers.error_handler import handle_exceptions
 from chalicelib.models.roles import Roles
+from chalicelib.utils.pagination import get_page_params
 
 events_member_api = Blueprint(__name__)
 
@@ -20,7 +21,10 @@ def register_routes(events_member_service: EventsMemberService):
     @auth(events_member_api, roles=[Roles.ADMIN, Roles.MEMBER])
     @handle_exceptions
     def get_all_timeframes():
-        return events_member_service.get_all_timeframes_and_events()
+        limit, cursor = get_page_params(events_member_api.current_request.query_params)
+        return events_member_service.get_all_timeframes_and_events(
+            limit=limit, cursor=cursor
+        )
 
     @events_member_api.route("/timeframes/{timeframe_id}", methods=["GET"], cors=True)
     @auth(events_member_api, roles=[Roles.ADMIN, Roles.MEMBER])
@@ -3,6 +3,7 @@ from chalicelib.decorators import auth
 from chalicelib.handlers.error_handler import handle_exceptions
 from chalicelib.services.EventsRushService import EventsRushService
 from chalicelib.models.roles import Roles
+from chalicelib.utils.pagination import get_page_params
 
 
 events_rush_api = Blueprint(__name__)
@@ -17,7 +18,10 @@ def register_routes(events_rush_service: EventsRushService):
     @auth(events_rush_api, roles=[Roles.ADMIN, Roles.MEMBER])
     @handle_exceptions
     def get_rush_events():
-        return events_rush_service.get_rush_categories_and_events()
+        limit, cursor = get_page_params(events_rush_api.current_request.query_params)
+        return events_rush_service.get_rush_categories_and_events(
+            limit=limit, cursor=cursor
+        )
 
     @events_rush_api.route("/events/rush/{event_id}", methods=["GET"], cors=True)
     @handle_exceptions
@@ -94,3 +98,32 @@ def register_routes(events_rush_service: EventsRushService):
         return events_rush_service.get_rush_timeframe_analytics(
             timeframe_id=timeframe_id
         )
+
+    @events_rush_api.route(
+        "/events/rush/timeframe/{timeframe_id}/threshold", methods=["PUT"], cors=True
+    )
+    @auth(events_rush_api, roles=[Roles.ADMIN])
+    @handle_exceptions
+    def update_threshold_rules(timeframe_id):
+        """Set the threshold rules of <timeframe_id> (`null` restores the defaults)"""
+        rules = events_rush_api.current_request.json_body
+        return events_rush_service.update_threshold_rules(timeframe_id, rules)
+
+    @events_rush_api.route(
+        "/events/rush/timeframe/{timeframe_id}/threshold/preview", methods=["POST"], cors=True
+    )
+    @auth(events_rush_api, roles=[Roles.ADMIN])
+    @handle_exceptions
+    def preview_threshold_rules(timeframe_id):
+        """Count the rushees of <timeframe_id> who would meet the posted threshold rules"""
+        rules = events_rush_api.current_request.json_body
+        return events_rush_service.preview_threshold_rules(timeframe_id, rules)
+
+    @events_rush_api.route(
+        "/events/rush/timeframe/{timeframe_id}/attendance/rebuild", methods=["POST"], cors=True
+    )
+    @auth(events_rush_api, roles=[Roles.ADMIN])
+    @handle_exceptions
+    def rebuild_rushee_attendance(timeframe_id):
+        """Recompute the rushee attendance rows of <timeframe_id> from its check-ins"""
+        return events_rush_service.rebuild_rushee_attendance(timeframe_id)
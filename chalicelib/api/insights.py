@@ -13,5 +13,38 @@ def register_routes(insights_service: InsightsService):
     @insights_api.route("/insights/listing/{listing_id}", methods=["GET"], cors=True)
     @auth(insights_api, roles=[Roles.ADMIN, Roles.MEMBER])
     def get_listing_insights(listing_id):
-        """Get insights from <listing_id>"""
-        return insights_service.get_insights_from_listing(listing_id)
+        """Get insights from <listing_id> (`?format=compact` for id-referenced buckets, `?format=summary` for counts only)"""
+        query_params = insights_api.current_request.query_params or {}
+        return insights_service.get_insights_from_listing(
+            listing_id, response_format=query_params.get("format", "full")
+        )
+
+    @insights_api.route("/insights/compare", methods=["GET"], cors=True)
+    @auth(insights_api, roles=[Roles.ADMIN, Roles.MEMBER])
+    def compare_listings():
+        """Get the insights of `?listing_ids=<id>,<id>,...` as series aligned by listing"""
+        query_params = insights_api.current_request.query_params or {}
+        listing_ids = [
+            listing_id.strip()
+            for listing_id in query_params.get("listing_ids", "").split(",")
+            if listing_id.strip()
+        ]
+        return insights_service.compare_listings(listing_ids)
+
+    @insights_api.route("/insights/listing/{listing_id}/dashboard", methods=["GET"], cors=True)
+    @auth(insights_api, roles=[Roles.ADMIN, Roles.MEMBER])
+    def get_listing_dashboard(listing_id):
+        """Get the dashboard block of <listing_id> from its maintained aggregates"""
+        return insights_service.get_listing_dashboard(listing_id)
+
+    @insights_api.route("/insights/listing/{listing_id}/stats", methods=["GET"], cors=True)
+    @auth(insights_api, roles=[Roles.ADMIN, Roles.MEMBER])
+    def get_listing_stats(listing_id):
+        """Get the GPA and grad-year distributions of <listing_id>"""
+        return insights_service.get_listing_stats(listing_id)
+
+    @insights_api.route("/insights/listing/{listing_id}/rebuild", methods=["POST"], cors=True)
+    @auth(insights_api, roles=[Roles.ADMIN])
+    def rebuild_listing_aggregates(listing_id):
+        """Recompute the aggregates of <listing_id> from its applications"""
+        return insights_service.rebuild_listing_aggregates(listing_id)
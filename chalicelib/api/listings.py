@@ -4,6 +4,7 @@ from chalicelib.repositories.repository_factory import RepositoryFactory
 from chalicelib.handlers.error_handler import handle_exceptions
 from chalicelib.decorators import auth
 from chalicelib.models.roles import Roles
+from chalicelib.utils.pagination import get_page_params
 
 
 listings_api = Blueprint(__name__)
@@ -38,7 +39,8 @@ def register_routes(listing_service: ListingService):
     @handle_exceptions
     def get_all_listings():
         """Gets all listings available"""
-        return listing_service.get_all()
+        limit, cursor = get_page_params(listings_api.current_request.query_params)
+        return listing_service.get_all(limit=limit, cursor=cursor)
 
 
     @listings_api.route("/listings/{id}", methods=["DELETE"], cors=True)
@@ -3,6 +3,7 @@ from chalicelib.services.MemberService import MemberService
 from chalicelib.handlers.error_handler import handle_exceptions
 from chalicelib.decorators import auth
 from chalicelib.models.roles import Roles
+from chalicelib.utils.pagination import get_page_params
 
 members_api = Blueprint(__name__)
 
@@ -21,15 +22,15 @@ def register_routes(member_service: MemberService):
     @handle_exceptions
     def update_member(user_id):
         data = members_api.current_request.json_body
-        headers = members_api.current_request.headers
-        return member_service.update(user_id=user_id, data=data, headers=headers)
+        return member_service.update(user_id=user_id, data=data)
 
     @members_api.route("/members", methods=["GET"], cors=True)
     @auth(members_api, roles=[Roles.ADMIN, Roles.MEMBER])
     @handle_exceptions
     def get_all_members():
         """Fetches all members who have access to WhyPhi."""
-        return member_service.get_all()
+        limit, cursor = get_page_params(members_api.current_request.query_params)
+        return member_service.get_all(limit=limit, cursor=cursor)
 
     @members_api.route("/members/onboard/{user_id}", methods=["POST"], cors=True)
     @auth(members_api, roles=[])
@@ -0,0 +1,153 @@
+import os
+import math
+import time
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+from dotenv import load_dotenv
+from chalicelib.modules.aws_ssm import aws_ssm, GET_PARAMETERS_MAX_NAMES
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Settings:
+    """
+    Immutable snapshot of every SSM-backed setting used by Zap.
+
+    All values are fetched together on cold start (see `load_settings`) so that
+    modules read them from memory instead of issuing their own SSM calls. Secret
+    fields are left out of `repr` so logging the settings never leaks them.
+    """
+
+    env: str
+    auth_secret: Optional[str] = field(default=None, repr=False)
+    sentry_dsn: Optional[str] = None
+    supabase_url: Optional[str] = None
+    supabase_key: Optional[str] = field(default=None, repr=False)
+    google_service_account_credentials: Optional[str] = field(default=None, repr=False)
+    posthog_api_key: Optional[str] = field(default=None, repr=False)
+    posthog_project_id: Optional[str] = None
+    mongo_admin_user: Optional[str] = None
+    mongo_admin_password: Optional[str] = field(default=None, repr=False)
+
+    # cold-start bookkeeping
+    load_seconds: float = 0.0
+    ssm_round_trips: int = 0
+    missing_parameters: Tuple[str, ...] = ()
+
+
+def get_parameter_names(env: str) -> Dict[str, str]:
+    """
+    Maps each `Settings` field to the SSM parameter that backs it in `env`.
+
+    Args:
+        env (str): The running environment (local, staging, prod, ...).
+
+    Returns:
+        Dict[str, str]: Settings field name -> SSM parameter name.
+    """
+    names = {
+        "auth_secret": "/Zap/AUTH_SECRET",
+        "google_service_account_credentials": "/Zap/GOOGLE_SERVICE_ACCOUNT_CREDENTIALS",
+        "mongo_admin_user": "/Zap/MONGO_ADMIN_USER",
+        "mongo_admin_password": "/Zap/MONGO_ADMIN_PASSWORD",
+        "posthog_api_key": "/Vault/POSTHOG_API_KEY",
+        "posthog_project_id": "/Vault/POSTHOG_PROJECT_ID",
+    }
+
+    # sentry is only initialized for deployed stages
+    if env != "local":
+        names["sentry_dsn"] = "/Zap/sentry/dsn"
+
+    if env in ["staging", "prod"]:
+        names["supabase_url"] = f"/Zap/{env}/SUPABASE_URL"
+        names["supabase_key"] = f"/Zap/{env}/SUPABASE_KEY"
+
+    return names
+
+
+def load_settings() -> Settings:
+    """
+    Loads every setting with batched GetParameters calls (one call for up to
+    ten parameters) and reports how long the cold-start fetch took.
+
+    Returns:
+        Settings: The loaded settings. Parameters that are missing or could not be
+        fetched are left as None and listed in `missing_parameters`.
+    """
+    env = os.environ.get("ENV", "local")
+    names = get_parameter_names(env)
+    ssm_names = list(names.values())
+
+    start = time.perf_counter()
+    try:
+        fetched = aws_ssm.get_parameter_values(ssm_names)
+    except Exception as e:
+        logger.error(f"[config.load_settings] Failed to fetch SSM parameters: {str(e)}")
+        fetched = {}
+    load_seconds = time.perf_counter() - start
+
+    values = {field: fetched.get(name) for field, name in names.items()}
+
+    # local development reads Supabase credentials from `.env.local`
+    if env not in ["staging", "prod"]:
+        load_dotenv(".env.local")
+        values["supabase_url"] = os.getenv("SUPABASE_URL")
+        values["supabase_key"] = os.getenv("SUPABASE_KEY")
+
+    missing = tuple(name for name in ssm_names if name not in fetched)
+    settings = Settings(
+        env=env,
+        load_seconds=load_seconds,
+        ssm_round_trips=math.ceil(len(ssm_names) / GET_PARAMETERS_MAX_NAMES),
+        missing_parameters=missing,
+        **values,
+    )
+
+    logger.info(
+        f"[config.load_settings] Loaded {len(ssm_names) - len(missing)}/{len(ssm_names)} "
+        f"parameters in {load_seconds * 1000:.1f} ms "
+        f"({settings.ssm_round_trips} SSM round trip(s)). ENV: {env}"
+    )
+    if missing:
+        logger.warning(f"[config.load_settings] Missing parameters: {list(missing)}")
+
+    return settings
+
+
+_settings: Optional[Settings] = None
+_settings_lock = threading.Lock()
+
+
+def get_settings() -> Settings:
+    """
+    Returns the process-wide settings, loading them on first use. Settings with
+    `missing_parameters` (e.g. SSM was unreachable) are not cached, so the next
+    call fetches them again.
+
+    Returns:
+        Settings: Cached settings instance.
+    """
+    global _settings
+    if _settings is None:
+        with _settings_lock:
+            if _settings is None:
+                settings = load_settings()
+                if settings.missing_parameters:
+                    return settings
+                _settings = settings
+    return _settings
+
+
+def set_settings(settings: Settings):
+    """Injects a pre-built settings instance (for testing)."""
+    global _settings
+    _settings = settings
+
+
+def reset_settings():
+    """Clears the cached settings (for teardown or reinitialization)."""
+    global _settings
+    _settings = None
@@ -0,0 +1,216 @@
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from chalicelib.utils.lazy import LazyProvider
+from chalicelib.repositories.repository_factory import RepositoryFactory
+from chalicelib.services.ListingService import ListingService
+from chalicelib.services.ApplicantService import ApplicantService
+from chalicelib.services.MemberService import MemberService
+from chalicelib.services.EventsMemberService import EventsMemberService
+from chalicelib.services.EventsRushService import EventsRushService
+from chalicelib.services.InsightsService import InsightsService
+
+logger = logging.getLogger(__name__)
+
+
+class Container:
+    """
+    Minimal dependency-injection container of lazy singletons.
+
+    Each registered name maps to a factory and the names of the providers it
+    depends on. Nothing is built until it is resolved, and every provider is
+    built at most once, so dependents share the same instance.
+    """
+
+    def __init__(self):
+        self._factories: Dict[str, Callable[..., Any]] = {}
+        self._dependencies: Dict[str, Dict[str, str]] = {}
+        self._providers: Dict[str, LazyProvider] = {}
+        # names being built by the current thread (for circular dependency detection)
+        self._local = threading.local()
+
+    def register(
+        self,
+        name: str,
+        factory: Callable[..., Any],
+        dependencies: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Registers a lazy singleton. Re-registering a name before its first use swaps
+        the factory in place, so proxies already handed out see the new factory.
+
+        Args:
+            name (str): Name of the provider.
+            factory (Callable): Called once to build the instance.
+            dependencies (dict, optional): Factory keyword argument -> name of the
+                provider whose instance is passed for it.
+        """
+        if name in self._providers and self._providers[name]._lazy_initialized:
+            raise ValueError(f"Provider '{name}' is already initialized.")
+
+        self._factories[name] = factory
+        self._dependencies[name] = dict(dependencies or {})
+        if name not in self._providers:
+            self._providers[name] = LazyProvider(
+                lambda: self._build(name), name=name
+            )
+
+    def override(self, name: str, factory: Callable[..., Any]):
+        """
+        Swaps the factory of an existing provider (e.g. for a cached or instrumented
+        repository), keeping its dependencies. Must be called before first use.
+        """
+        if name not in self._factories:
+            raise KeyError(f"Unknown provider '{name}'.")
+        self.register(name, factory, self._dependencies[name])
+
+    def resolve(self, name: str) -> Any:
+        """Returns the instance for `name`, building it (and its dependencies) if needed."""
+        if name not in self._providers:
+            raise KeyError(f"Unknown provider '{name}'.")
+        return self._providers[name]._lazy_get()
+
+    def provider(self, name: str) -> LazyProvider:
+        """Returns the lazy proxy for `name` without building it."""
+        if name not in self._providers:
+            raise KeyError(f"Unknown provider '{name}'.")
+        return self._providers[name]
+
+    def graph(self) -> Dict[str, List[str]]:
+        """Returns provider name -> names of the providers it depends on."""
+        return {
+            name: list(dependencies.values())
+            for name, dependencies in self._dependencies.items()
+        }
+
+    def warm(self, names: Optional[Iterable[str]] = None) -> Dict[str, float]:
+        """
+        Builds the given providers (all of them by default) ahead of the first request,
+        e.g. during a provisioned-concurrency init.
+
+        Returns:
+            Dict[str, float]: Provider name -> seconds spent building it (0 if it was
+            already built before this call).
+        """
+        timings = {}
+        for name in names if names is not None else list(self._providers):
+            provider = self._providers[name]
+            was_initialized = provider._lazy_initialized
+            provider._lazy_get()
+            timings[name] = 0.0 if was_initialized else provider._lazy_init_seconds
+
+        logger.info(f"[Container.warm] Warmed {len(timings)} providers.")
+        return timings
+
+    def _build(self, name: str) -> Any:
+        resolving = self._resolving_stack()
+        if name in resolving:
+            cycle = " -> ".join(resolving + [name])
+            raise RuntimeError(f"Circular dependency detected: {cycle}")
+
+        resolving.append(name)
+        try:
+            kwargs = {
+                param: self.resolve(dependency)
+                for param, dependency in self._dependencies[name].items()
+            }
+            return self._factories[name](**kwargs)
+        finally:
+            resolving.pop()
+
+    def _resolving_stack(self) -> List[str]:
+        if not hasattr(self._local, "resolving"):
+            self._local.resolving = []
+        return self._local.resolving
+
+
+# Provider name -> RepositoryFactory method
+REPOSITORIES = {
+    "listings_repo": RepositoryFactory.listings,
+    "applications_repo": RepositoryFactory.applications,
+    "listing_insights_repo": RepositoryFactory.listing_insights,
+    "users_repo": RepositoryFactory.users,
+    "user_roles_repo": RepositoryFactory.user_roles,
+    "roles_repo": RepositoryFactory.roles,
+    "events_member_repo": RepositoryFactory.events_member,
+    "event_timeframes_member_repo": RepositoryFactory.event_timeframes_member,
+    "events_member_attendees_repo": RepositoryFactory.events_member_attendees,
+    "event_tags_repo": RepositoryFactory.event_tags,
+    "tags_repo": RepositoryFactory.tags,
+    "rushees_repo": RepositoryFactory.rushees,
+    "event_timeframes_rush_repo": RepositoryFactory.event_timeframes_rush,
+    "events_rush_repo": RepositoryFactory.events_rush,
+    "events_rush_attendees_repo": RepositoryFactory.events_rush_attendees,
+    "rushee_attendance_repo": RepositoryFactory.rushee_attendance,
+}
+
+
+def build_container() -> Container:
+    """Registers every repository and service used by the API."""
+    container = Container()
+
+    for name, factory in REPOSITORIES.items():
+        container.register(name, factory)
+
+    container.register(
+        "listing_service",
+        ListingService,
+        {
+            "listings_repo": "listings_repo",
+            "applications_repo": "applications_repo",
+            "event_timeframes_rush_repo": "event_timeframes_rush_repo",
+            "listing_insights_repo": "listing_insights_repo",
+        },
+    )
+    container.register(
+        "insights_service",
+        InsightsService,
+        {
+            "applications_repo": "applications_repo",
+            "listing_insights_repo": "listing_insights_repo",
+            "listings_repo": "listings_repo",
+        },
+    )
+    container.register(
+        "member_service",
+        MemberService,
+        {
+            "users_repo": "users_repo",
+            "user_roles_repo": "user_roles_repo",
+            "roles_repo": "roles_repo",
+        },
+    )
+    container.register(
+        "events_member_service",
+        EventsMemberService,
+        {
+            "events_member_repo": "events_member_repo",
+            "event_timeframes_member_repo": "event_timeframes_member_repo",
+            "events_member_attendees_repo": "events_member_attendees_repo",
+            "event_tags_repo": "event_tags_repo",
+            "tags_repo": "tags_repo",
+            "users_repo": "users_repo",
+        },
+    )
+    container.register(
+        "events_rush_service",
+        EventsRushService,
+        {
+            "event_timeframes_rush_repo": "event_timeframes_rush_repo",
+            "events_rush_repo": "events_rush_repo",
+            "events_rush_attendees_repo": "events_rush_attendees_repo",
+            "rushees_repo": "rushees_repo",
+            "rushee_attendance_repo": "rushee_attendance_repo",
+        },
+    )
+    container.register(
+        "applicant_service",
+        ApplicantService,
+        {
+            "listings_repo": "listings_repo",
+            "applications_repo": "applications_repo",
+            "events_rush_service": "events_rush_service",
+        },
+    )
+
+    return container
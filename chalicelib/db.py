@@ -4,6 +4,7 @@ from botocore import errorfactory
 from chalicelib.models.listing import Listing
 from boto3.dynamodb.conditions import Key
 from typing import Optional, Union
+from chalicelib.utils.lazy import LazyProvider
 
 
 class DBResource:
@@ -179,4 +180,4 @@ class DBResource:
         return listing_item["Item"]
 
 
-db = DBResource()
+db = LazyProvider(DBResource, name="db")
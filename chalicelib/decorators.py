@@ -1,9 +1,14 @@
-import boto3
 import jwt
 import logging
 
 from chalice.app import UnauthorizedError
-from chalicelib.models.roles import Roles
+from chalicelib.modules.secret_provider import auth_secret
+from chalicelib.modules.token_cache import VerifiedToken, verified_tokens
+from chalicelib.request_context import (
+    Principal,
+    reset_current_principal,
+    set_current_principal,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -33,10 +38,63 @@ def add_env_suffix(func):
     return wrapper
 
 
+def decode_token(token: str) -> dict:
+    """
+    Verifies a JWT against the cached auth secret and returns its claims.
+
+    Every secret accepted by `auth_secret` (the current one and, during a rotation,
+    the previous one) is tried in turn. If all of them reject the signature, the
+    secret is re-fetched once in case it was rotated before the cache expired.
+
+    Args:
+        token (str): The encoded JWT.
+
+    Returns:
+        dict: The decoded token claims.
+
+    Raises:
+        jwt.InvalidTokenError: If the token is invalid or has expired.
+    """
+    signature_error = None
+    for secret in auth_secret.get_candidates():
+        try:
+            return jwt.decode(token, secret, algorithms=["HS256"])
+        except jwt.InvalidSignatureError as e:
+            signature_error = e
+
+    if auth_secret.refresh_on_rejection():
+        return jwt.decode(token, auth_secret.get(), algorithms=["HS256"])
+
+    raise signature_error
+
+
+def verify_token(token: str) -> VerifiedToken:
+    """
+    Returns the verified claims of a JWT, serving repeat tokens from `verified_tokens`
+    instead of running the HMAC check again.
+
+    Args:
+        token (str): The encoded JWT.
+
+    Returns:
+        VerifiedToken: The claims and precomputed role set of the token.
+
+    Raises:
+        jwt.InvalidTokenError: If the token is invalid or has expired.
+    """
+    verified = verified_tokens.get(token)
+    if verified is None:
+        verified = verified_tokens.put(token, decode_token(token))
+    return verified
+
+
 def auth(blueprint, roles):
     """
     Decorator for authenticating and authorizing access to API routes.
 
+    The verified caller is attached to the request context for the duration of the
+    route, see `chalicelib.request_context.get_current_principal`.
+
     Args:
         blueprint (object): The Chalice Blueprint object, providing access to the current request.
         roles (list[str]): The required role for authorization.
@@ -49,6 +107,8 @@ def auth(blueprint, roles):
         403 Forbidden: If the decoded role is not part of the given role.
     """
 
+    required_roles = frozenset(roles)
+
     def decorator(func):
         def wrapper(*args, **kwargs):
             api_request = blueprint.current_request
@@ -61,21 +121,28 @@ def auth(blueprint, roles):
                 raise UnauthorizedError("Token is missing.")
 
             try:
-                ssm_client = boto3.client("ssm")
-                auth_secret = ssm_client.get_parameter(
-                    Name="/Zap/AUTH_SECRET", WithDecryption=True
-                )["Parameter"]["Value"]
-                decoded = jwt.decode(token, auth_secret, algorithms=["HS256"])
-                user_roles = [Roles(role) for role in decoded.get("roles", [])]
-                if len(roles) > 0 and not any(role in user_roles for role in roles):
+                verified = verify_token(token)
+                if required_roles and not (required_roles & verified.roles):
                     logger.error(
-                        f"User with roles {user_roles} tried to access a resource requiring roles {roles}"
+                        f"User with roles {sorted(role.value for role in verified.roles)} "
+                        f"tried to access a resource requiring roles {roles}"
                     )
                     raise UnauthorizedError(
                         "You do not have permission to access this resource."
                     )
 
-                return func(*args, **kwargs)
+                # handlers and services read the caller through get_current_principal()
+                context_token = set_current_principal(
+                    Principal(
+                        user_id=verified.claims.get("_id"),
+                        roles=verified.roles,
+                        exp=verified.exp,
+                    )
+                )
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    reset_current_principal(context_token)
 
             except jwt.ExpiredSignatureError:
                 logger.error("Token has expired.")
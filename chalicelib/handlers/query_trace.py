@@ -0,0 +1,204 @@
+import inspect
+import json
+import logging
+import os
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from chalicelib.request_context import get_request_scope
+
+logger = logging.getLogger(__name__)
+
+# Queries a route may issue before a warning is logged (override with QUERY_BUDGET)
+DEFAULT_QUERY_BUDGET = int(os.environ.get("QUERY_BUDGET", 20))
+
+# Per-route overrides of DEFAULT_QUERY_BUDGET, keyed by route path
+ROUTE_QUERY_BUDGETS: Dict[str, int] = {
+    "/listings/{id}": 2,
+    "/apply": 5,
+    "/insights/listing/{listing_id}/dashboard": 1,
+    "/events/{event_id}/checkin": 5,
+    "/events/rush/checkin/{event_id}": 5,
+}
+
+# The same query shape repeated more often than this within one request is
+# reported as a likely N+1 pattern (override with REPEATED_QUERY_THRESHOLD)
+REPEATED_QUERY_THRESHOLD = int(os.environ.get("REPEATED_QUERY_THRESHOLD", 5))
+
+# Write payloads are not recorded: they can be large and may hold personal data
+_UNRECORDED_PARAMS = {"self", "data", "rows"}
+
+# Nesting depth of traced repository calls (only the outermost call is recorded)
+_depth: ContextVar[int] = ContextVar("query_trace_depth", default=0)
+
+
+@dataclass
+class QueryRecord:
+    """One repository call made while serving a request."""
+
+    table: str
+    operation: str
+    params: Dict[str, str]
+    select_query: Optional[str]
+    rows: int
+    bytes: int
+    seconds: float
+    failed: bool = False
+
+    @property
+    def shape(self) -> Tuple:
+        """Identifies the query regardless of the filter values it was called with."""
+        return (self.table, self.operation, self.select_query, tuple(sorted(self.params)))
+
+
+def repeated_shapes(
+    records: List[QueryRecord], threshold: int = REPEATED_QUERY_THRESHOLD
+) -> Dict[Tuple, int]:
+    """Returns the query shapes issued more than `threshold` times."""
+    counts = Counter(record.shape for record in records)
+    return {shape: count for shape, count in counts.items() if count > threshold}
+
+
+def trace_query(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Decorator for repository-layer functions (companion to `log_and_reraise`).
+
+    Inside a request scope, records the table, operation, filters, `select_query`,
+    row count, estimated payload size and wall time of the call into the request's query
+    trace (`RequestScope.queries`). Calls made by another traced call are not
+    recorded separately. Outside a request scope the function is called as is.
+
+    Args:
+        func (Callable): The repository function to wrap.
+
+    Returns:
+        Callable: The wrapped function with tracing applied.
+    """
+    signature = inspect.signature(func)
+    operation = func.__name__.lstrip("_")
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        scope = get_request_scope()
+        if scope is None or _depth.get() > 0:
+            return func(self, *args, **kwargs)
+
+        token = _depth.set(1)
+        start = time.perf_counter()
+        result, failed = None, True
+        try:
+            result = func(self, *args, **kwargs)
+            failed = False
+            return result
+        finally:
+            seconds = time.perf_counter() - start
+            _depth.reset(token)
+            bound = signature.bind_partial(self, *args, **kwargs).arguments
+            scope.queries.append(
+                QueryRecord(
+                    table=self.table_name,
+                    operation=operation,
+                    params={
+                        name: _describe(value)
+                        for name, value in bound.items()
+                        if name not in _UNRECORDED_PARAMS and name != "select_query"
+                    },
+                    select_query=bound.get("select_query", "*")
+                    if "select_query" in signature.parameters
+                    else None,
+                    rows=_count_rows(result),
+                    bytes=_payload_bytes(result),
+                    seconds=seconds,
+                    failed=failed,
+                )
+            )
+
+    return wrapper
+
+
+def report_query_trace(route: str, records: List[QueryRecord]) -> List[str]:
+    """
+    Logs a summary of the request's queries and warns when the route exceeds its
+    query budget or repeats a query shape (the N+1 signature).
+
+    Args:
+        route (str): The route path, used to look up its budget.
+        records (List[QueryRecord]): The request's queries.
+
+    Returns:
+        List[str]: The warnings that were logged.
+    """
+    if not records:
+        return []
+
+    logger.info(
+        f"[query_trace] {route}: {len(records)} queries, "
+        f"{sum(record.seconds for record in records) * 1000:.1f} ms, "
+        f"{sum(record.bytes for record in records)} bytes"
+    )
+
+    warnings = []
+    budget = ROUTE_QUERY_BUDGETS.get(route, DEFAULT_QUERY_BUDGET)
+    if len(records) > budget:
+        warnings.append(
+            f"[query_trace] {route} issued {len(records)} queries "
+            f"(budget: {budget})."
+        )
+
+    for (table, operation, select_query, params), count in repeated_shapes(records).items():
+        warnings.append(
+            f"[query_trace] {route} repeated {operation} on '{table}' {count} times "
+            f"(params: {list(params)}, select: {select_query}); possible N+1 query."
+        )
+
+    for warning in warnings:
+        logger.warning(warning)
+    return warnings
+
+
+def _describe(value: Any, max_length: int = 200) -> str:
+    text = repr(value)
+    return text if len(text) <= max_length else text[: max_length - 3] + "..."
+
+
+def _row_list(result: Any) -> Optional[List[Any]]:
+    if isinstance(result, list):
+        return result
+    if isinstance(result, dict):
+        return None
+    if hasattr(result, "items"):  # Page
+        return result.items
+    if hasattr(result, "found"):  # BulkResult
+        return list(result.found.values())
+    return None
+
+
+def _count_rows(result: Any) -> int:
+    if result is None:
+        return 0
+    rows = _row_list(result)
+    return len(rows) if rows is not None else 1
+
+
+def _payload_bytes(result: Any) -> int:
+    """
+    Estimates the JSON size of `result` as its row count times the size of its first
+    row: serializing every row would cost as much as the query (~20 ms for 5k rows).
+    """
+    if result is None:
+        return 0
+    rows = _row_list(result)
+    if rows is None:
+        return _json_size(result)
+    return len(rows) * _json_size(rows[0]) if rows else 0
+
+
+def _json_size(value: Any) -> int:
+    try:
+        return len(json.dumps(getattr(value, "__dict__", value), default=str))
+    except (TypeError, ValueError):
+        return 0
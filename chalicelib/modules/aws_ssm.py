@@ -1,4 +1,9 @@
 import boto3
+from typing import Dict, List
+from chalicelib.utils.lazy import LazyProvider
+
+# AWS caps the number of names accepted by a single GetParameters call
+GET_PARAMETERS_MAX_NAMES = 10
 
 
 class AWS_SSM:
@@ -24,4 +29,29 @@ class AWS_SSM:
             "Parameter"
         ]["Value"]
 
-aws_ssm = AWS_SSM()
\ No newline at end of file
+    def get_parameter_values(
+        self, names: List[str], with_decryption: bool = True
+    ) -> Dict[str, str]:
+        """
+        Retrieves several parameters with as few GetParameters calls as possible.
+
+        Args:
+            names (List[str]): The names of the parameters to retrieve.
+            with_decryption (bool, optional): Whether to decrypt encrypted values. Defaults to True.
+
+        Returns:
+            Dict[str, str]: Parameter name -> value. Names that do not exist in the
+            Parameter Store are omitted.
+        """
+        values = {}
+        for start in range(0, len(names), GET_PARAMETERS_MAX_NAMES):
+            chunk = names[start : start + GET_PARAMETERS_MAX_NAMES]
+            response = self.client.get_parameters(
+                Names=chunk, WithDecryption=with_decryption
+            )
+            for parameter in response.get("Parameters", []):
+                values[parameter["Name"]] = parameter["Value"]
+
+        return values
+
+aws_ssm = LazyProvider(AWS_SSM, name="aws_ssm")
\ No newline at end of file
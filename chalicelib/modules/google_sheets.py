@@ -5,21 +5,21 @@ from googleapiclient.discovery import build
 
 # from googleapiclient.errors import HttpError
 # from google_auth_oauthlib.flow import InstalledAppFlow
-import boto3
 import json
 from thefuzz import fuzz
 import re
+from chalicelib.config import get_settings
 
 
 class GoogleSheetsModule:
     def __init__(self):
         self.scopes = ["https://www.googleapis.com/auth/spreadsheets"]
-        ssm = boto3.client("ssm")
-        creds = json.loads(
-            ssm.get_parameter(
-                Name="/Zap/GOOGLE_SERVICE_ACCOUNT_CREDENTIALS", WithDecryption=True
-            )["Parameter"]["Value"]
-        )
+        raw_creds = get_settings().google_service_account_credentials
+        if not raw_creds:
+            raise Exception(
+                "[GoogleSheetsModule.__init__] Could not find /Zap/GOOGLE_SERVICE_ACCOUNT_CREDENTIALS."
+            )
+        creds = json.loads(raw_creds)
         self.creds = service_account.Credentials.from_service_account_info(
             creds, scopes=self.scopes
         )
@@ -0,0 +1,186 @@
+import boto3
+import logging
+import math
+import threading
+import time
+from typing import Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def fetch_ssm_parameter(name: str) -> str:
+    """Fetches a decrypted parameter value from the AWS SSM Parameter Store."""
+    return boto3.client("ssm").get_parameter(Name=name, WithDecryption=True)[
+        "Parameter"
+    ]["Value"]
+
+
+class SecretProvider:
+    """
+    Process-wide TTL cache for a single secret.
+
+    - The secret is fetched once and served from memory until `ttl_seconds` elapse,
+      so a warm Lambda container does not touch SSM on every request.
+    - Once a cached value enters its final `refresh_ahead_seconds`, the next read
+      triggers a background refresh while the cached value keeps being served.
+    - When a refresh returns a different value (secret rotation), the old value is
+      kept as the "previous" secret for `rotation_grace_seconds` so tokens signed
+      with either secret are accepted while caches roll over.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl_seconds: float = 900,
+        refresh_ahead_seconds: float = 120,
+        rotation_grace_seconds: float = 900,
+        min_refresh_interval_seconds: float = 30,
+        fetcher: Optional[Callable[[str], str]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.refresh_ahead_seconds = refresh_ahead_seconds
+        self.rotation_grace_seconds = rotation_grace_seconds
+        self.min_refresh_interval_seconds = min_refresh_interval_seconds
+        self._fetcher = fetcher if fetcher is not None else fetch_ssm_parameter
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._value: Optional[str] = None
+        self._expires_at = 0.0
+        self._fetched_at: Optional[float] = None
+        self._previous: Optional[str] = None
+        self._previous_expires_at = 0.0
+        self._refreshing = False
+        self._rejection_refresh_at = -math.inf
+
+    def get(self) -> str:
+        """
+        Returns the cached secret, fetching it if the cache is empty or expired.
+
+        Returns:
+            str: The current secret value.
+        """
+        now = self._clock()
+        value = self._value
+
+        if value is None or now >= self._expires_at:
+            return self._load(force=False)
+
+        if now >= self._expires_at - self.refresh_ahead_seconds:
+            self._refresh_in_background()
+
+        return value
+
+    def get_candidates(self) -> List[str]:
+        """
+        Returns every secret that should currently be accepted: the current secret,
+        followed by the previous one while its rotation grace period is active.
+        """
+        current = self.get()
+        previous = self._previous
+
+        if (
+            previous is not None
+            and previous != current
+            and self._clock() < self._previous_expires_at
+        ):
+            return [current, previous]
+        return [current]
+
+    def refresh(self) -> str:
+        """Fetches the secret immediately, replacing the cached value."""
+        return self._load(force=True)
+
+    def refresh_on_rejection(self) -> bool:
+        """
+        Re-fetches the secret after a signature check failed with every candidate,
+        in case it was rotated before the cache expired. Re-fetches are rate limited
+        by `min_refresh_interval_seconds` so invalid tokens cannot hammer SSM. A failed
+        re-fetch is logged and treated as "no new secret", so the token is rejected
+        as invalid rather than surfacing the SSM error.
+
+        Returns:
+            bool: True if a new secret value was fetched.
+        """
+        now = self._clock()
+        fetched_at = self._fetched_at if self._fetched_at is not None else -math.inf
+        last_attempt = max(fetched_at, self._rejection_refresh_at)
+        if now - last_attempt < self.min_refresh_interval_seconds:
+            return False
+        self._rejection_refresh_at = now
+
+        previous_value = self._value
+        try:
+            return self.refresh() != previous_value
+        except Exception as e:
+            logger.warning(
+                f"[SecretProvider] Re-fetch of '{self.name}' after a rejected token failed: {str(e)}"
+            )
+            return False
+
+    def prime(self, value: str):
+        """Seeds the cache with an already-fetched value (e.g. from a batched SSM read)."""
+        with self._lock:
+            self._store(value)
+
+    def invalidate(self):
+        """Clears the cached secret (for teardown or reinitialization)."""
+        with self._lock:
+            self._value = None
+            self._expires_at = 0.0
+            self._fetched_at = None
+            self._previous = None
+            self._previous_expires_at = 0.0
+            self._rejection_refresh_at = -math.inf
+
+    def _load(self, force: bool) -> str:
+        with self._lock:
+            # another thread may have refreshed while we waited on the lock
+            if (
+                not force
+                and self._value is not None
+                and self._clock() < self._expires_at
+            ):
+                return self._value
+
+            value = self._fetcher(self.name)
+            self._store(value)
+            return value
+
+    def _store(self, value: str):
+        """Caches `value`; caller must hold `self._lock`."""
+        now = self._clock()
+        if self._value is not None and self._value != value:
+            logger.info(f"[SecretProvider] Secret '{self.name}' was rotated.")
+            self._previous = self._value
+            self._previous_expires_at = now + self.rotation_grace_seconds
+
+        self._value = value
+        self._fetched_at = now
+        self._expires_at = now + self.ttl_seconds
+
+    def _refresh_in_background(self):
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        thread = threading.Thread(target=self._background_refresh, daemon=True)
+        thread.start()
+
+    def _background_refresh(self):
+        try:
+            self.refresh()
+        except Exception as e:
+            # keep serving the cached value; the next read past expiry retries synchronously
+            logger.warning(
+                f"[SecretProvider] Background refresh of '{self.name}' failed: {str(e)}"
+            )
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+
+auth_secret = SecretProvider("/Zap/AUTH_SECRET")
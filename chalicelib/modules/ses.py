@@ -3,6 +3,7 @@
 import logging
 import boto3
 from botocore.exceptions import ClientError
+from chalicelib.utils.lazy import LazyProvider
 
 # from ses_identities import SesIdentity
 # from ses_templates import SesTemplate
@@ -86,4 +87,4 @@ class SesMailSender:
         else:
             return message_id
 
-ses = SesMailSender(boto3.client('ses'))
\ No newline at end of file
+ses = LazyProvider(lambda: SesMailSender(boto3.client("ses")), name="ses")
\ No newline at end of file
@@ -1,7 +1,5 @@
-import os
 from supabase import create_client, Client
-from chalicelib.modules.aws_ssm import aws_ssm
-from dotenv import load_dotenv
+from chalicelib.config import get_settings
 from typing import Optional, Tuple
 import logging
 
@@ -21,21 +19,11 @@ class SupabaseClient:
         Raises:
             Exception: If parameters cannot be found or fetched.
         """
-        ENV = os.getenv("ENV", "local")
+        settings = get_settings()
+        ENV = settings.env
         logger.info(f"[SupabaseClient.get_params] Running in env: {ENV}")
 
-        if ENV in ["staging", "prod"]:
-            try:
-                url = aws_ssm.get_parameter_value(f"/Zap/{ENV}/SUPABASE_URL")
-                key = aws_ssm.get_parameter_value(f"/Zap/{ENV}/SUPABASE_KEY")
-            except Exception as e:
-                raise Exception(
-                    f"[SupabaseClient] Failed to fetch Supabase params from SSM: {str(e)}"
-                )
-        else:
-            load_dotenv(".env.local")
-            url = os.getenv("SUPABASE_URL")
-            key = os.getenv("SUPABASE_KEY")
+        url, key = settings.supabase_url, settings.supabase_key
 
         if not (url and key):
             raise Exception(
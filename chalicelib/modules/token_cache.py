@@ -0,0 +1,135 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, FrozenSet, Optional
+
+from chalicelib.models.roles import Roles
+
+
+@dataclass(frozen=True)
+class VerifiedToken:
+    """Claims of a JWT whose signature has already been checked."""
+
+    claims: dict
+    roles: FrozenSet[Roles]
+    exp: Optional[float]
+
+
+def token_digest(token: str) -> str:
+    """Returns the cache key for `token`, so raw tokens are never kept in memory."""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class VerifiedTokenCache:
+    """
+    Expiry-aware LRU cache of verified JWT claims.
+
+    - Entries are keyed by a SHA-256 digest of the token and hold the decoded claims
+      together with a precomputed set of `Roles`, so repeat requests skip both the
+      HMAC verification and the role list conversion.
+    - An entry is evicted at the token's `exp` (or after `max_ttl_seconds`, whichever
+      comes first), after which the token goes through full verification again.
+    - Once `max_entries` is reached the least recently used entry is dropped.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_ttl_seconds: float = 300,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.max_entries = max_entries
+        self.max_ttl_seconds = max_ttl_seconds
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, token: str) -> Optional[VerifiedToken]:
+        """
+        Returns the cached verification of `token`, or None on a miss.
+
+        Args:
+            token (str): The encoded JWT.
+
+        Returns:
+            Optional[VerifiedToken]: The cached claims, if present and not expired.
+        """
+        key = token_digest(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, verified = entry
+                if self._clock() < expires_at:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return verified
+
+                del self._entries[key]
+                self.evictions += 1
+
+            self.misses += 1
+            return None
+
+    def put(self, token: str, claims: dict) -> VerifiedToken:
+        """
+        Caches the claims of a token that has just been verified.
+
+        Args:
+            token (str): The encoded JWT.
+            claims (dict): Its decoded claims.
+
+        Returns:
+            VerifiedToken: The cached entry.
+        """
+        exp = claims.get("exp")
+        verified = VerifiedToken(
+            claims=claims,
+            roles=frozenset(Roles(role) for role in claims.get("roles", [])),
+            exp=exp,
+        )
+
+        now = self._clock()
+        expires_at = now + self.max_ttl_seconds
+        if exp is not None:
+            expires_at = min(expires_at, float(exp))
+        if expires_at <= now:
+            return verified
+
+        key = token_digest(token)
+        with self._lock:
+            self._entries[key] = (expires_at, verified)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+        return verified
+
+    def clear(self):
+        """Drops every entry and resets the metrics (for teardown or reinitialization)."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> dict:
+        """Returns hit/miss metrics for the cache."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
+
+
+verified_tokens = VerifiedTokenCache()
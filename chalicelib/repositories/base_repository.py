@@ -1,14 +1,71 @@
 from chalice.app import NotFoundError, Response, BadRequestError
-from typing import Dict, List, Optional, Any, Union
+from dataclasses import dataclass, field as dc_field
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Union
 from supabase import Client
 from postgrest.exceptions import APIError
 from chalicelib.modules.supabase_client import SupabaseClient
 from chalicelib.handlers.error_handler import GENERIC_CLIENT_ERROR, log_and_reraise
+from chalicelib.handlers.query_trace import trace_query
+from chalicelib.utils.pagination import MAX_PAGE_SIZE, Page, decode_cursor, encode_cursor
+from chalicelib.request_context import evict_request_rows, get_request_loader
+from functools import wraps
 import logging
 import os
 
 logger = logging.getLogger(__name__)
 
+# Budget (in characters) for the values of a single `in.(...)` filter. PostgREST
+# filters travel in the query string, and gateways reject URLs of roughly 8 KB.
+IN_FILTER_MAX_CHARS = 4000
+
+
+@dataclass
+class BulkResult:
+    """Result of a bulk lookup: rows keyed by the requested key, plus keys with no row."""
+
+    found: Dict[Any, Dict] = dc_field(default_factory=dict)
+    missing: List[Any] = dc_field(default_factory=list)
+
+
+def chunk_in_values(
+    values: Iterable[Any], max_chars: int = IN_FILTER_MAX_CHARS
+) -> List[List[Any]]:
+    """
+    Deduplicates `values` (keeping order) and splits them into chunks whose
+    `in.(...)` filter stays under `max_chars` characters.
+    """
+    chunks: List[List[Any]] = []
+    current: List[Any] = []
+    size = 0
+    for value in dict.fromkeys(values):
+        # quoted value plus separating comma
+        value_size = len(str(value)) + 3
+        if current and size + value_size > max_chars:
+            chunks.append(current)
+            current, size = [], 0
+        current.append(value)
+        size += value_size
+
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def evicts_request_rows(func):
+    """
+    Decorator for repository writes: drops the table's rows from the request-scoped
+    identity map (see `chalicelib.request_context.RequestLoader`) once the write ran.
+    """
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            evict_request_rows(self.table_name)
+
+    return wrapper
+
 
 class BaseRepository:
     """
@@ -27,14 +84,47 @@ class BaseRepository:
     ########## CREATE ##########
 
     @log_and_reraise
+    @trace_query
+    @evicts_request_rows
     def create(self, data: Union[Dict, List]):
         """Create a new record"""
         response = self.client.table(self.table_name).insert(data).execute()
         return response.data
 
+    @log_and_reraise
+    @trace_query
+    @evicts_request_rows
+    def create_many(self, rows: List[Dict]) -> List[Dict]:
+        """Create many records in a single request"""
+        if not rows:
+            return []
+        response = self.client.table(self.table_name).insert(rows).execute()
+        return response.data
+
+    @log_and_reraise
+    @trace_query
+    @evicts_request_rows
+    def upsert_many(
+        self, rows: List[Dict], on_conflict: str, ignore_duplicates: bool = False
+    ) -> List[Dict]:
+        """
+        Insert many records in a single request, resolving conflicts on the
+        `on_conflict` columns (comma separated) by updating the existing row, or by
+        leaving it untouched when `ignore_duplicates` is True.
+        """
+        if not rows:
+            return []
+        response = (
+            self.client.table(self.table_name)
+            .upsert(rows, on_conflict=on_conflict, ignore_duplicates=ignore_duplicates)
+            .execute()
+        )
+        return response.data
+
     ########## READ ##########
 
     @log_and_reraise
+    @trace_query
     def get_all(self, select_query: str = "*"):
         """Get all records from the table with optional field selection"""
         response = self.client.table(self.table_name).select(select_query).execute()
@@ -42,7 +132,21 @@ class BaseRepository:
 
     @log_and_reraise
     def get_by_id(self, id_value: str, select_query: str = "*") -> Dict:
-        """Get a record by its ID field"""
+        """
+        Get a record by its ID field. Within a request scope, repeated lookups of the
+        same record are served from the request's identity map.
+        """
+        loader = get_request_loader(self)
+        if loader is not None:
+            return loader.load(
+                str(id_value),
+                lambda: self._fetch_by_id(id_value, select_query),
+                select_query,
+            )
+        return self._fetch_by_id(id_value, select_query)
+
+    @trace_query
+    def _fetch_by_id(self, id_value: str, select_query: str = "*") -> Dict:
         response = (
             self.client.table(self.table_name)
             .select(select_query)
@@ -60,6 +164,18 @@ class BaseRepository:
     @log_and_reraise
     def get_by_ids(self, id_fields: Dict[str, Any], select_query: str = "*") -> Dict:
         """Get a record by matching all provided id_fields"""
+        loader = get_request_loader(self)
+        if loader is not None:
+            key = tuple(sorted((field, str(value)) for field, value in id_fields.items()))
+            return loader.load(
+                ("get_by_ids",) + key,
+                lambda: self._fetch_by_ids(id_fields, select_query),
+                select_query,
+            )
+        return self._fetch_by_ids(id_fields, select_query)
+
+    @trace_query
+    def _fetch_by_ids(self, id_fields: Dict[str, Any], select_query: str = "*") -> Dict:
         query = self.client.table(self.table_name).select(select_query)
         for field, value in id_fields.items():
             query = query.eq(field, value)
@@ -74,6 +190,7 @@ class BaseRepository:
         return response.data[0]
 
     @log_and_reraise
+    @trace_query
     def get_all_by_field(
         self, field: str, value: Any, select_query: str = "*"
     ) -> List[Dict]:
@@ -87,6 +204,7 @@ class BaseRepository:
         return response.data
 
     @log_and_reraise
+    @trace_query
     def get_with_custom_select(
         self, filters: Optional[Dict[str, Any]] = None, select_query: str = "*"
     ) -> List[Dict]:
@@ -102,30 +220,152 @@ class BaseRepository:
         response = query.execute()
         return response.data
 
+    @log_and_reraise
+    @trace_query
+    def get_many_by_field_in(
+        self, field: str, values: Iterable[Any], select_query: str = "*"
+    ) -> List[Dict]:
+        """
+        Get all records whose `field` is one of `values`, using one `in` filter per
+        chunk of values (see `chunk_in_values`) instead of one request per value.
+        """
+        rows: List[Dict] = []
+        for chunk in chunk_in_values(values):
+            response = (
+                self.client.table(self.table_name)
+                .select(select_query)
+                .in_(field, chunk)
+                .execute()
+            )
+            rows.extend(response.data)
+        return rows
+
+    @log_and_reraise
+    @trace_query
+    def get_many_by_ids(
+        self, id_values: Iterable[Any], select_query: str = "*"
+    ) -> BulkResult:
+        """
+        Get many records by their ID field in as few round trips as possible.
+        `select_query` must include the ID field.
+
+        Returns:
+            BulkResult: Records keyed by requested ID, and the IDs that were not found.
+        """
+        id_values = list(dict.fromkeys(id_values))
+        rows = self.get_many_by_field_in(self.id_field, id_values, select_query)
+        return self._to_bulk_result(id_values, rows)
+
+    @log_and_reraise
+    @trace_query
+    def get_page(
+        self,
+        limit: Optional[int] = MAX_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        select_query: str = "*",
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Page:
+        """
+        Get one page of records ordered by the ID field (keyset pagination).
+
+        Pages are fetched with `id > last id of previous page`, so each page costs the
+        same regardless of depth and rows are never skipped or repeated when earlier
+        rows are inserted or deleted between requests.
+
+        Args:
+            limit (int, optional): Page size, capped at MAX_PAGE_SIZE (the default).
+            cursor (str, optional): `next_cursor` of the previous page.
+            select_query (str): Fields to select.
+            filters (dict, optional): Filters applied to every page: equality, or
+                `in` for list, tuple and set values.
+
+        Returns:
+            Page: The records and the cursor of the next page (None on the last page).
+        """
+        limit = MAX_PAGE_SIZE if limit is None else max(1, min(limit, MAX_PAGE_SIZE))
+        query = self.client.table(self.table_name).select(select_query)
+        for field, value in (filters or {}).items():
+            if isinstance(value, (list, tuple, set)):
+                query = query.in_(field, list(value))
+            else:
+                query = query.eq(field, value)
+        if cursor is not None:
+            query = query.gt(self.id_field, decode_cursor(cursor))
+
+        # fetch one extra row to know whether another page exists
+        if limit < MAX_PAGE_SIZE:
+            response = query.order(self.id_field).limit(limit + 1).execute()
+            rows = response.data
+            has_more = len(rows) > limit
+        else:
+            response = query.order(self.id_field).limit(limit).execute()
+            rows = response.data
+            has_more = len(rows) == limit
+
+        items = rows[:limit]
+        next_cursor = encode_cursor(items[-1][self.id_field]) if has_more else None
+        return Page(items=items, next_cursor=next_cursor)
+
+    def iter_all(
+        self,
+        page_size: int = MAX_PAGE_SIZE,
+        select_query: str = "*",
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[Dict]:
+        """
+        Stream every record of the table page by page, holding one page in memory.
+        Unlike `get_all`, this is not truncated at PostgREST's `max_rows`.
+        """
+        cursor = None
+        while True:
+            page = self.get_page(
+                limit=page_size,
+                cursor=cursor,
+                select_query=select_query,
+                filters=filters,
+            )
+            yield from page.items
+            if page.next_cursor is None:
+                return
+            cursor = page.next_cursor
+
     ########### UPDATE ###########
 
     @log_and_reraise
+    @trace_query
     def update(self, id_value: str, data: Dict) -> Optional[Dict]:
         """Update an existing record by its ID field"""
-        response = (
-            self.client.table(self.table_name)
-            .update(data)
-            .eq(self.id_field, id_value)
-            .execute()
-        )
+        try:
+            response = (
+                self.client.table(self.table_name)
+                .update(data)
+                .eq(self.id_field, id_value)
+                .execute()
+            )
+        finally:
+            evict_request_rows(self.table_name)
+
         if not response.data:
             error_message = (
                 f"{self.table_name.capitalize()} with ID '{id_value}' not found."
             )
             raise NotFoundError(error_message)
+
+        # the updated row is returned in full, so later reads in this request can reuse it
+        loader = get_request_loader(self)
+        if loader is not None:
+            loader.prime(response.data[0])
         return response.data[0]
 
     @log_and_reraise
+    @trace_query
     def update_field(self, id_value: str, field: str, value: Any):
         """Update a single field in a record"""
         return self.update(id_value, {field: value})
 
     @log_and_reraise
+    @trace_query
+    @evicts_request_rows
     def update_all(self, data: Dict[str, Any]) -> int:
         """
         Update all records in the table with the provided data dict.
@@ -144,6 +384,8 @@ class BaseRepository:
     ########## DELETE ##########
 
     @log_and_reraise
+    @trace_query
+    @evicts_request_rows
     def delete(self, id_value: str) -> List:
         """Delete a record by its ID field"""
         response = (
@@ -161,6 +403,8 @@ class BaseRepository:
         return response.data
 
     @log_and_reraise
+    @trace_query
+    @evicts_request_rows
     def delete_by_field(self, field: str, value: Any) -> List:
         """Delete records where a specific field matches a value"""
         response = (
@@ -168,9 +412,119 @@ class BaseRepository:
         )
         return response.data
 
+    @log_and_reraise
+    @trace_query
+    @evicts_request_rows
+    def delete_many_by_ids(self, id_values: Iterable[Any]) -> BulkResult:
+        """
+        Delete many records by their ID field, one request per chunk of IDs.
+
+        Returns:
+            BulkResult: Deleted records keyed by requested ID, and the IDs that were not found.
+        """
+        id_values = list(dict.fromkeys(id_values))
+        rows: List[Dict] = []
+        for chunk in chunk_in_values(id_values):
+            response = (
+                self.client.table(self.table_name)
+                .delete()
+                .in_(self.id_field, chunk)
+                .execute()
+            )
+            rows.extend(response.data)
+        return self._to_bulk_result(id_values, rows)
+
     ########## MISC ##########
 
     @log_and_reraise
+    @trace_query
+    @evicts_request_rows
+    def sync_relation(
+        self,
+        owner_id: Any,
+        desired_ids: Iterable[Any],
+        related_field: str,
+        owner_field: Optional[str] = None,
+    ) -> List[Dict]:
+        """
+        Makes the join-table rows of `owner_id` match `desired_ids` in at most two
+        round trips: one delete of the rows that are no longer wanted, and one upsert
+        of the desired rows that ignores the ones that already exist.
+
+        Requires a unique constraint on (`owner_field`, `related_field`).
+
+        Args:
+            owner_id: Value of the owning side (e.g. a user id).
+            desired_ids: Related ids that should remain (e.g. role ids).
+            related_field (str): Column holding the related id (e.g. "role_id").
+            owner_field (str, optional): Column holding the owner id. Defaults to the ID field.
+
+        Returns:
+            List[Dict]: The rows that were inserted.
+        """
+        owner_field = owner_field or self.id_field
+        desired_ids = list(dict.fromkeys(desired_ids))
+
+        query = self.client.table(self.table_name).delete().eq(owner_field, owner_id)
+        if desired_ids:
+            query = query.not_.in_(related_field, desired_ids)
+        query.execute()
+
+        return self.upsert_many(
+            [{owner_field: owner_id, related_field: rid} for rid in desired_ids],
+            on_conflict=f"{owner_field},{related_field}",
+            ignore_duplicates=True,
+        )
+
+    @log_and_reraise
+    @trace_query
+    @evicts_request_rows
+    def replace_by_field(
+        self, field: str, value: Any, rows: List[Dict], key_field: str
+    ) -> List[Dict]:
+        """
+        Makes the records where `field` matches `value` equal to `rows`, without a
+        moment where they are missing: `rows` are upserted first, then the records of
+        `value` whose `key_field` is not among them are deleted (one request per
+        chunk of keys).
+
+        Requires a unique constraint on (`field`, `key_field`).
+
+        Returns:
+            List[Dict]: The upserted rows.
+        """
+        upserted = self.upsert_many(rows, on_conflict=f"{field},{key_field}")
+
+        kept = {str(row[key_field]) for row in rows}
+        select_query = ",".join(dict.fromkeys([self.id_field, key_field]))
+        stale = [
+            record[key_field]
+            for record in self.iter_all(select_query=select_query, filters={field: value})
+            if str(record[key_field]) not in kept
+        ]
+        for chunk in chunk_in_values(stale):
+            (
+                self.client.table(self.table_name)
+                .delete()
+                .eq(field, value)
+                .in_(key_field, chunk)
+                .execute()
+            )
+        return upserted
+
+    def _to_bulk_result(self, id_values: List[Any], rows: List[Dict]) -> BulkResult:
+        """Keys `rows` by the requested ID (compared as strings, e.g. UUIDs vs str)."""
+        requested = {str(value): value for value in id_values}
+        result = BulkResult()
+        for row in rows:
+            key = requested.get(str(row.get(self.id_field)))
+            if key is not None:
+                result.found[key] = row
+        result.missing = [value for value in id_values if value not in result.found]
+        return result
+
+    @log_and_reraise
+    @trace_query
     def toggle_boolean_field(self, id_value: str, field: str) -> Optional[Dict]:
         """Toggle a boolean field in a record"""
         record = self.get_by_id(id_value)
@@ -178,6 +532,13 @@ class BaseRepository:
         current_value = record.get(field, False)
         return self.update_field(id_value, field, not current_value)
 
+    @log_and_reraise
+    @trace_query
+    def rpc(self, function_name: str, params: Optional[Dict[str, Any]] = None):
+        """Call a Postgres function (exposed by PostgREST) that works on this table"""
+        response = self.client.rpc(function_name, params or {}).execute()
+        return response.data
+
     # TODO: maybe implement this (as needed)
     @log_and_reraise
     def query(self):
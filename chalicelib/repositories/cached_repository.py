@@ -0,0 +1,224 @@
+import copy
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+from supabase import Client
+from chalicelib.repositories.base_repository import BaseRepository
+
+
+@dataclass(frozen=True)
+class CacheConfig:
+    """Read-through cache settings for a single table"""
+
+    ttl_seconds: float = 60
+    max_entries: int = 256
+    # tables whose writes also clear this cache, e.g. parents whose deletes
+    # cascade to this table
+    invalidated_by: Tuple[str, ...] = ()
+
+
+class CachedRepository(BaseRepository):
+    """
+    BaseRepository with a read-through, in-process cache for hot reference data.
+
+    - Reads are cached per (method, arguments) for `ttl_seconds`, with at most
+      `max_entries` results kept (least recently used are dropped first).
+    - Any write made through this repository clears the table's cache, so a warm
+      Lambda never serves its own stale writes. Writes made by other containers
+      are picked up once the TTL expires.
+    - Writes also clear the caches of tables listing this one in
+      `invalidated_by` (and, in turn, their dependents), so rows removed by an
+      `ON DELETE CASCADE` are not served from memory.
+    - Reads with embedded selects (e.g. `"*, events_rush(*)"`) bypass the cache,
+      since writes to the embedded table would not invalidate it.
+    - Cached values are deep-copied in and out, so callers may mutate results.
+    """
+
+    def __init__(
+        self,
+        table_name: str,
+        id_field,
+        client: Optional[Client] = None,
+        cache_config: Optional[CacheConfig] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        super().__init__(table_name=table_name, id_field=id_field, client=client)
+        self.cache_config = cache_config or CacheConfig()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        # bumped on every invalidation so reads racing a write are not cached
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        with _registry_lock:
+            _registry.add(self)
+
+    ########## CACHED READS ##########
+
+    def get_all(self, select_query: str = "*"):
+        return self._cached(
+            ("get_all", select_query),
+            select_query,
+            lambda: super(CachedRepository, self).get_all(select_query),
+        )
+
+    def get_by_id(self, id_value: str, select_query: str = "*") -> Dict:
+        return self._cached(
+            ("get_by_id", str(id_value), select_query),
+            select_query,
+            lambda: super(CachedRepository, self).get_by_id(id_value, select_query),
+        )
+
+    def get_by_ids(self, id_fields: Dict[str, Any], select_query: str = "*") -> Dict:
+        return self._cached(
+            ("get_by_ids", _freeze(id_fields), select_query),
+            select_query,
+            lambda: super(CachedRepository, self).get_by_ids(id_fields, select_query),
+        )
+
+    def get_all_by_field(self, field: str, value: Any, select_query: str = "*"):
+        return self._cached(
+            ("get_all_by_field", field, _freeze(value), select_query),
+            select_query,
+            lambda: super(CachedRepository, self).get_all_by_field(
+                field, value, select_query
+            ),
+        )
+
+    def get_with_custom_select(
+        self, filters: Optional[Dict[str, Any]] = None, select_query: str = "*"
+    ):
+        return self._cached(
+            ("get_with_custom_select", _freeze(filters or {}), select_query),
+            select_query,
+            lambda: super(CachedRepository, self).get_with_custom_select(
+                filters, select_query
+            ),
+        )
+
+    ########## INVALIDATING WRITES ##########
+
+    def create(self, data):
+        return self._write(super().create, data)
+
+    def create_many(self, rows):
+        return self._write(super().create_many, rows)
+
+    def upsert_many(self, rows, on_conflict: str, ignore_duplicates: bool = False):
+        return self._write(
+            super().upsert_many, rows, on_conflict, ignore_duplicates=ignore_duplicates
+        )
+
+    def update(self, id_value: str, data: Dict):
+        return self._write(super().update, id_value, data)
+
+    def update_all(self, data: Dict[str, Any]):
+        return self._write(super().update_all, data)
+
+    def delete(self, id_value: str):
+        return self._write(super().delete, id_value)
+
+    def delete_by_field(self, field: str, value: Any):
+        return self._write(super().delete_by_field, field, value)
+
+    def delete_many_by_ids(self, id_values):
+        return self._write(super().delete_many_by_ids, id_values)
+
+    def sync_relation(self, owner_id, desired_ids, related_field, owner_field=None):
+        return self._write(
+            super().sync_relation, owner_id, desired_ids, related_field, owner_field
+        )
+
+    def toggle_boolean_field(self, id_value: str, field: str):
+        # read the current value from the database, not the cache
+        self.invalidate()
+        return self._write(super().toggle_boolean_field, id_value, field)
+
+    ########## CACHE MANAGEMENT ##########
+
+    def invalidate(self):
+        """Clears every cached read of this table"""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def stats(self) -> dict:
+        """Returns hit/miss metrics for this table's cache"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "table": self.table_name,
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
+
+    def _cached(self, key: Hashable, select_query: str, loader: Callable[[], Any]):
+        if "(" in select_query:
+            return loader()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._clock() < entry[0]:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(entry[1])
+            self.misses += 1
+            generation = self._generation
+
+        value = loader()
+
+        with self._lock:
+            if generation != self._generation:
+                return value
+            self._entries[key] = (
+                self._clock() + self.cache_config.ttl_seconds,
+                copy.deepcopy(value),
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.cache_config.max_entries:
+                self._entries.popitem(last=False)
+
+        return value
+
+    def _write(self, method: Callable[..., Any], *args, **kwargs):
+        try:
+            return method(*args, **kwargs)
+        finally:
+            self.invalidate()
+            _invalidate_dependents(self.table_name)
+
+
+# every live cache in this process, so writes can reach dependent tables
+_registry: "weakref.WeakSet[CachedRepository]" = weakref.WeakSet()
+_registry_lock = threading.Lock()
+
+
+def _invalidate_dependents(table_name: str):
+    """Clears the caches of tables whose rows depend on `table_name`'s"""
+    with _registry_lock:
+        caches = list(_registry)
+    pending, seen = [table_name], {table_name}
+    while pending:
+        parent = pending.pop()
+        for cache in caches:
+            if parent not in cache.cache_config.invalidated_by:
+                continue
+            cache.invalidate()
+            if cache.table_name not in seen:
+                seen.add(cache.table_name)
+                pending.append(cache.table_name)
+
+
+def _freeze(value: Any) -> Hashable:
+    """Turns filter values (dicts/lists) into a hashable cache key"""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(v) for v in value)
+    return value
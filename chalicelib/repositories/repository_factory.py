@@ -1,6 +1,7 @@
 from typing import Optional
 from dataclasses import dataclass
 from chalicelib.repositories.base_repository import BaseRepository
+from chalicelib.repositories.cached_repository import CacheConfig, CachedRepository
 from supabase import Client
 
 
@@ -10,18 +11,25 @@ class RepositoryConfig:
 
     table_name: str
     id_field: str = "id"
+    # enables a read-through cache (see CachedRepository) for hot reference data
+    cache: Optional[CacheConfig] = None
 
 
 class RepositoryFactory:
     """Factory for creating repository instances with predefined configurations"""
 
     # Repository configuration constants
-    LISTINGS = RepositoryConfig(table_name="listings")
+    LISTINGS = RepositoryConfig(
+        table_name="listings", cache=CacheConfig(ttl_seconds=60, max_entries=256)
+    )
     APPLICATIONS = RepositoryConfig(table_name="applications")
+    LISTING_INSIGHTS = RepositoryConfig(table_name="listing_insights", id_field="listing_id")
 
     USERS = RepositoryConfig(table_name="users")
     USER_ROLES = RepositoryConfig(table_name="user_roles", id_field="user_id")
-    ROLES = RepositoryConfig(table_name="roles")
+    ROLES = RepositoryConfig(
+        table_name="roles", cache=CacheConfig(ttl_seconds=3600, max_entries=16)
+    )
 
     EVENTS_MEMBER = RepositoryConfig(table_name="events_member")
     EVENT_TIMEFRAMES_MEMBER = RepositoryConfig(table_name="event_timeframes_member")
@@ -31,15 +39,34 @@ class RepositoryFactory:
 
     RUSHEES = RepositoryConfig(table_name="rushees")
 
-    EVENT_TIMEFRAMES_RUSH = RepositoryConfig(table_name="event_timeframes_rush")
-    EVENTS_RUSH = RepositoryConfig(table_name="events_rush")
+    # deleting a listing deletes its timeframes, and deleting a timeframe its events
+    EVENT_TIMEFRAMES_RUSH = RepositoryConfig(
+        table_name="event_timeframes_rush",
+        cache=CacheConfig(
+            ttl_seconds=60, max_entries=128, invalidated_by=("listings",)
+        ),
+    )
+    EVENTS_RUSH = RepositoryConfig(
+        table_name="events_rush",
+        cache=CacheConfig(
+            ttl_seconds=30, max_entries=512, invalidated_by=("event_timeframes_rush",)
+        ),
+    )
     EVENTS_RUSH_ATTENDEES = RepositoryConfig(table_name="events_rush_attendees")
+    RUSHEE_ATTENDANCE = RepositoryConfig(table_name="rushee_attendance", id_field="rushee_id")
 
     @staticmethod
     def create(
         config: RepositoryConfig, client: Optional[Client] = None
     ) -> BaseRepository:
         """Create a repository instance with the given configuration"""
+        if config.cache is not None:
+            return CachedRepository(
+                table_name=config.table_name,
+                id_field=config.id_field,
+                client=client,
+                cache_config=config.cache,
+            )
         return BaseRepository(
             table_name=config.table_name, id_field=config.id_field, client=client
         )
@@ -52,6 +79,10 @@ class RepositoryFactory:
     def applications(cls, client: Optional[Client] = None) -> BaseRepository:
         return cls.create(cls.APPLICATIONS, client=client)
 
+    @classmethod
+    def listing_insights(cls, client: Optional[Client] = None) -> BaseRepository:
+        return cls.create(cls.LISTING_INSIGHTS, client=client)
+
     @classmethod
     def users(cls, client: Optional[Client] = None) -> BaseRepository:
         return cls.create(cls.USERS, client=client)
@@ -96,6 +127,10 @@ class RepositoryFactory:
     def events_rush_attendees(cls, client: Optional[Client] = None):
         return cls.create(cls.EVENTS_RUSH_ATTENDEES, client=client)
 
+    @classmethod
+    def rushee_attendance(cls, client: Optional[Client] = None):
+        return cls.create(cls.RUSHEE_ATTENDANCE, client=client)
+
     @classmethod
     def rushees(cls, client: Optional[Client] = None):
         return cls.create(cls.RUSHEES, client=client)
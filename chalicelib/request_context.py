@@ -0,0 +1,271 @@
+import copy
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, FrozenSet, Hashable, Iterator, List, Optional, Set, Tuple
+
+from chalice.app import NotFoundError
+from chalicelib.models.roles import Roles
+
+
+@dataclass(frozen=True)
+class Principal:
+    """The authenticated caller of the current request, as verified by `auth`."""
+
+    user_id: Optional[str]
+    roles: FrozenSet[Roles]
+    exp: Optional[float]
+
+    def has_role(self, role: Roles) -> bool:
+        return role in self.roles
+
+
+_current_principal: ContextVar[Optional[Principal]] = ContextVar(
+    "current_principal", default=None
+)
+
+
+def get_current_principal() -> Optional[Principal]:
+    """
+    Returns the principal attached to the current request by `auth`.
+
+    Returns:
+        Optional[Principal]: The verified caller, or None outside an authenticated route.
+    """
+    return _current_principal.get()
+
+
+def set_current_principal(principal: Optional[Principal]) -> Token:
+    """Attaches `principal` to the current request; pass the returned token to `reset_current_principal`."""
+    return _current_principal.set(principal)
+
+
+def reset_current_principal(token: Token):
+    """Restores the principal that was current before `set_current_principal`."""
+    _current_principal.reset(token)
+
+
+class RequestLoader:
+    """
+    Identity map and batching loader for one table, scoped to a single request.
+
+    - Identical `get_by_id`/`get_by_ids` lookups within the request are served from
+      memory after the first round trip.
+    - `defer` queues an ID lookup; the first deferred value that is read fetches
+      every queued ID of the table in one `in_` query (see `get_many_by_ids`).
+    - Writes through the repository evict the table's rows (see `BaseRepository`).
+
+    Round trips are made outside the lock, so lookups running in parallel (e.g. in
+    `fan_out`) do not wait on each other; a lookup already in flight is joined
+    instead of being fetched twice.
+    """
+
+    def __init__(self, repo):
+        self.repo = repo
+        self._lock = threading.RLock()
+        self._rows: Dict[Hashable, Dict] = {}
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        # cache key -> future of the round trip fetching it (resolves to the rows it read)
+        self._in_flight: Dict[Hashable, Future] = {}
+        # deferred cache keys that a batch found no row for
+        self._missing: Set[Hashable] = set()
+        # bumped by `clear`, so rows read before a write are not stored after it
+        self._generation = 0
+
+    def load(
+        self, key: Hashable, fetch: Callable[[], Dict], select_query: str = "*"
+    ) -> Dict:
+        """Returns the row cached under `key`, calling `fetch` on the first lookup."""
+        cache_key = (key, select_query)
+        with self._lock:
+            if cache_key in self._rows:
+                return copy.deepcopy(self._rows[cache_key])
+            future = self._in_flight.get(cache_key)
+            if future is None:
+                future, generation = self._start([cache_key])
+                started = True
+            else:
+                started = False
+
+        if started:
+            self._finish(future, [cache_key], generation, lambda: {cache_key: fetch()})
+        return copy.deepcopy(future.result()[cache_key])
+
+    def defer(self, id_value: Any, select_query: str = "*") -> Callable[[], Dict]:
+        """
+        Queues a lookup by ID and returns a callable that resolves it. Queue every
+        independent lookup first, then resolve them, to share one round trip.
+        """
+        cache_key = (str(id_value), select_query)
+        with self._lock:
+            if cache_key not in self._rows and cache_key not in self._in_flight:
+                self._pending.setdefault(select_query, {})[str(id_value)] = id_value
+        return lambda: self._resolve(id_value, select_query)
+
+    def flush(self) -> Dict[Hashable, Future]:
+        """
+        Fetches every queued ID, one `in_` query per select.
+
+        Returns:
+            Dict[Hashable, Future]: The round trip each fetched cache key was read in.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            batches = []
+            for select_query, id_values in pending.items():
+                cache_keys = [(key, select_query) for key in id_values]
+                future, generation = self._start(cache_keys)
+                batches.append((select_query, list(id_values.values()), cache_keys, future, generation))
+
+        futures = {}
+        for select_query, id_values, cache_keys, future, generation in batches:
+            self._finish(
+                future,
+                cache_keys,
+                generation,
+                lambda: {
+                    (str(key), select_query): row
+                    for key, row in self.repo.get_many_by_ids(id_values, select_query).found.items()
+                },
+            )
+            futures.update(dict.fromkeys(cache_keys, future))
+        return futures
+
+    def prime(self, row: Dict, select_query: str = "*"):
+        """Stores a row that was read (or written) elsewhere in the request."""
+        if self.repo.id_field in row:
+            with self._lock:
+                self._rows[(str(row[self.repo.id_field]), select_query)] = copy.deepcopy(row)
+
+    def clear(self):
+        with self._lock:
+            self._rows.clear()
+            self._missing.clear()
+            self._in_flight.clear()
+            self._generation += 1
+
+    def _start(self, cache_keys: List[Hashable]) -> Tuple[Future, int]:
+        # caller holds the lock
+        future: Future = Future()
+        for cache_key in cache_keys:
+            self._in_flight[cache_key] = future
+        return future, self._generation
+
+    def _finish(
+        self,
+        future: Future,
+        cache_keys: List[Hashable],
+        generation: int,
+        fetch_rows: Callable[[], Dict[Hashable, Dict]],
+    ):
+        try:
+            rows = fetch_rows()
+        except BaseException as e:
+            rows, error = {}, e
+        else:
+            error = None
+
+        with self._lock:
+            if error is None and generation == self._generation:
+                self._rows.update(rows)
+                self._missing.update(cache_key for cache_key in cache_keys if cache_key not in rows)
+            for cache_key in cache_keys:
+                if self._in_flight.get(cache_key) is future:
+                    del self._in_flight[cache_key]
+
+        if error is None:
+            future.set_result(rows)
+        else:
+            future.set_exception(error)
+
+    def _resolve(self, id_value: Any, select_query: str) -> Dict:
+        cache_key = (str(id_value), select_query)
+        while True:
+            with self._lock:
+                if cache_key in self._rows:
+                    return copy.deepcopy(self._rows[cache_key])
+                missing = cache_key in self._missing
+                future = self._in_flight.get(cache_key)
+                if future is None and not missing:
+                    # queued again if a write evicted the row since `defer`
+                    self._pending.setdefault(select_query, {})[str(id_value)] = id_value
+
+            if future is None and not missing:
+                future = self.flush().get(cache_key)
+                if future is None:  # fetched by a flush on another thread
+                    continue
+
+            rows = future.result() if future is not None else {}
+            if cache_key not in rows:
+                raise NotFoundError(
+                    f"{self.repo.table_name.capitalize()} with ID '{id_value}' not found."
+                )
+            return copy.deepcopy(rows[cache_key])
+
+
+class RequestScope:
+    """Per-request state shared by the repositories used while serving a request."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loaders: Dict[Tuple[str, str], RequestLoader] = {}
+        # repository calls made in this request (see chalicelib.handlers.query_trace)
+        self.queries: List[Any] = []
+
+    def loader(self, repo) -> RequestLoader:
+        key = (repo.table_name, repo.id_field)
+        with self._lock:
+            if key not in self._loaders:
+                self._loaders[key] = RequestLoader(repo)
+            return self._loaders[key]
+
+    def evict(self, table_name: str):
+        """Drops every row of `table_name` loaded in this request."""
+        with self._lock:
+            loaders = [loader for (table, _), loader in self._loaders.items() if table == table_name]
+        for loader in loaders:
+            loader.clear()
+
+
+_current_scope: ContextVar[Optional[RequestScope]] = ContextVar(
+    "current_request_scope", default=None
+)
+
+
+@contextmanager
+def request_scope() -> Iterator[RequestScope]:
+    """
+    Opens a request scope for the duration of the block; everything loaded in it is
+    dropped when the block exits.
+    """
+    scope = RequestScope()
+    token = _current_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _current_scope.reset(token)
+
+
+def get_request_scope() -> Optional[RequestScope]:
+    """Returns the scope of the current request, or None outside a request."""
+    return _current_scope.get()
+
+
+def get_request_loader(repo) -> Optional[RequestLoader]:
+    """
+    Returns the request-scoped loader for `repo`'s table.
+
+    Returns:
+        Optional[RequestLoader]: The loader, or None outside a request scope.
+    """
+    scope = _current_scope.get()
+    return scope.loader(repo) if scope is not None else None
+
+
+def evict_request_rows(table_name: str):
+    """Drops rows of `table_name` loaded in the current request (after a write)."""
+    scope = _current_scope.get()
+    if scope is not None:
+        scope.evict(table_name)
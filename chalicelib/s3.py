@@ -1,6 +1,7 @@
 import boto3
 import os
 from chalicelib.utils.utils import decode_base64
+from chalicelib.utils.lazy import LazyProvider
 
 
 class S3Client:
@@ -82,4 +83,4 @@ class S3Client:
         return response
 
 
-s3 = S3Client()
+s3 = LazyProvider(S3Client, name="s3")
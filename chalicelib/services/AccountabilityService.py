@@ -1,4 +1,5 @@
 from chalicelib.modules.google_sheets import GoogleSheetsModule
+from chalicelib.utils.lazy import LazyProvider
 
 class AccountabilityService:
     def __init__(self):
@@ -47,4 +48,6 @@ class AccountabilityService:
         return values
 
 
-accountability_service = AccountabilityService()
+accountability_service = LazyProvider(
+    AccountabilityService, name="accountability_service"
+)
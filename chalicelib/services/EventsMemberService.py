@@ -41,9 +41,16 @@ class EventsMemberService:
         except Exception as e:
             raise NotFoundError(f"Failed to retrieve timeframe: {str(e)}")
 
-    def get_all_timeframes_and_events(self):
-        """Retrieve all timeframes from the database."""
+    def get_all_timeframes_and_events(
+        self, limit: Optional[int] = None, cursor: Optional[str] = None
+    ):
+        """Retrieve all timeframes from the database (or one page of them)."""
         try:
+            if limit is not None or cursor is not None:
+                return self.event_timeframes_member_repo.get_page(
+                    limit=limit, cursor=cursor, select_query="*, events_member(*)"
+                ).to_dict()
+
             timeframes = self.event_timeframes_member_repo.get_all(
                 select_query="*, events_member(*)"
             )
@@ -120,7 +127,11 @@ class EventsMemberService:
         user_name, user_email = user.get("name", ""), user.get("email", "")
 
         try:
-            event = self.events_member_repo.get_by_id(event_id)
+            # embeds the timeframe so its spreadsheet id comes back in the same round trip
+            event = self.events_member_repo.get_by_id(
+                event_id,
+                select_query="*, timeframe: event_timeframes_member (spreadsheet_id)",
+            )
         except Exception as e:
             raise BadRequestError(f"Failed to retrieve event: {str(e)}")
 
@@ -141,10 +152,8 @@ class EventsMemberService:
                 raise BadRequestError("User has already checked in.")
             raise BadRequestError(GENERIC_CLIENT_ERROR)
 
-        # Get timeframe document to get Google Sheets info
-        timeframe = self.event_timeframes_member_repo.get_by_id(event["timeframe_id"])
-
         # Get Google Sheets information
+        timeframe = event.get("timeframe") or {}
         ss_id = timeframe.get("spreadsheet_id", "")
 
         # Initialize Google Sheets Module
@@ -3,20 +3,33 @@ from chalice.app import BadRequestError, UnauthorizedError
 import json
 from chalicelib.s3 import s3
 from chalicelib.utils.utils import get_prev_image_version, extract_relative_path_from_url
-from chalicelib.utils.rush_events import is_rush_threshold_met
-from typing import Optional
+from chalicelib.utils.rush_events import (
+    RECORD_CHECKIN_FUNCTION,
+    CompiledThreshold,
+    compile_threshold_rules,
+    rush_checkin_params,
+    validate_threshold_rules,
+)
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timezone
 from dateutil import parser
+import logging
+import time
 import uuid
 from chalicelib.handlers.error_handler import GENERIC_CLIENT_ERROR
 from postgrest.exceptions import APIError
 from pytz import timezone as pytz_timezone
 from chalicelib.repositories.base_repository import BaseRepository
 from chalicelib.services.service_utils import resolve_repo
-from typing import Optional
+
+logger = logging.getLogger(__name__)
 
 # TODO: refactor base_repo to pass errors to service classes
 
+# How long a timeframe's attendance is kept for threshold previews (check-ins and
+# event writes made through this container drop it sooner)
+ATTENDANCE_SNAPSHOT_TTL_SECONDS = 300
+
 
 class EventsRushService:
 
@@ -26,19 +39,30 @@ class EventsRushService:
         events_rush_repo: Optional[BaseRepository] = None,
         events_rush_attendees_repo: Optional[BaseRepository] = None,
         rushees_repo: Optional[BaseRepository] = None,
+        rushee_attendance_repo: Optional[BaseRepository] = None,
     ):
         self.event_timeframes_rush_repo = resolve_repo(event_timeframes_rush_repo, RepositoryFactory.event_timeframes_rush)
         self.events_rush_repo = resolve_repo(events_rush_repo, RepositoryFactory.events_rush)
         self.events_rush_attendees_repo = resolve_repo(events_rush_attendees_repo, RepositoryFactory.events_rush_attendees)
         self.rushees_repo = resolve_repo(rushees_repo, RepositoryFactory.rushees)
+        self.rushee_attendance_repo = resolve_repo(rushee_attendance_repo, RepositoryFactory.rushee_attendance)
+        # timeframe id -> (expires at, events, attendance masks), see `preview_threshold_rules`
+        self._attendance_snapshots: Dict[str, Tuple[float, List[dict], Dict[str, int]]] = {}
 
-    def get_rush_categories_and_events(self):
+    def get_rush_categories_and_events(
+        self, limit: Optional[int] = None, cursor: Optional[str] = None
+    ):
         try:
+            if limit is not None or cursor is not None:
+                return self.event_timeframes_rush_repo.get_page(
+                    limit=limit, cursor=cursor, select_query="*, events_rush(*)"
+                ).to_dict()
+
             timeframes_with_events = self.event_timeframes_rush_repo.get_all(
                 select_query="*, events_rush(*)"
             )
             return timeframes_with_events
-        except Exception as e:
+        except Exception:
             raise BadRequestError(GENERIC_CLIENT_ERROR)
 
     def get_rush_event(
@@ -77,7 +101,7 @@ class EventsRushService:
 
             event["attendees"] = rushees
             return event
-        except Exception as e:
+        except Exception:
             raise BadRequestError(GENERIC_CLIENT_ERROR)
 
     def create_rush_timeframe(self, data: dict):
@@ -86,7 +110,7 @@ class EventsRushService:
             data["id"] = id
             response = self.event_timeframes_rush_repo.create(data)
             return response
-        except Exception as e:
+        except Exception:
             raise BadRequestError(GENERIC_CLIENT_ERROR)
 
     def create_rush_event(self, data: dict):
@@ -102,6 +126,7 @@ class EventsRushService:
             data["event_cover_image"] = image_url
 
             event = self.events_rush_repo.create(data)
+            self._forget_attendance(data["timeframe_id"])
             return event
         except Exception as e:
             raise BadRequestError(f"Failed to create rush event: {e}")
@@ -154,6 +179,8 @@ class EventsRushService:
                 data["event_cover_image"] = image_url
 
             response = self.events_rush_repo.update(id_value=event_id, data=data)
+            self._forget_attendance(timeframe_id)
+            self._refresh_attendance(timeframe_id)
             return response
         except Exception as e:
             raise BadRequestError(str(e))
@@ -234,6 +261,8 @@ class EventsRushService:
                 raise BadRequestError("User has already checked in.")
             raise BadRequestError(GENERIC_CLIENT_ERROR)
 
+        self._forget_attendance(event["timeframe_id"])
+        self._record_checkin(event, rushee_id)
         return {"msg": True}
 
     def get_rush_events_default_timeframe(self, rushee_id: str):
@@ -312,64 +341,286 @@ class EventsRushService:
             if not delete_event:
                 raise Exception("Failed to delete rush category.")
 
+            self._forget_attendance(event["timeframe_id"])
+            self._refresh_attendance(event["timeframe_id"])
             return
 
         except Exception as e:
             raise BadRequestError(e)
 
     def get_rush_timeframe_analytics(self, timeframe_id: str):
+        """
+        Attendance analytics of a timeframe, read from its `rushee_attendance` rows
+        (one per rushee) instead of every event joined to its attendees. The rows are
+        built on first use for timeframes that predate them.
+        """
         try:
             timeframe = self.event_timeframes_rush_repo.get_by_id(id_value=timeframe_id)
             rush_events = self.events_rush_repo.get_with_custom_select(
-                filters={"timeframe_id": timeframe_id}, select_query="*, rushees(*)"
+                filters={"timeframe_id": timeframe_id}
             )
-        except Exception as e:
+            summary_rows = self._get_rushee_attendance(timeframe_id)
+            if not summary_rows and rush_events:
+                self.rebuild_rushee_attendance(timeframe_id)
+                summary_rows = self._get_rushee_attendance(timeframe_id)
+        except Exception:
             raise BadRequestError(GENERIC_CLIENT_ERROR)
 
         rush_events.sort(key=lambda e: e.get("date", ""))
+        attendance = summary_masks(rush_events, summary_rows)
+        rushee_dict, rush_events_dict = build_rush_analytics(
+            rush_events,
+            attendance=attendance,
+            rushees={row["rushee_id"]: row["rushees"] for row in summary_rows},
+            thresholds={row["rushee_id"]: row["threshold"] for row in summary_rows},
+        )
+        self._remember_attendance(timeframe_id, rush_events, attendance)
 
-        rushee_dict = {}
-        rush_events_dict = {}
+        return {
+            "timeframe": timeframe,
+            "rushees": rushee_dict,
+            "events": rush_events_dict,
+        }
 
-        # Extract all rushees and events
-        for event in rush_events:
-            # Get rushees
-            event_id = event["id"]
-            for rushee in event.get("rushees", []):
-                rushee_id = rushee["id"]
-                if rushee_id not in rushee_dict:
-                    rushee_dict[rushee_id] = rushee.copy()
+    def rebuild_rushee_attendance(self, timeframe_id: str) -> dict:
+        """
+        Recomputes the timeframe's `rushee_attendance` rows from its events' attendees
+        and threshold rules (the repair job for check-ins that failed to record).
+        """
+        timeframe = self.event_timeframes_rush_repo.get_by_id(id_value=timeframe_id)
+        rush_events = self.events_rush_repo.get_with_custom_select(
+            filters={"timeframe_id": timeframe_id},
+            select_query="id, name, date, rushees(id)",
+        )
+        rush_events.sort(key=lambda e: e.get("date", ""))
+        attendance = attendance_masks(rush_events)
+        threshold = compile_threshold_rules(timeframe.get("threshold_rules"), rush_events)
+        rows = attendance_rows(timeframe_id, rush_events, attendance, threshold)
+
+        # upserted in place, so check-ins never find the timeframe without rows
+        self.rushee_attendance_repo.replace_by_field("timeframe_id", timeframe_id, rows, key_field="rushee_id")
+        self._remember_attendance(timeframe_id, rush_events, attendance)
+        return {"timeframe_id": timeframe_id, "rushees": len(rows)}
+
+    def update_threshold_rules(self, timeframe_id: str, rules: Optional[dict]):
+        """Sets the threshold rules of a timeframe (None restores the defaults)."""
+        if rules is not None:
+            rules = validate_threshold_rules(rules)
+        try:
+            timeframe = self.event_timeframes_rush_repo.update(
+                id_value=timeframe_id, data={"threshold_rules": rules}
+            )
+        except Exception:
+            raise BadRequestError(GENERIC_CLIENT_ERROR)
 
-            # Get map of events (for quick lookups)
-            event_copy = event.copy()
-            event_copy.pop("rushees", None)
-            event_copy["num_attendees"] = len(event["rushees"])
+        self._refresh_attendance(timeframe_id)
+        return timeframe
 
-            rush_events_dict[event_id] = event_copy
+    def preview_threshold_rules(self, timeframe_id: str, rules: dict) -> dict:
+        """
+        Counts the rushees of a timeframe who would meet `rules`, without saving them.
 
-        # Track rushee event attendance
-        for rushee_id, rushee in rushee_dict.items():
-            events_attended = []
-            for event in rush_events:
-                event_id = event["id"]
-                event_rushees = event.get("rushees", [])
+        Uses the attendance kept by the last analytics (or preview) call on this
+        container, so trying out rules after opening the analytics only compiles the
+        rules into masks and tests each rushee's attendance against them.
+        """
+        rules = validate_threshold_rules(rules)
+        snapshot = self._attendance_snapshots.get(timeframe_id)
+        if snapshot is not None and snapshot[0] > time.monotonic():
+            _, rush_events, attendance = snapshot
+        else:
+            try:
+                rush_events = self.events_rush_repo.get_with_custom_select(
+                    filters={"timeframe_id": timeframe_id},
+                    select_query="id, name, date, rushees(id)",
+                )
+            except Exception:
+                raise BadRequestError(GENERIC_CLIENT_ERROR)
+            rush_events.sort(key=lambda e: e.get("date", ""))
+            attendance = attendance_masks(rush_events)
+            self._remember_attendance(timeframe_id, rush_events, attendance)
 
-                attended = False
-                if any(r.get("id") == rushee_id for r in event_rushees):
-                    attended = True
+        threshold = compile_threshold_rules(rules, rush_events)
+        return {
+            "rules": rules,
+            "rushees": len(attendance),
+            "passing": sum(1 for attended in attendance.values() if threshold.is_met(attended)),
+        }
 
-                events_attended.append({"id": event_id, "attended": attended})
+    def _get_rushee_attendance(self, timeframe_id: str) -> List[dict]:
+        # paged: a timeframe can have more rushees than PostgREST's `max_rows`
+        return list(
+            self.rushee_attendance_repo.iter_all(
+                select_query="rushee_id, attended_events, threshold, rushees(*)",
+                filters={"timeframe_id": timeframe_id},
+            )
+        )
 
-            rushee["events_attended"] = events_attended
-            rushee["threshold"] = is_rush_threshold_met(
-                events_attended=events_attended, events=rush_events_dict
+    def _record_checkin(self, event: dict, rushee_id: str):
+        """Updates the rushee's attendance row (`rushee_attendance`) after a check-in"""
+        timeframe_id = event["timeframe_id"]
+        try:
+            timeframe = self.event_timeframes_rush_repo.get_by_id(id_value=timeframe_id)
+            rush_events = self.events_rush_repo.get_with_custom_select(
+                filters={"timeframe_id": timeframe_id}
             )
-            rushee["num_events_attended"] = sum(
-                [e["attended"] for e in events_attended]
+            recorded = self.rushee_attendance_repo.rpc(
+                RECORD_CHECKIN_FUNCTION,
+                rush_checkin_params(
+                    timeframe_id, rushee_id, timeframe.get("threshold_rules"), rush_events
+                ),
+            )
+            if not recorded:
+                # no rows yet (e.g. the timeframe predates them): build the rows of every rushee
+                self.rebuild_rushee_attendance(timeframe_id)
+        except Exception as e:
+            # the check-in is saved; the attendance can be rebuilt from it
+            logger.error(
+                f"[EventsRushService._record_checkin] Failed to update the attendance of "
+                f"rushee {rushee_id} (rebuild with "
+                f"POST /events/rush/timeframe/{timeframe_id}/attendance/rebuild): {e}"
             )
 
-        return {
-            "timeframe": timeframe,
-            "rushees": rushee_dict,
-            "events": rush_events_dict,
+    def _refresh_attendance(self, timeframe_id: str):
+        """Rebuilds the timeframe's attendance after its events or rules changed"""
+        try:
+            self.rebuild_rushee_attendance(timeframe_id)
+        except Exception as e:
+            logger.error(
+                f"[EventsRushService._refresh_attendance] Failed to rebuild the attendance "
+                f"of timeframe {timeframe_id} (rebuild with "
+                f"POST /events/rush/timeframe/{timeframe_id}/attendance/rebuild): {e}"
+            )
+
+    def _remember_attendance(self, timeframe_id: str, rush_events: List[dict], attendance: Dict[str, int]):
+        events = [{"id": event["id"], "name": event["name"]} for event in rush_events]
+        self._attendance_snapshots[timeframe_id] = (
+            time.monotonic() + ATTENDANCE_SNAPSHOT_TTL_SECONDS,
+            events,
+            attendance,
+        )
+
+    def _forget_attendance(self, timeframe_id: str):
+        self._attendance_snapshots.pop(timeframe_id, None)
+
+
+def attendance_masks(rush_events: List[dict]) -> Dict[str, int]:
+    """
+    Collects, in one pass over rush events with their embedded `rushees`, a bitmask
+    per rushee of the events they attended (bit i set = attended the i-th event).
+    """
+    attendance: Dict[str, int] = {}
+    for position, event in enumerate(rush_events):
+        bit = 1 << position
+        for rushee in event.get("rushees", []):
+            attendance[rushee["id"]] = attendance.get(rushee["id"], 0) | bit
+    return attendance
+
+
+def summary_masks(rush_events: List[dict], attendance_rows: List[dict]) -> Dict[str, int]:
+    """
+    Turns `rushee_attendance` rows into the same bitmasks as `attendance_masks`
+    (bit i set = attended the i-th of `rush_events`); ids of events that are not in
+    `rush_events` are ignored.
+    """
+    positions = {event["id"]: position for position, event in enumerate(rush_events)}
+    attendance: Dict[str, int] = {}
+    for row in attendance_rows:
+        attended = 0
+        for event_id in row["attended_events"]:
+            if event_id in positions:
+                attended |= 1 << positions[event_id]
+        attendance[row["rushee_id"]] = attended
+    return attendance
+
+
+def attendance_rows(
+    timeframe_id: str,
+    rush_events: List[dict],
+    attendance: Dict[str, int],
+    threshold: CompiledThreshold,
+) -> List[dict]:
+    """Returns the `rushee_attendance` rows of a timeframe from its attendance masks."""
+    return [
+        {
+            "timeframe_id": timeframe_id,
+            "rushee_id": rushee_id,
+            "attended_events": [
+                event["id"] for position, event in enumerate(rush_events) if attended >> position & 1
+            ],
+            "num_events_attended": bin(attended).count("1"),
+            "threshold": threshold.is_met(attended),
         }
+        for rushee_id, attended in attendance.items()
+    ]
+
+
+def build_rush_analytics(
+    rush_events: List[dict],
+    threshold: Optional[CompiledThreshold] = None,
+    attendance: Optional[Dict[str, int]] = None,
+    rushees: Optional[Dict[str, dict]] = None,
+    thresholds: Optional[Dict[str, bool]] = None,
+) -> Tuple[Dict[str, dict], Dict[str, dict]]:
+    """
+    Builds the `rushees` and `events` of the timeframe analytics from rush events
+    (sorted by date) with their embedded `rushees`.
+
+    Attendance is read from bitmasks (see `attendance_masks`), so each lookup is a
+    bit test, `num_events_attended` is a popcount and the threshold is a couple of
+    bitwise operations against the compiled rules.
+
+    Args:
+        rush_events (List[dict]): The timeframe's events, sorted by date.
+        threshold (CompiledThreshold, optional): Compiled threshold rules; defaults
+            to `DEFAULT_THRESHOLD_RULES`.
+        attendance (Dict[str, int], optional): `attendance_masks(rush_events)`, if
+            already computed.
+        rushees (Dict[str, dict], optional): rushee id -> rushee, when `rush_events`
+            do not embed their `rushees` (e.g. read from `rushee_attendance`).
+        thresholds (Dict[str, bool], optional): rushee id -> stored threshold
+            status, used instead of testing `threshold`.
+
+    Returns:
+        Tuple[Dict[str, dict], Dict[str, dict]]: rushee id -> rushee (with
+        `events_attended`, `threshold` and `num_events_attended`), and
+        event id -> event (without `rushees`, with `num_attendees`).
+    """
+    if threshold is None and thresholds is None:
+        threshold = compile_threshold_rules(None, rush_events)
+    if attendance is None:
+        attendance = attendance_masks(rush_events)
+
+    if rushees is None:
+        rushee_dict = {}
+        for event in rush_events:
+            for rushee in event.get("rushees", []):
+                if rushee["id"] not in rushee_dict:
+                    rushee_dict[rushee["id"]] = rushee.copy()
+    else:
+        rushee_dict = {rushee_id: rushee.copy() for rushee_id, rushee in rushees.items()}
+
+    event_ids = [event["id"] for event in rush_events]
+    num_attendees = [0] * len(event_ids)
+    for rushee_id, rushee in rushee_dict.items():
+        attended = attendance[rushee_id]
+        events_attended = []
+        for position, event_id in enumerate(event_ids):
+            is_attended = bool(attended >> position & 1)
+            num_attendees[position] += is_attended
+            events_attended.append({"id": event_id, "attended": is_attended})
+        rushee["events_attended"] = events_attended
+        rushee["threshold"] = (
+            thresholds[rushee_id] if thresholds is not None else threshold.is_met(attended)
+        )
+        # popcount (int.bit_count needs Python 3.10)
+        rushee["num_events_attended"] = bin(attended).count("1")
+
+    rush_events_dict = {}
+    for position, event in enumerate(rush_events):
+        event_copy = event.copy()
+        event_copy.pop("rushees", None)
+        event_copy["num_attendees"] = num_attendees[position]
+        rush_events_dict[event["id"]] = event_copy
+
+    return rushee_dict, rush_events_dict
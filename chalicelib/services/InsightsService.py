@@ -4,31 +4,156 @@ from chalicelib.repositories.repository_factory import (
     RepositoryConfig,
 )
 from chalice.app import BadRequestError
-from typing import List
+from typing import Any, Callable, Dict, Iterator, List, Tuple
 from chalicelib.repositories.base_repository import BaseRepository
-from chalicelib.services.service_utils import resolve_repo
+from chalicelib.services.service_utils import parse_uuid, resolve_repo
+from chalicelib.utils.insight_stats import numeric_stats
+from chalicelib.utils.insights import (
+    APPLICATION_INSIGHT_COLUMNS,
+    LISTING_SUMMARY_FUNCTION,
+    aggregate_applications,
+    dashboard_from_aggregate,
+    most_common,
+)
+from chalice.app import NotFoundError
 from typing import Optional
 
 
 class InsightsService:
-    def __init__(self, applications_repo: Optional[BaseRepository] = None):
+    def __init__(
+        self,
+        applications_repo: Optional[BaseRepository] = None,
+        listing_insights_repo: Optional[BaseRepository] = None,
+        listings_repo: Optional[BaseRepository] = None,
+    ):
         self.applications_repo = resolve_repo(applications_repo, RepositoryFactory.applications)
+        self.listings_repo = resolve_repo(listings_repo, RepositoryFactory.listings)
+        self.listing_insights_repo = resolve_repo(listing_insights_repo, RepositoryFactory.listing_insights)
+
+    def get_insights_from_listing(self, id: str, response_format: str = "full"):
+        """
+        driver function of insights (returns `dashboard` and `distribution`; the numeric
+        `stats` are served by `get_listing_stats`)
+
+        `response_format="compact"` returns the applicants once, keyed by id, with
+        buckets that only list applicant ids (see `_get_compact_insights`)
+
+        `response_format="summary"` returns only the counts, grouped by Postgres
+        (see `_get_summary_insights`)
+        """
+        if response_format not in INSIGHTS_FORMATS:
+            raise BadRequestError(
+                f"format must be one of: {', '.join(INSIGHTS_FORMATS)}."
+            )
 
-    def get_insights_from_listing(self, id: str):
-        """driver function of insights (returns both `dashboard` and `distribution`)"""
         try:
+            if response_format == "summary":
+                return self._get_summary_insights(id)
+
             # fetch applicants from `get_applicants` endpoint in `db.py`
             data = self.applications_repo.get_all_by_field("listing_id", id)
 
             # call helper functions
             # NOTE: `get_dashboard_insights` updates the data object to ensure all majors/minors are Title() cased
             dashboard = self._get_dashboard_insights(data)
+            if response_format == "compact":
+                return {**self._get_compact_insights(dashboard, data), "stats": numeric_stats(data)}
             distribution = self._get_pie_chart_insights(data)
 
             return dashboard, distribution
         except Exception as e:
             raise BadRequestError("Failed to get insights")
 
+    def get_listing_dashboard(self, id: str) -> dict:
+        """
+        Returns the `dashboard` block from the listing's maintained aggregates
+        (`listing_insights`), reading one row instead of every application. The
+        aggregates are built on first use for listings that predate them; unknown
+        listings raise NotFoundError.
+        """
+        id = parse_uuid(id, "listing_id")
+        try:
+            aggregate = self.listing_insights_repo.get_by_id(id)
+        except NotFoundError:
+            self.listings_repo.get_by_id(id)  # raises NotFoundError for unknown listings
+            aggregate = self.rebuild_listing_aggregates(id)
+        return dashboard_from_aggregate(aggregate)
+
+    def get_listing_stats(self, id: str) -> dict:
+        """
+        Returns the numeric `stats` block (GPA and grad-year distributions) of the
+        listing, streaming only those two columns of its applications. Unknown
+        listings raise NotFoundError.
+        """
+        id = parse_uuid(id, "listing_id")
+        applications = list(
+            self.applications_repo.iter_all(select_query=STATS_COLUMNS, filters={"listing_id": id})
+        )
+        if not applications:
+            self.listings_repo.get_by_id(id)  # raises NotFoundError for unknown listings
+        return numeric_stats(applications)
+
+    def rebuild_listing_aggregates(self, id: str) -> dict:
+        """Recomputes the listing's `listing_insights` row from all of its applications."""
+        applications = self.applications_repo.iter_all(
+            select_query=APPLICATION_INSIGHT_COLUMNS,
+            filters={"listing_id": id},
+        )
+        aggregate = aggregate_applications(id, applications)
+        self.listing_insights_repo.upsert_many([aggregate], on_conflict="listing_id")
+        return aggregate
+
+    def compare_listings(self, listing_ids: List[str]) -> dict:
+        """
+        Insights of several listings side by side, from one streamed read of all of
+        their applications. Every series is aligned with `listings`: `dashboard` and
+        `stats` hold one entry per listing, and each `distribution` bucket holds one
+        count per listing (0 where a listing has no applicant in it).
+
+        Listing ids are returned in canonical UUID form; ids that are not UUIDs raise
+        BadRequestError and unknown listings raise NotFoundError.
+        """
+        listing_ids = list(dict.fromkeys(parse_uuid(listing_id, "listing_ids") for listing_id in listing_ids))
+        if not listing_ids:
+            raise BadRequestError("listing_ids must name at least one listing.")
+        if len(listing_ids) > MAX_COMPARED_LISTINGS:
+            raise BadRequestError(
+                f"At most {MAX_COMPARED_LISTINGS} listings can be compared at once."
+            )
+
+        missing = self.listings_repo.get_many_by_ids(listing_ids, select_query="id").missing
+        if missing:
+            raise NotFoundError(f"Listings not found: {', '.join(missing)}.")
+
+        # group the applications by listing as they are streamed in
+        applications = {listing_id: [] for listing_id in listing_ids}
+        for application in self.applications_repo.iter_all(
+            select_query=COMPARE_COLUMNS, filters={"listing_id": listing_ids}
+        ):
+            applications[str(application["listing_id"])].append(application)
+
+        dashboards, stats = [], []
+        distribution = {metric: {} for metric in DISTRIBUTION_FIELDS}
+        for position, listing_id in enumerate(listing_ids):
+            data = applications[listing_id]
+            # NOTE: title-cases majors/minors before they are bucketed
+            dashboards.append(self._get_dashboard_insights(data))
+            stats.append(numeric_stats(data))
+            for applicant in data:
+                for metric, name in iter_distribution_values(applicant):
+                    counts = distribution[metric].setdefault(name, [0] * len(listing_ids))
+                    counts[position] += 1
+
+        return {
+            "listings": listing_ids,
+            "dashboard": {key: [dashboard[key] for dashboard in dashboards] for key in dashboards[0]},
+            "distribution": {
+                metric: [{"name": name, "values": counts} for name, counts in buckets.items()]
+                for metric, buckets in distribution.items()
+            },
+            "stats": stats,
+        }
+
     # private method (kinda)
     def _get_dashboard_insights(self, data: List[dict]) -> dict:
         # initialize metrics
@@ -50,10 +175,11 @@ class InsightsService:
         for applicant in data:
             # convert major/minor to title case
             applicant["major"] = applicant["major"].title()
-            applicant["minor"] = applicant["minor"].title()
+            if applicant["minor"]:
+                applicant["minor"] = applicant["minor"].title()
 
             gpa = applicant.get("gpa", "")
-            grad_year = applicant.get("gradYear", "")
+            grad_year = applicant.get("grad_year", "")
             major = applicant.get("major", "")
 
             # attempt conversions (if fail, then skip)
@@ -61,13 +187,13 @@ class InsightsService:
                 float_gpa = float(gpa)
                 avg_gpa += float_gpa
                 count_gpa += 1
-            except ValueError:
+            except (TypeError, ValueError):
                 print("skipping gpa: ", gpa)
                 pass
             try:
                 float_grad = float(grad_year)
                 grad_years[float_grad] = grad_years.get(float_grad, 0) + 1
-            except ValueError:
+            except (TypeError, ValueError):
                 print("skipping gradYear: ", grad_year)
                 pass
 
@@ -80,20 +206,9 @@ class InsightsService:
         else:
             avg_gpa = "N/A"
 
-        # calculate most common major/gradYear
-        # Check if majors dictionary is not empty
-        if majors:
-            common_major, _ = max(majors.items(), key=lambda x: x[1])
-        else:
-            # Handle the case when majors dictionary is empty
-            common_major, _ = "N/A", 0
-
-        # Check if grad_years dictionary is not empty
-        if grad_years:
-            common_grad_year, _ = max(grad_years.items(), key=lambda x: x[1])
-        else:
-            # Handle the case when grad_years dictionary is empty
-            common_grad_year, _ = "N/A", 0
+        # calculate most common major/gradYear ("N/A" when there are none)
+        common_major = most_common(majors) if majors else "N/A"
+        common_grad_year = most_common(grad_years) if grad_years else "N/A"
 
         dashboard = {
             "applicantCount": num_applicants,
@@ -110,94 +225,136 @@ class InsightsService:
 
         return dashboard
 
+    def _get_compact_insights(self, dashboard: dict, data: List[dict]) -> dict:
+        """
+        Insights with every applicant serialized once: `applicants` maps id -> applicant
+        and the `distribution` buckets hold applicant ids instead of applicant objects
+        """
+        return {
+            "dashboard": dashboard,
+            "distribution": build_distribution(data, member=lambda applicant: applicant["id"]),
+            "applicants": {applicant["id"]: applicant for applicant in data},
+        }
+
+    def _get_summary_insights(self, id: str) -> dict:
+        """
+        Dashboard and bucket counts (without the applicant lists) computed by the
+        `listing_insights_summary` Postgres function, so no application row is sent
+        to the API. Buckets are sorted by count.
+        """
+        summary = self.applications_repo.rpc(LISTING_SUMMARY_FUNCTION, {"p_listing_id": id})
+        return {
+            "dashboard": summary["dashboard"],
+            # jsonb does not keep key order
+            "distribution": {metric: summary["distribution"][metric] for metric in DISTRIBUTION_FIELDS},
+        }
+
     def _get_pie_chart_insights(self, data):
         """helper function for pie charts (should be function, not method within InsightsService)"""
+        return build_distribution(data)
 
-        # initialize return object
-        # value (list) structure : [ {name: string, value: int, applicants: Applicant[]}, ... , ... ]
-        distribution = {
-            "colleges": [],
-            "gpa": [],
-            "gradYear": [],
-            "major": [],
-            "minor": [],
-            "linkedin": [],
-            "website": [],
-        }
 
-        # list of fields we want to consider
-        fields = [
-            "colleges",
-            "gpa",
-            "gradYear",
-            "major",
-            "minor",
-            "linkedin",
-            "website",
-        ]
-
-        def findInsightsObject(metric, metric_val):
-            """helper to the helper lol -> checks for previously added metric_name"""
-            # check if college exists in `distribution["colleges"]`
-            found_object = None
-
-            for distribution_object in distribution[metric]:
-                if distribution_object["name"] == metric_val:
-                    found_object = distribution_object
-                    break
-
-            return found_object
+# values of the `format` query parameter of `/insights/listing/{listing_id}`
+INSIGHTS_FORMATS = ("full", "compact", "summary")
 
-        for applicant in data:
-            # iterate over applicant dictionary
-            for metric, val in applicant.items():
-                # case 1: ignore irrelevant metrics
-                if metric not in fields:
-                    continue
-
-                # case 2: metric is a url
-                if metric in ["linkedin", "website"]:
-                    val = "N/A" if (not val or val == "N/A") else "hasURL"
-
-                # case 3: handle other metrics with mepty val (attempt to handle some edge cases)       # TO-DO: update Form.tsx in frontend to prevent bad inputs
-                elif metric in ["minor", "gpa"] and (
-                    not val or val.lower() in ["na", "n/a", "n a", "n / a"]
-                ):
-                    # general case
-                    val = "N/A"
-
-                # case 4: colleges -> iterate over colleges object
-                elif metric == "colleges":
-                    for college, status in val.items():
-                        # edge case: if status is false, skip (shouldn't contribute to count)
-                        if not status:
-                            continue
-
-                        # check if college exists in `distribution["colleges"]`
-                        found_college = findInsightsObject(metric, college)
-
-                        if found_college:
-                            found_college["value"] += 1
-                            found_college["applicants"] += [applicant]
-                        else:
-                            newCollege = {
-                                "name": college,
-                                "value": 1,
-                                "applicants": [applicant],
-                            }
-                            distribution[metric] += [newCollege]
-
-                        # skip to next metric
-                    continue
-
-                # handle remaining fields
-                found_object = findInsightsObject(metric, val)
-
-                if found_object:
-                    found_object["value"] += 1
-                    found_object["applicants"] += [applicant]
-                else:
-                    new_object = {"name": val, "value": 1, "applicants": [applicant]}
-                    distribution[metric] += [new_object]
-
-        return distribution
+# most listings `/insights/compare` accepts in one request
+MAX_COMPARED_LISTINGS = 10
+
+# application columns read by `compare_listings` (`id` orders the streamed pages)
+COMPARE_COLUMNS = "id, listing_id, gpa, grad_year, major, minor, colleges, linkedin, website"
+
+# columns read by `get_listing_stats`
+STATS_COLUMNS = "gpa, grad_year"
+
+# fields with a pie chart, in the order of the `distribution` response
+DISTRIBUTION_FIELDS = [
+    "colleges",
+    "gpa",
+    "gradYear",
+    "major",
+    "minor",
+    "linkedin",
+    "website",
+]
+
+# application columns of the fields whose name differs
+DISTRIBUTION_COLUMNS = {"gradYear": "grad_year"}
+
+# free-text spellings of "not applicable" (minor/gpa)       # TO-DO: update Form.tsx in frontend to prevent bad inputs
+EMPTY_VALUES = {"na", "n/a", "n a", "n / a"}
+
+
+_DISTRIBUTION_SOURCES = [
+    (metric, DISTRIBUTION_COLUMNS.get(metric, metric)) for metric in DISTRIBUTION_FIELDS
+]
+
+
+def iter_distribution_values(applicant: dict) -> Iterator[Tuple[str, Any]]:
+    """Yields the (metric, bucket name) pairs an applicant counts towards."""
+    for metric, column in _DISTRIBUTION_SOURCES:
+        if column not in applicant:
+            continue
+        val = applicant[column]
+
+        # case 1: metric is a url
+        if metric == "linkedin" or metric == "website":
+            yield metric, "N/A" if (not val or val == "N/A") else "hasURL"
+
+        # case 2: handle other metrics with empty val (attempt to handle some edge cases)
+        elif (metric == "minor" or metric == "gpa") and (
+            not val or str(val).lower() in EMPTY_VALUES
+        ):
+            yield metric, "N/A"
+
+        # case 3: colleges -> one bucket per college the applicant selected
+        elif metric == "colleges":
+            for college, status in (val or {}).items():
+                # edge case: if status is false, skip (shouldn't contribute to count)
+                if status:
+                    yield metric, college
+
+        else:
+            yield metric, val
+
+
+def build_distribution(
+    data: List[dict], member: Optional[Callable[[dict], Any]] = None
+) -> Dict[str, List[dict]]:
+    """
+    Groups applicants into the pie-chart buckets of every metric in one pass.
+
+    Buckets are looked up by name in a dict per metric (rather than scanned) and are
+    listed in the order their first applicant appears in `data`.
+
+    Args:
+        data (List[dict]): The applicants.
+        member (Callable, optional): Maps an applicant to what is stored in its
+            buckets' `applicants` lists; defaults to the applicant itself.
+
+    Returns:
+        Dict[str, List[dict]]: metric -> [{name, value, applicants}, ...]
+    """
+    distribution = {metric: [] for metric in DISTRIBUTION_FIELDS}
+    buckets = {metric: {} for metric in DISTRIBUTION_FIELDS}
+
+    for applicant in data:
+        entry = applicant if member is None else member(applicant)
+        for metric, name in iter_distribution_values(applicant):
+            try:
+                bucket = buckets[metric].get(name)
+            except TypeError:  # unhashable value: fall back to a scan
+                bucket = next((b for b in distribution[metric] if b["name"] == name), None)
+
+            if bucket:
+                bucket["value"] += 1
+                bucket["applicants"].append(entry)
+                continue
+
+            bucket = {"name": name, "value": 1, "applicants": [entry]}
+            distribution[metric].append(bucket)
+            try:
+                buckets[metric][name] = bucket
+            except TypeError:
+                pass
+
+    return distribution
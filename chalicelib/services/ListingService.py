@@ -9,6 +9,12 @@ from chalicelib.modules.ses import ses, SesDestination
 from datetime import datetime, timezone
 from dateutil import parser
 from chalicelib.utils.utils import get_file_extension_from_base64
+from chalicelib.utils.insights import (
+    APPLICATION_INSIGHT_COLUMNS,
+    RECORD_APPLICATION_FUNCTION,
+    aggregate_applications,
+    application_insight_params,
+)
 from chalicelib.s3 import s3
 import uuid
 import logging
@@ -23,10 +29,12 @@ class ListingService:
         listings_repo: Optional[BaseRepository] = None,
         applications_repo: Optional[BaseRepository] = None,
         event_timeframes_rush_repo: Optional[BaseRepository] = None,
+        listing_insights_repo: Optional[BaseRepository] = None,
     ):
         self.listings_repo = resolve_repo(listings_repo, RepositoryFactory.listings)
         self.applications_repo = resolve_repo(applications_repo, RepositoryFactory.applications)
         self.events_rush_repo = resolve_repo(event_timeframes_rush_repo, RepositoryFactory.event_timeframes_rush)
+        self.listing_insights_repo = resolve_repo(listing_insights_repo, RepositoryFactory.listing_insights)
 
     # TODO: prevent duplicate names... (also for rush-category)..
     def create(self, data: dict, include_events_attended: bool):
@@ -53,7 +61,10 @@ class ListingService:
         data = self.listings_repo.get_by_id(id_value=id)
         return data
 
-    def get_all(self):
+    def get_all(self, limit: Optional[int] = None, cursor: Optional[str] = None):
+        if limit is not None or cursor is not None:
+            return self.listings_repo.get_page(limit=limit, cursor=cursor).to_dict()
+
         data = self.listings_repo.get_all()
         return data
 
@@ -126,6 +137,7 @@ class ListingService:
 
         # Upload data to Supabase
         self.applications_repo.create(data=data)
+        self._record_application_insights(data)
 
         # Send confirmation email
         email_content = f"""
@@ -153,3 +165,28 @@ class ListingService:
         )
 
         return {"msg": True, "resumeUrl": resume_url}
+
+    def _record_application_insights(self, data: dict):
+        """Adds a new application to its listing's aggregate insights (`listing_insights`)"""
+        try:
+            recorded = self.listing_insights_repo.rpc(
+                RECORD_APPLICATION_FUNCTION, application_insight_params(data)
+            )
+            if not recorded:
+                # no aggregates yet (e.g. applications from before `listing_insights`):
+                # build them from every application of the listing, this one included
+                applications = self.applications_repo.iter_all(
+                    select_query=APPLICATION_INSIGHT_COLUMNS,
+                    filters={"listing_id": data["listing_id"]},
+                )
+                self.listing_insights_repo.upsert_many(
+                    [aggregate_applications(data["listing_id"], applications)],
+                    on_conflict="listing_id",
+                )
+        except Exception as e:
+            # the application is saved; the aggregates can be rebuilt from it
+            logger.error(
+                f"[ListingService._record_application_insights] Failed to update insights "
+                f"for listing {data['listing_id']} (rebuild with "
+                f"POST /insights/listing/{data['listing_id']}/rebuild): {e}"
+            )
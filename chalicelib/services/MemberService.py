@@ -3,12 +3,10 @@ from chalice.app import (
     NotFoundError,
     UnauthorizedError,
     BadRequestError,
-    CaseInsensitiveMapping,
 )
 from collections import defaultdict
-import jwt
-import boto3
 import uuid
+from chalicelib.request_context import get_current_principal
 from chalicelib.repositories.base_repository import BaseRepository
 from chalicelib.services.service_utils import resolve_repo
 from typing import Optional
@@ -55,13 +53,13 @@ class MemberService:
             base_roles = self.roles_repo.get_all()
             base_roles_map = {br["name"]: br["id"] for br in base_roles}
 
+            user_roles = []
             for role in roles:
                 role_id = base_roles_map.get(role)
                 if not role_id:
                     raise NotFoundError(f"Role {role} is not role")
-                self.user_roles_repo.create(
-                    {"user_id": user_id, "role_id": role_id}
-                )
+                user_roles.append({"user_id": user_id, "role_id": role_id})
+            self.user_roles_repo.create_many(user_roles)
 
             return {
                 "success": True,
@@ -92,8 +90,9 @@ class MemberService:
             if not data:
                 raise NotFoundError("No IDs provided to delete")
 
-            for user_id in data:
-                self.users_repo.delete(user_id)
+            result = self.users_repo.delete_many_by_ids(data)
+            if result.missing:
+                raise NotFoundError(f"Users not found: {result.missing}")
 
             return {
                 "success": True,
@@ -109,11 +108,15 @@ class MemberService:
         except Exception as e:
             raise BadRequestError(f"Failed to retrieve user")
 
-    def get_all(self):
+    def get_all(self, limit: Optional[int] = None, cursor: Optional[str] = None):
+        select_query = "*, user_roles: user_roles (role: roles (id,name))"
         try:
-            data = self.users_repo.get_all(
-                select_query="*, user_roles: user_roles (role: roles (id,name))"
-            )
+            if limit is not None or cursor is not None:
+                return self.users_repo.get_page(
+                    limit=limit, cursor=cursor, select_query=select_query
+                ).to_dict()
+
+            data = self.users_repo.get_all(select_query=select_query)
             return data
         except Exception as e:
             raise NotFoundError(f"Failed to retrieve users: {str(e)}")
@@ -127,25 +130,15 @@ class MemberService:
             raise BadRequestError(f"Failed to onboard user: {str(e)}")
 
     # TODO: test updates with frontend
-    def update(self, user_id: str, data: dict, headers: CaseInsensitiveMapping) -> bool:
+    def update(self, user_id: str, data: dict) -> bool:
         try:
-            ssm_client = boto3.client("ssm")
-            auth_header = headers.get("authorization", None)
-
-            if not auth_header:
-                raise UnauthorizedError("Authorization header is missing.")
+            # the token was already verified by `auth` for this request
+            principal = get_current_principal()
 
-            _, token = auth_header.split(" ", 1) if " " in auth_header else (None, None)
+            if principal is None:
+                raise UnauthorizedError("Request is not authenticated.")
 
-            if not token:
-                raise UnauthorizedError("Token is missing.")
-
-            auth_secret = ssm_client.get_parameter(
-                Name="/Zap/AUTH_SECRET", WithDecryption=True
-            )["Parameter"]["Value"]
-            decoded = jwt.decode(token, auth_secret, algorithms=["HS256"])
-
-            if user_id != decoded["_id"]:
+            if user_id != principal.user_id:
                 raise UnauthorizedError(
                     f"User {user_id} is not authorized to update this user."
                 )
@@ -165,18 +158,16 @@ class MemberService:
             # Get all roles
             base_roles = self.roles_repo.get_all()
 
-            # Clear previous roles for user
-            self.user_roles_repo.delete_by_field(field="user_id", value=user_id)
-
             # Convert roles to role_ids
             role_ids = [br["id"] for br in base_roles if br["name"] in roles]
 
             if len(roles) != len(role_ids):
                 raise BadRequestError("Invalid role name.")
 
-            # Add each new role to table
-            for rid in role_ids:
-                self.user_roles_repo.create({"user_id": user_id, "role_id": rid})
+            # Remove dropped roles and add new ones, leaving unchanged roles untouched
+            self.user_roles_repo.sync_relation(
+                owner_id=user_id, desired_ids=role_ids, related_field="role_id"
+            )
 
             return True
         except Exception as e:
@@ -1,17 +1,15 @@
 import requests
-from chalicelib.modules.aws_ssm import aws_ssm
+from chalicelib.config import get_settings
+from chalicelib.utils.lazy import LazyProvider
 import uuid
 
 
 class MonitoringService:
 
     def __init__(self):
-        try:
-            self.api_key = aws_ssm.get_parameter_value("/Vault/POSTHOG_API_KEY")
-            self.project_id = aws_ssm.get_parameter_value("/Vault/POSTHOG_PROJECT_ID")
-
-        except Exception as e:
-            print(e)
+        settings = get_settings()
+        self.api_key = settings.posthog_api_key
+        self.project_id = settings.posthog_project_id
 
     def get_top_10_visited_pages(self):
         """
@@ -103,4 +101,4 @@ class MonitoringService:
         return {"topWebsitePages": top_website_pages_result}
 
 
-monitoring_service = MonitoringService()
+monitoring_service = LazyProvider(MonitoringService, name="monitoring_service")
@@ -1,4 +1,6 @@
+import uuid
 from typing import Optional, Callable
+from chalice.app import BadRequestError
 from chalicelib.repositories.base_repository import BaseRepository
 from chalicelib.repositories.repository_factory import RepositoryFactory
 
@@ -7,3 +9,14 @@ def resolve_repo(
     provided: Optional[BaseRepository], factory_method: Callable[[], BaseRepository]
 ):
     return provided if provided is not None else factory_method()
+
+
+def parse_uuid(value: str, name: str = "id") -> str:
+    """
+    Returns `value` in the canonical form Postgres returns UUIDs in (lowercase,
+    hyphenated), or raises BadRequestError when it is not a UUID.
+    """
+    try:
+        return str(uuid.UUID(str(value).strip()))
+    except ValueError:
+        raise BadRequestError(f"{name} must be a UUID, got '{value}'.")
@@ -0,0 +1,83 @@
+import os
+import threading
+from concurrent.futures import FIRST_EXCEPTION, Future, ThreadPoolExecutor, wait
+from contextvars import ContextVar, copy_context
+from typing import Any, Callable, List, Optional
+
+# Threads shared by every fan-out in the process (override with FAN_OUT_MAX_WORKERS)
+FAN_OUT_MAX_WORKERS = int(os.environ.get("FAN_OUT_MAX_WORKERS", 8))
+
+# Seconds a fan-out may take before it is abandoned (override with FAN_OUT_DEADLINE_SECONDS)
+DEFAULT_FAN_OUT_DEADLINE_SECONDS = float(os.environ.get("FAN_OUT_DEADLINE_SECONDS", 10))
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+# Set while a call runs on the pool: nested fan-outs run inline instead of waiting
+# for threads of the pool they are holding
+_in_fan_out: ContextVar[bool] = ContextVar("in_fan_out", default=False)
+
+
+class FanOutTimeoutError(TimeoutError):
+    """Raised when the calls of a fan-out do not all finish before its deadline."""
+
+
+def fan_out(*calls: Callable[[], Any], deadline_seconds: Optional[float] = None) -> List[Any]:
+    """
+    Runs independent calls (e.g. repository reads of one request) in parallel on a
+    bounded, process-wide thread pool and returns their results in call order.
+
+    Each call runs in a copy of the caller's context, so the request scope (identity
+    map, query trace) and the current principal are those of the request.
+
+    Args:
+        *calls (Callable[[], Any]): Calls that do not depend on each other.
+        deadline_seconds (float, optional): Time allowed for all of the calls;
+            defaults to `DEFAULT_FAN_OUT_DEADLINE_SECONDS`.
+
+    Raises:
+        Exception: The error of the first call to fail, without waiting for the
+            others; calls that have not started are cancelled.
+        FanOutTimeoutError: If the calls did not all finish before the deadline.
+            Calls that are already running cannot be interrupted and finish in the
+            background.
+
+    Returns:
+        List[Any]: The result of each call, in the order of `calls`.
+    """
+    if len(calls) <= 1 or FAN_OUT_MAX_WORKERS <= 1 or _in_fan_out.get():
+        return [call() for call in calls]
+
+    if deadline_seconds is None:
+        deadline_seconds = DEFAULT_FAN_OUT_DEADLINE_SECONDS
+
+    executor = _get_executor()
+    futures: List[Future] = [executor.submit(copy_context().run, _run, call) for call in calls]
+    done, pending = wait(futures, timeout=deadline_seconds, return_when=FIRST_EXCEPTION)
+
+    failed = [future for future in futures if future in done and future.exception() is not None]
+    if failed or pending:
+        for future in pending:
+            future.cancel()
+        if failed:
+            raise failed[0].exception()
+        raise FanOutTimeoutError(
+            f"{len(pending)} of {len(calls)} calls did not finish within {deadline_seconds}s."
+        )
+
+    return [future.result() for future in futures]
+
+
+def _run(call: Callable[[], Any]) -> Any:
+    _in_fan_out.set(True)
+    return call()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=FAN_OUT_MAX_WORKERS, thread_name_prefix="fan_out"
+            )
+        return _executor
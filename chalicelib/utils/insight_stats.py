@@ -0,0 +1,126 @@
+import math
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from chalicelib.utils.insights import GPA_BUCKET_WIDTH, gpa_bucket_index
+
+# Decimal places of every statistic in the `stats` block
+STATS_PRECISION = 2
+
+# GPAs outside this range (e.g. a mistyped "350") are left out of the histogram,
+# which lists every bucket between its lowest and highest GPA
+HISTOGRAM_GPA_RANGE = (0.0, 5.0)
+
+# Grad years further than this from the current year are left out of the spread
+SPREAD_GRAD_YEAR_WINDOW = 10
+
+
+def numeric_column(rows: Iterable[Dict], column: str) -> array:
+    """
+    Parses `column` of every row into a sorted array of floats in one pass. Values
+    that are missing, non-numeric (e.g. "N/A") or not finite are left out.
+    """
+    values = array("d")
+    for row in rows:
+        value = row.get(column)
+        if value is None or isinstance(value, bool):
+            continue
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            continue
+        if math.isfinite(number):
+            values.append(number)
+    return array("d", sorted(values))
+
+
+def quantile(values: array, q: float) -> float:
+    """Returns the q-th quantile of sorted, non-empty `values`, interpolating linearly between ranks."""
+    position = (len(values) - 1) * q
+    lower = math.floor(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+def describe(values: array) -> Dict[str, Union[int, float, str]]:
+    """Count, mean, population standard deviation, min, quartiles and max of sorted `values`."""
+    if not values:
+        return {"count": 0, **{key: "N/A" for key in ("mean", "stdev", "min", "q1", "median", "q3", "max")}}
+
+    count = len(values)
+    mean = math.fsum(values) / count
+    variance = math.fsum((value - mean) ** 2 for value in values) / count
+    return {
+        "count": count,
+        "mean": round(mean, STATS_PRECISION),
+        "stdev": round(math.sqrt(variance), STATS_PRECISION),
+        "min": values[0],
+        "q1": round(quantile(values, 0.25), STATS_PRECISION),
+        "median": round(quantile(values, 0.5), STATS_PRECISION),
+        "q3": round(quantile(values, 0.75), STATS_PRECISION),
+        "max": values[-1],
+    }
+
+
+def within(values: array, low: float, high: float) -> array:
+    """Returns the values of sorted `values` between `low` and `high` (both included)."""
+    return values[bisect_left(values, low) : bisect_right(values, high)]
+
+
+def gpa_histogram(gpas: array) -> List[Dict[str, Any]]:
+    """
+    Counts sorted `gpas` per `GPA_BUCKET_WIDTH` bucket (the buckets of
+    `listing_insights.gpa_buckets`), listing every bucket from the lowest to the
+    highest GPA, empty ones included. GPAs outside `HISTOGRAM_GPA_RANGE` are not
+    counted.
+    """
+    gpas = within(gpas, *HISTOGRAM_GPA_RANGE)
+    if not gpas:
+        return []
+
+    first, last = gpa_bucket_index(gpas[0]), gpa_bucket_index(gpas[-1])
+    counts = [0] * (last - first + 1)
+    for gpa in gpas:
+        counts[gpa_bucket_index(gpa) - first] += 1
+
+    return [
+        {"bucket": f"{(first + index) * GPA_BUCKET_WIDTH:.1f}", "count": count}
+        for index, count in enumerate(counts)
+    ]
+
+
+def grad_year_spread(grad_years: array, current_year: Optional[int] = None) -> List[Dict[str, int]]:
+    """
+    Counts sorted `grad_years` per year, from the earliest to the latest year. Years
+    more than `SPREAD_GRAD_YEAR_WINDOW` years from `current_year` (this year by
+    default) are not counted.
+    """
+    if current_year is None:
+        current_year = datetime.now(timezone.utc).year
+    grad_years = within(
+        grad_years, current_year - SPREAD_GRAD_YEAR_WINDOW, current_year + SPREAD_GRAD_YEAR_WINDOW
+    )
+    if not grad_years:
+        return []
+
+    first, last = int(grad_years[0]), int(grad_years[-1])
+    counts = [0] * (last - first + 1)
+    for grad_year in grad_years:
+        counts[int(grad_year) - first] += 1
+
+    return [{"year": first + index, "count": count} for index, count in enumerate(counts)]
+
+
+def numeric_stats(applications: List[Dict]) -> Dict[str, Any]:
+    """
+    Returns the `stats` block of the listing insights: the distribution of the GPA
+    and grad-year columns of `applications` (which may span several listings).
+    """
+    gpas = numeric_column(applications, "gpa")
+    grad_years = numeric_column(applications, "grad_year")
+    return {
+        "gpa": {**describe(gpas), "histogram": gpa_histogram(gpas)},
+        "gradYear": {**describe(grad_years), "spread": grad_year_spread(grad_years)},
+    }
@@ -0,0 +1,134 @@
+import math
+from typing import Any, Dict, Iterable, Optional
+
+# Postgres function that adds one application to its listing's `listing_insights` row
+RECORD_APPLICATION_FUNCTION = "record_listing_application"
+
+# Postgres function that groups a listing's applications into the `summary` insights
+LISTING_SUMMARY_FUNCTION = "listing_insights_summary"
+
+# Application columns read to build a listing's `listing_insights` row
+APPLICATION_INSIGHT_COLUMNS = "id, listing_id, major, grad_year, gpa, colleges"
+
+# Width of the GPA buckets counted in `listing_insights.gpa_buckets`
+GPA_BUCKET_WIDTH = 0.1
+
+EMPTY_DASHBOARD = {
+    "applicantCount": 0,
+    "avgGpa": "N/A",
+    "commonMajor": "N/A",
+    "commonGradYear": "N/A",
+}
+
+
+def gpa_bucket_index(gpa: float) -> int:
+    """Returns the position of the bucket a GPA is counted in (e.g. 3.47 -> 34)."""
+    return math.floor(round(gpa / GPA_BUCKET_WIDTH, 6))
+
+
+def gpa_bucket(gpa: Optional[float]) -> Optional[str]:
+    """Returns the bucket a GPA is counted in (e.g. 3.47 -> "3.4"), or None without a GPA."""
+    if gpa is None:
+        return None
+    return f"{gpa_bucket_index(gpa) * GPA_BUCKET_WIDTH:.1f}"
+
+
+def application_insight_params(application: Dict) -> Dict[str, Any]:
+    """
+    Returns the arguments of `record_listing_application` for a new application:
+    the keys it is counted under in each of its listing's aggregate counters.
+    """
+    gpa = application.get("gpa")
+    try:
+        gpa = float(gpa) if gpa is not None else None
+    except (TypeError, ValueError):
+        gpa = None
+
+    major = application.get("major")
+    grad_year = application.get("grad_year")
+    return {
+        "p_listing_id": str(application["listing_id"]),
+        "p_major": major.title() if major else None,
+        "p_grad_year": str(grad_year) if grad_year is not None else None,
+        "p_gpa": gpa,
+        "p_gpa_bucket": gpa_bucket(gpa),
+        "p_colleges": [
+            college for college, selected in (application.get("colleges") or {}).items() if selected
+        ],
+    }
+
+
+def empty_listing_insights(listing_id: str) -> Dict[str, Any]:
+    return {
+        "listing_id": listing_id,
+        "applicant_count": 0,
+        "gpa_sum": 0.0,
+        "gpa_count": 0,
+        "majors": {},
+        "grad_years": {},
+        "colleges": {},
+        "gpa_buckets": {},
+    }
+
+
+def add_application(aggregate: Dict[str, Any], params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Adds one application (as returned by `application_insight_params`) to a
+    `listing_insights` row. Mirrors the SQL function `record_listing_application`.
+    """
+    aggregate["applicant_count"] += 1
+    if params["p_gpa"] is not None:
+        aggregate["gpa_sum"] += params["p_gpa"]
+        aggregate["gpa_count"] += 1
+
+    _increment(aggregate["majors"], params["p_major"])
+    _increment(aggregate["grad_years"], params["p_grad_year"])
+    _increment(aggregate["gpa_buckets"], params["p_gpa_bucket"])
+    for college in params["p_colleges"] or []:
+        _increment(aggregate["colleges"], college)
+    return aggregate
+
+
+def aggregate_applications(listing_id: str, applications: Iterable[Dict]) -> Dict[str, Any]:
+    """Builds a listing's `listing_insights` row from all of its applications."""
+    aggregate = empty_listing_insights(listing_id)
+    for application in applications:
+        add_application(aggregate, application_insight_params(application))
+    return aggregate
+
+
+def dashboard_from_aggregate(aggregate: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Returns the `dashboard` block of the listing insights from its aggregate row,
+    without reading any application.
+    """
+    if not aggregate or not aggregate["applicant_count"]:
+        return dict(EMPTY_DASHBOARD)
+
+    gpa_count = aggregate["gpa_count"]
+    common_major = most_common(aggregate["majors"])
+    common_grad_year = most_common(aggregate["grad_years"])
+
+    return {
+        "applicantCount": aggregate["applicant_count"],
+        "avgGpa": round(aggregate["gpa_sum"] / gpa_count, 1) if gpa_count else "N/A",
+        "commonMajor": common_major.title() if common_major else "N/A",
+        "commonGradYear": int(common_grad_year) if common_grad_year else "N/A",
+    }
+
+
+def _increment(counts: Dict[str, int], key: Optional[str]):
+    if key is not None:
+        counts[key] = counts.get(key, 0) + 1
+
+
+def most_common(counts: Dict[Any, int]) -> Optional[Any]:
+    """
+    Returns the key with the highest count, or None without keys. Ties go to the
+    smallest key (the first major in code point order, the earliest grad year):
+    the one rule every dashboard uses (full, aggregate and `listing_insights_summary`),
+    since the aggregate counts do not record which application came first.
+    """
+    if not counts:
+        return None
+    return min(counts, key=lambda key: (-counts[key], key))
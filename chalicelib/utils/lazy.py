@@ -0,0 +1,77 @@
+import threading
+import time
+import weakref
+from typing import Any, Callable, List, Optional
+
+# Weak references to every provider created in this process (used by cold-start
+# benchmarks and warm-up); providers that are no longer referenced drop out.
+_providers: List["weakref.ref[LazyProvider]"] = []
+_providers_lock = threading.Lock()
+
+
+class LazyProvider:
+    """
+    Stand-in for a module-level singleton that is only built on first use.
+
+    Attribute access is forwarded to the underlying instance, so call sites keep
+    using the singleton as before (e.g. `s3.upload_binary_data(...)`) while the
+    import itself no longer creates AWS clients or performs network I/O. The
+    provider's own members are `_lazy_` prefixed so that they never hide an
+    attribute of the instance (e.g. `ListingService.get`).
+    """
+
+    def __init__(self, factory: Callable[[], Any], name: Optional[str] = None):
+        object.__setattr__(self, "_lazy_factory", factory)
+        object.__setattr__(self, "_lazy_name", name or getattr(factory, "__name__", "lazy"))
+        object.__setattr__(self, "_lazy_instance", None)
+        object.__setattr__(self, "_lazy_lock", threading.RLock())
+        object.__setattr__(self, "_lazy_init_seconds", None)
+        with _providers_lock:
+            _providers.append(weakref.ref(self))
+
+    @property
+    def _lazy_initialized(self) -> bool:
+        return self._lazy_instance is not None
+
+    def _lazy_get(self) -> Any:
+        """Returns the underlying instance, building it on first call."""
+        instance = self._lazy_instance
+        if instance is None:
+            with self._lazy_lock:
+                instance = self._lazy_instance
+                if instance is None:
+                    start = time.perf_counter()
+                    instance = self._lazy_factory()
+                    object.__setattr__(
+                        self, "_lazy_init_seconds", time.perf_counter() - start
+                    )
+                    object.__setattr__(self, "_lazy_instance", instance)
+        return instance
+
+    def _lazy_reset(self):
+        """Drops the built instance so the next access rebuilds it (for testing)."""
+        with self._lazy_lock:
+            object.__setattr__(self, "_lazy_instance", None)
+            object.__setattr__(self, "_lazy_init_seconds", None)
+
+    def __getattr__(self, attr: str) -> Any:
+        # only called for attributes not found on the provider itself
+        return getattr(self._lazy_get(), attr)
+
+    def __setattr__(self, attr: str, value: Any):
+        setattr(self._lazy_get(), attr, value)
+
+    def __delattr__(self, attr: str):
+        delattr(self._lazy_get(), attr)
+
+    def __repr__(self) -> str:
+        state = "initialized" if self._lazy_initialized else "pending"
+        return f"<LazyProvider {self._lazy_name} ({state})>"
+
+
+def registered_providers() -> List[LazyProvider]:
+    """Returns every lazy provider that is still alive, in creation order."""
+    with _providers_lock:
+        _providers[:] = [ref for ref in _providers if ref() is not None]
+        providers = [ref() for ref in _providers]
+    return [provider for provider in providers if provider is not None]
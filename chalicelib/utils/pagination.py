@@ -0,0 +1,71 @@
+import base64
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+from chalice.app import BadRequestError
+
+# Matches `max_rows` in supabase/config.toml: PostgREST never returns more rows per request
+MAX_PAGE_SIZE = 1000
+
+
+@dataclass
+class Page:
+    """One page of a keyset-paginated read."""
+
+    items: List[Dict] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        return {"items": self.items, "next_cursor": self.next_cursor}
+
+
+def encode_cursor(last_key: Any) -> str:
+    """Encodes the key of the last row of a page into an opaque cursor."""
+    payload = json.dumps({"after": last_key}).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Any:
+    """
+    Decodes a cursor produced by `encode_cursor`.
+
+    Raises:
+        BadRequestError: If the cursor is malformed.
+    """
+    try:
+        return json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))["after"]
+    except Exception:
+        raise BadRequestError("Invalid cursor.")
+
+
+def get_page_params(
+    query_params: Optional[Dict[str, str]],
+) -> Tuple[Optional[int], Optional[str]]:
+    """
+    Reads the `limit` and `cursor` query parameters of a paginated route.
+
+    Returns:
+        Tuple[Optional[int], Optional[str]]: The page size (capped at MAX_PAGE_SIZE) and
+        cursor, both None when the client did not ask for pagination.
+
+    Raises:
+        BadRequestError: If `limit` is not a positive integer or `cursor` is malformed.
+    """
+    query_params = query_params or {}
+    limit, cursor = query_params.get("limit"), query_params.get("cursor")
+
+    if limit is not None:
+        try:
+            limit = int(limit)
+        except ValueError:
+            raise BadRequestError("limit must be a positive integer.")
+        if limit < 1:
+            raise BadRequestError("limit must be a positive integer.")
+        limit = min(limit, MAX_PAGE_SIZE)
+    elif cursor is not None:
+        limit = MAX_PAGE_SIZE
+
+    if cursor is not None:
+        decode_cursor(cursor)  # reject malformed cursors before any query runs
+
+    return limit, cursor
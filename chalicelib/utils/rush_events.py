@@ -1,25 +1,114 @@
-# TODO: eventually this should be configurable in by admins for each rush-timeframe (to prevent "false-negative" thresholds)
-mandatory_events = ["Info Session 1", "Info Session 2"]
-remaining_events = ["Professional Panel", "Resume Night", "Social Event"]
-minimum_remaining_events = 2
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
 
+from chalice.app import BadRequestError
 
-def is_rush_threshold_met(events_attended: list[dict], events: dict) -> bool:
+# Postgres function that adds a check-in to the rushee's `rushee_attendance` row
+RECORD_CHECKIN_FUNCTION = "record_rush_checkin"
+
+# Postgres function that returns a listing's applications with their rush attendance
+LISTING_APPLICANTS_FUNCTION = "listing_applicants_with_rush"
+
+# Threshold of rush timeframes whose `threshold_rules` are not set
+DEFAULT_THRESHOLD_RULES = {
+    "mandatory_events": ["Info Session 1", "Info Session 2"],
+    "minimum_mandatory_events": 1,
+    "remaining_events": ["Professional Panel", "Resume Night", "Social Event"],
+    "minimum_remaining_events": 2,
+}
+
+
+def validate_threshold_rules(rules: Any) -> Dict[str, Any]:
+    """
+    Checks threshold rules (e.g. from `event_timeframes_rush.threshold_rules`) and
+    fills in the defaults of missing keys.
+
+    Raises:
+        BadRequestError: If the rules are not shaped like `DEFAULT_THRESHOLD_RULES`.
+    """
+    if not isinstance(rules, dict):
+        raise BadRequestError("Threshold rules must be an object.")
+    unknown = set(rules) - set(DEFAULT_THRESHOLD_RULES)
+    if unknown:
+        raise BadRequestError(f"Unknown threshold rules: {', '.join(sorted(unknown))}.")
+
+    rules = {**DEFAULT_THRESHOLD_RULES, **rules}
+    for key in ("mandatory_events", "remaining_events"):
+        if not isinstance(rules[key], list) or not all(isinstance(name, str) for name in rules[key]):
+            raise BadRequestError(f"{key} must be a list of event names.")
+    for key in ("minimum_mandatory_events", "minimum_remaining_events"):
+        if isinstance(rules[key], bool) or not isinstance(rules[key], int) or rules[key] < 0:
+            raise BadRequestError(f"{key} must be a non-negative integer.")
+    return rules
+
+
+@dataclass(frozen=True)
+class CompiledThreshold:
+    """
+    Threshold rules resolved against the events of one timeframe: bit i of a mask
+    is set when the i-th event (in analytics order) counts towards the rule.
     """
-    Determine if rushee has attended enough events to apply.
+
+    mandatory_mask: int
+    minimum_mandatory_events: int
+    remaining_mask: int
+    minimum_remaining_events: int
+
+    def is_met(self, attended: int) -> bool:
+        """Whether a rushee who attended the events set in `attended` may apply."""
+        return (
+            bin(attended & self.mandatory_mask).count("1") >= self.minimum_mandatory_events
+            and bin(attended & self.remaining_mask).count("1") >= self.minimum_remaining_events
+        )
+
+
+def compile_threshold_rules(rules: Optional[Dict[str, Any]], events: List[dict]) -> CompiledThreshold:
+    """
+    Compiles threshold rules (the defaults when None) into event bitmasks.
 
     Args:
-        events_attended (list[dict]): list of dicts with 'id' and 'attended' keys
-        events (dict): dict of event_id -> event object
+        rules (dict, optional): Threshold rules, see `DEFAULT_THRESHOLD_RULES`.
+        events (list[dict]): The timeframe's events, in the order of the attendance bits.
 
     Returns:
-        bool: True if attended at least 1 mandatory and 2 remaining events
+        CompiledThreshold: The rules as masks over `events`.
     """
-    # Get names of attended events
-    attended_names = [
-        events[ea["id"]]["name"] for ea in events_attended if ea.get("attended")
-    ]
+    rules = validate_threshold_rules(DEFAULT_THRESHOLD_RULES if rules is None else rules)
+    mandatory, remaining = set(rules["mandatory_events"]), set(rules["remaining_events"])
 
-    has_attended_mandatory = any(name in mandatory_events for name in attended_names)
-    attended_remaining = sum(1 for name in attended_names if name in remaining_events)
-    return has_attended_mandatory and attended_remaining >= minimum_remaining_events
+    mandatory_mask = remaining_mask = 0
+    for position, event in enumerate(events):
+        if event["name"] in mandatory:
+            mandatory_mask |= 1 << position
+        if event["name"] in remaining:
+            remaining_mask |= 1 << position
+
+    return CompiledThreshold(
+        mandatory_mask=mandatory_mask,
+        minimum_mandatory_events=rules["minimum_mandatory_events"],
+        remaining_mask=remaining_mask,
+        minimum_remaining_events=rules["minimum_remaining_events"],
+    )
+
+
+def rush_checkin_params(
+    timeframe_id: str,
+    rushee_id: str,
+    rules: Optional[Dict[str, Any]],
+    events: List[dict],
+) -> Dict[str, Any]:
+    """
+    Returns the arguments of `record_rush_checkin` for a check-in: the rushee, and
+    the threshold rules (the defaults when None) resolved to the ids of the
+    timeframe's `events`.
+    """
+    rules = validate_threshold_rules(DEFAULT_THRESHOLD_RULES if rules is None else rules)
+    mandatory, remaining = set(rules["mandatory_events"]), set(rules["remaining_events"])
+    return {
+        "p_timeframe_id": str(timeframe_id),
+        "p_rushee_id": str(rushee_id),
+        "p_mandatory_events": [event["id"] for event in events if event["name"] in mandatory],
+        "p_minimum_mandatory_events": rules["minimum_mandatory_events"],
+        "p_remaining_events": [event["id"] for event in events if event["name"] in remaining],
+        "p_minimum_remaining_events": rules["minimum_remaining_events"],
+    }
@@ -0,0 +1,116 @@
+create table "public"."listing_insights" (
+    "listing_id" uuid not null,
+    "applicant_count" integer not null default 0,
+    "gpa_sum" double precision not null default 0,
+    "gpa_count" integer not null default 0,
+    "majors" jsonb not null default '{}'::jsonb,
+    "grad_years" jsonb not null default '{}'::jsonb,
+    "colleges" jsonb not null default '{}'::jsonb,
+    "gpa_buckets" jsonb not null default '{}'::jsonb,
+    "updated_at" timestamp with time zone not null default now()
+);
+
+
+CREATE UNIQUE INDEX listing_insights_pkey ON public.listing_insights USING btree (listing_id);
+
+alter table "public"."listing_insights" add constraint "listing_insights_pkey" PRIMARY KEY using index "listing_insights_pkey";
+
+alter table "public"."listing_insights" add constraint "listing_insights_listing_id_fkey" FOREIGN KEY (listing_id) REFERENCES listings(id) ON DELETE CASCADE not valid;
+
+alter table "public"."listing_insights" validate constraint "listing_insights_listing_id_fkey";
+
+set check_function_bodies = off;
+
+CREATE OR REPLACE FUNCTION public.jsonb_increment(counts jsonb, key text)
+ RETURNS jsonb
+ LANGUAGE sql
+ IMMUTABLE
+AS $function$
+    SELECT CASE
+        WHEN key IS NULL THEN counts
+        ELSE counts || jsonb_build_object(key, coalesce((counts ->> key)::integer, 0) + 1)
+    END
+$function$
+;
+
+CREATE OR REPLACE FUNCTION public.record_listing_application(p_listing_id uuid, p_major text, p_grad_year text, p_gpa double precision, p_gpa_bucket text, p_colleges text[])
+ RETURNS boolean
+ LANGUAGE plpgsql
+AS $function$
+DECLARE
+    agg listing_insights;
+    college text;
+BEGIN
+    SELECT * INTO agg FROM listing_insights WHERE listing_id = p_listing_id FOR UPDATE;
+    IF NOT FOUND THEN
+        RETURN false;
+    END IF;
+
+    agg.applicant_count := agg.applicant_count + 1;
+    IF p_gpa IS NOT NULL THEN
+        agg.gpa_sum := agg.gpa_sum + p_gpa;
+        agg.gpa_count := agg.gpa_count + 1;
+    END IF;
+    agg.majors := jsonb_increment(agg.majors, p_major);
+    agg.grad_years := jsonb_increment(agg.grad_years, p_grad_year);
+    agg.gpa_buckets := jsonb_increment(agg.gpa_buckets, p_gpa_bucket);
+    FOREACH college IN ARRAY coalesce(p_colleges, '{}'::text[]) LOOP
+        agg.colleges := jsonb_increment(agg.colleges, college);
+    END LOOP;
+
+    UPDATE listing_insights
+    SET applicant_count = agg.applicant_count,
+        gpa_sum = agg.gpa_sum,
+        gpa_count = agg.gpa_count,
+        majors = agg.majors,
+        grad_years = agg.grad_years,
+        colleges = agg.colleges,
+        gpa_buckets = agg.gpa_buckets,
+        updated_at = now()
+    WHERE listing_id = p_listing_id;
+    RETURN true;
+END
+$function$
+;
+
+grant delete on table "public"."listing_insights" to "anon";
+
+grant insert on table "public"."listing_insights" to "anon";
+
+grant references on table "public"."listing_insights" to "anon";
+
+grant select on table "public"."listing_insights" to "anon";
+
+grant trigger on table "public"."listing_insights" to "anon";
+
+grant truncate on table "public"."listing_insights" to "anon";
+
+grant update on table "public"."listing_insights" to "anon";
+
+grant delete on table "public"."listing_insights" to "authenticated";
+
+grant insert on table "public"."listing_insights" to "authenticated";
+
+grant references on table "public"."listing_insights" to "authenticated";
+
+grant select on table "public"."listing_insights" to "authenticated";
+
+grant trigger on table "public"."listing_insights" to "authenticated";
+
+grant truncate on table "public"."listing_insights" to "authenticated";
+
+grant update on table "public"."listing_insights" to "authenticated";
+
+grant delete on table "public"."listing_insights" to "service_role";
+
+grant insert on table "public"."listing_insights" to "service_role";
+
+grant references on table "public"."listing_insights" to "service_role";
+
+grant select on table "public"."listing_insights" to "service_role";
+
+grant trigger on table "public"."listing_insights" to "service_role";
+
+grant truncate on table "public"."listing_insights" to "service_role";
+
+grant update on table "public"."listing_insights" to "service_role";
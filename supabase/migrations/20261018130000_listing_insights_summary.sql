@@ -0,0 +1,71 @@
+set check_function_bodies = off;
+
+CREATE OR REPLACE FUNCTION public.listing_insights_summary(p_listing_id uuid)
+ RETURNS jsonb
+ LANGUAGE sql
+ STABLE
+AS $function$
+    WITH
+        apps AS (
+            SELECT * FROM applications WHERE listing_id = p_listing_id
+        ),
+        buckets AS (
+            SELECT 'colleges' AS metric, to_jsonb(college.key) AS name, count(*) AS value
+            FROM apps, jsonb_each(coalesce(apps.colleges, '{}')) AS college
+            WHERE college.value = 'true'::jsonb
+            GROUP BY 2
+            UNION ALL
+            SELECT 'gpa', CASE WHEN coalesce(gpa, 0) = 0 THEN '"N/A"'::jsonb ELSE to_jsonb(gpa) END, count(*)
+            FROM apps GROUP BY 2
+            UNION ALL
+            SELECT 'gradYear', to_jsonb(grad_year), count(*)
+            FROM apps GROUP BY 2
+            UNION ALL
+            SELECT 'major', to_jsonb(initcap(major)), count(*)
+            FROM apps GROUP BY 2
+            UNION ALL
+            SELECT 'minor',
+                CASE
+                    WHEN coalesce(minor, '') = '' OR lower(minor) IN ('na', 'n/a', 'n a', 'n / a') THEN '"N/A"'::jsonb
+                    ELSE to_jsonb(initcap(minor))
+                END,
+                count(*)
+            FROM apps GROUP BY 2
+            UNION ALL
+            SELECT 'linkedin', to_jsonb(CASE WHEN coalesce(linkedin, '') IN ('', 'N/A') THEN 'N/A' ELSE 'hasURL' END), count(*)
+            FROM apps GROUP BY 2
+            UNION ALL
+            SELECT 'website', to_jsonb(CASE WHEN coalesce(website, '') IN ('', 'N/A') THEN 'N/A' ELSE 'hasURL' END), count(*)
+            FROM apps GROUP BY 2
+        ),
+        distribution AS (
+            SELECT metric, jsonb_agg(jsonb_build_object('name', name, 'value', value) ORDER BY value DESC, name) AS buckets
+            FROM buckets GROUP BY metric
+        ),
+        totals AS (
+            SELECT count(*) AS applicant_count, round(avg(gpa)::numeric, 1) AS avg_gpa FROM apps
+        ),
+        common_major AS (
+            SELECT initcap(major) AS major FROM apps WHERE major <> ''
+            GROUP BY 1 ORDER BY count(*) DESC, initcap(major) COLLATE "C" LIMIT 1
+        ),
+        common_grad_year AS (
+            SELECT grad_year FROM apps
+            GROUP BY 1 ORDER BY count(*) DESC, grad_year LIMIT 1
+        )
+    SELECT jsonb_build_object(
+        'dashboard', jsonb_build_object(
+            'applicantCount', totals.applicant_count,
+            'avgGpa', coalesce(to_jsonb(totals.avg_gpa), '"N/A"'),
+            'commonMajor', coalesce((SELECT to_jsonb(major) FROM common_major), '"N/A"'),
+            'commonGradYear', coalesce((SELECT to_jsonb(grad_year) FROM common_grad_year), '"N/A"')
+        ),
+        'distribution', (
+            SELECT jsonb_object_agg(fields.metric, coalesce(distribution.buckets, '[]'))
+            FROM unnest(ARRAY['colleges', 'gpa', 'gradYear', 'major', 'minor', 'linkedin', 'website']) AS fields (metric)
+            LEFT JOIN distribution USING (metric)
+        )
+    )
+    FROM totals
+$function$
+;
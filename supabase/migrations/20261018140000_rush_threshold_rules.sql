@@ -0,0 +1,3 @@
+alter table "public"."event_timeframes_rush" add column "threshold_rules" jsonb;
+
+comment on column "public"."event_timeframes_rush"."threshold_rules" is 'Events a rushee must attend to apply (see utils/rush_events.py); null uses DEFAULT_THRESHOLD_RULES';
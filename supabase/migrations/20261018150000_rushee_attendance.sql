@@ -0,0 +1,104 @@
+create table "public"."rushee_attendance" (
+    "timeframe_id" uuid not null,
+    "rushee_id" uuid not null,
+    "attended_events" jsonb not null default '[]'::jsonb,
+    "num_events_attended" integer not null default 0,
+    "threshold" boolean not null default false,
+    "updated_at" timestamp with time zone not null default now()
+);
+
+
+CREATE UNIQUE INDEX rushee_attendance_pkey ON public.rushee_attendance USING btree (timeframe_id, rushee_id);
+
+alter table "public"."rushee_attendance" add constraint "rushee_attendance_pkey" PRIMARY KEY using index "rushee_attendance_pkey";
+
+alter table "public"."rushee_attendance" add constraint "rushee_attendance_timeframe_id_fkey" FOREIGN KEY (timeframe_id) REFERENCES event_timeframes_rush(id) ON DELETE CASCADE not valid;
+
+alter table "public"."rushee_attendance" validate constraint "rushee_attendance_timeframe_id_fkey";
+
+alter table "public"."rushee_attendance" add constraint "rushee_attendance_rushee_id_fkey" FOREIGN KEY (rushee_id) REFERENCES rushees(id) ON DELETE CASCADE not valid;
+
+alter table "public"."rushee_attendance" validate constraint "rushee_attendance_rushee_id_fkey";
+
+comment on column "public"."rushee_attendance"."attended_events" is 'Ids of the timeframe events the rushee checked in to, in event date order';
+
+set check_function_bodies = off;
+
+CREATE OR REPLACE FUNCTION public.record_rush_checkin(p_timeframe_id uuid, p_rushee_id uuid, p_mandatory_events uuid[], p_minimum_mandatory_events integer, p_remaining_events uuid[], p_minimum_remaining_events integer)
+ RETURNS boolean
+ LANGUAGE plpgsql
+AS $function$
+DECLARE
+    attended jsonb;
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM rushee_attendance WHERE timeframe_id = p_timeframe_id) THEN
+        RETURN false;
+    END IF;
+
+    INSERT INTO rushee_attendance (timeframe_id, rushee_id) VALUES (p_timeframe_id, p_rushee_id)
+    ON CONFLICT (timeframe_id, rushee_id) DO NOTHING;
+
+    PERFORM 1 FROM rushee_attendance
+    WHERE timeframe_id = p_timeframe_id AND rushee_id = p_rushee_id FOR UPDATE;
+
+    SELECT coalesce(jsonb_agg(events.id::text ORDER BY events.date, events.id), '[]') INTO attended
+    FROM events_rush AS events
+    JOIN events_rush_attendees AS attendees ON attendees.event_id = events.id
+    WHERE events.timeframe_id = p_timeframe_id AND attendees.rushee_id = p_rushee_id;
+
+    UPDATE rushee_attendance
+    SET attended_events = attended,
+        num_events_attended = jsonb_array_length(attended),
+        threshold = (
+            SELECT count(*) FILTER (WHERE event_id::uuid = ANY (coalesce(p_mandatory_events, '{}'))) >= p_minimum_mandatory_events
+                AND count(*) FILTER (WHERE event_id::uuid = ANY (coalesce(p_remaining_events, '{}'))) >= p_minimum_remaining_events
+            FROM jsonb_array_elements_text(attended) AS attended_event (event_id)
+        ),
+        updated_at = now()
+    WHERE timeframe_id = p_timeframe_id AND rushee_id = p_rushee_id;
+    RETURN true;
+END
+$function$
+;
+
+grant delete on table "public"."rushee_attendance" to "anon";
+
+grant insert on table "public"."rushee_attendance" to "anon";
+
+grant references on table "public"."rushee_attendance" to "anon";
+
+grant select on table "public"."rushee_attendance" to "anon";
+
+grant trigger on table "public"."rushee_attendance" to "anon";
+
+grant truncate on table "public"."rushee_attendance" to "anon";
+
+grant update on table "public"."rushee_attendance" to "anon";
+
+grant delete on table "public"."rushee_attendance" to "authenticated";
+
+grant insert on table "public"."rushee_attendance" to "authenticated";
+
+grant references on table "public"."rushee_attendance" to "authenticated";
+
+grant select on table "public"."rushee_attendance" to "authenticated";
+
+grant trigger on table "public"."rushee_attendance" to "authenticated";
+
+grant truncate on table "public"."rushee_attendance" to "authenticated";
+
+grant update on table "public"."rushee_attendance" to "authenticated";
+
+grant delete on table "public"."rushee_attendance" to "service_role";
+
+grant insert on table "public"."rushee_attendance" to "service_role";
+
+grant references on table "public"."rushee_attendance" to "service_role";
+
+grant select on table "public"."rushee_attendance" to "service_role";
+
+grant trigger on table "public"."rushee_attendance" to "service_role";
+
+grant truncate on table "public"."rushee_attendance" to "service_role";
+
+grant update on table "public"."rushee_attendance" to "service_role";
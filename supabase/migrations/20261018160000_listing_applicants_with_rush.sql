@@ -0,0 +1,53 @@
+CREATE INDEX rushees_email_idx ON public.rushees USING btree (email);
+
+set check_function_bodies = off;
+
+CREATE OR REPLACE FUNCTION public.listing_applicants_with_rush(p_listing_id uuid)
+ RETURNS jsonb
+ LANGUAGE sql
+ STABLE
+AS $function$
+    WITH
+        timeframe AS (
+            SELECT id FROM event_timeframes_rush WHERE listing_id = p_listing_id
+        ),
+        events AS (
+            SELECT id, name, date FROM events_rush WHERE timeframe_id = (SELECT id FROM timeframe)
+        )
+    SELECT jsonb_build_object(
+        'timeframe_id', (SELECT id FROM timeframe),
+        'applicants', coalesce(jsonb_agg(
+            to_jsonb(apps) || CASE
+                WHEN rush.threshold IS NULL THEN '{}'::jsonb
+                ELSE jsonb_build_object(
+                    'threshold', rush.threshold,
+                    'events', (
+                        SELECT coalesce(jsonb_agg(jsonb_build_object('name', events.name, 'attended', rush.attended_events ? events.id::text) ORDER BY events.date, events.id), '[]')
+                        FROM events
+                    )
+                )
+            END
+            ORDER BY apps.date_applied, apps.id
+        ), '[]'),
+        'needs_rebuild', EXISTS (
+            SELECT 1 FROM events_rush_attendees AS attendees
+            WHERE attendees.event_id IN (SELECT id FROM events)
+                AND NOT EXISTS (
+                    SELECT 1 FROM rushee_attendance AS attendance
+                    WHERE attendance.timeframe_id = (SELECT id FROM timeframe)
+                        AND attendance.rushee_id = attendees.rushee_id
+                )
+        )
+    )
+    FROM applications AS apps
+    LEFT JOIN LATERAL (
+        SELECT attendance.threshold, attendance.attended_events
+        FROM rushees
+        JOIN rushee_attendance AS attendance ON attendance.rushee_id = rushees.id
+        WHERE rushees.email = apps.email AND attendance.timeframe_id = (SELECT id FROM timeframe)
+        ORDER BY attendance.num_events_attended DESC
+        LIMIT 1
+    ) AS rush ON true
+    WHERE apps.listing_id = p_listing_id
+$function$
+;
@@ -4,6 +4,7 @@ CREATE TABLE
         listing_id uuid UNIQUE NOT NULL,
         name text NOT NULL,
         default_rush_timeframe boolean NOT NULL DEFAULT false,
+        threshold_rules jsonb,
         date_created timestamptz NOT NULL DEFAULT now (),
         FOREIGN KEY (listing_id) REFERENCES listings (id) ON DELETE CASCADE
     );
@@ -35,4 +36,6 @@ CREATE TABLE
         FOREIGN KEY (rushee_id) REFERENCES rushees (id) ON DELETE CASCADE
     );
 
-COMMENT ON TABLE "event_timeframes_rush" IS 'Unique listing id enforces One-to-One relationsip';
\ No newline at end of file
+COMMENT ON TABLE "event_timeframes_rush" IS 'Unique listing id enforces One-to-One relationsip';
+
+COMMENT ON COLUMN event_timeframes_rush.threshold_rules IS 'Events a rushee must attend to apply (see utils/rush_events.py); null uses DEFAULT_THRESHOLD_RULES';
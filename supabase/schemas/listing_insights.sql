@@ -0,0 +1,142 @@
+-- Running aggregates of a listing's applications, served by the insights dashboard
+-- without reading application rows. Updated by record_listing_application() on
+-- every new application; rebuilt from scratch by POST /insights/listing/{id}/rebuild.
+CREATE TABLE
+    listing_insights (
+        listing_id uuid PRIMARY KEY,
+        applicant_count integer NOT NULL DEFAULT 0,
+        gpa_sum double precision NOT NULL DEFAULT 0,
+        gpa_count integer NOT NULL DEFAULT 0,
+        majors jsonb NOT NULL DEFAULT '{}',
+        grad_years jsonb NOT NULL DEFAULT '{}',
+        colleges jsonb NOT NULL DEFAULT '{}',
+        gpa_buckets jsonb NOT NULL DEFAULT '{}',
+        updated_at timestamptz NOT NULL DEFAULT now (),
+        FOREIGN KEY (listing_id) REFERENCES listings (id) ON DELETE CASCADE
+    );
+
+-- Adds 1 to counts[key] (a NULL key leaves the counts unchanged)
+CREATE OR REPLACE FUNCTION jsonb_increment (counts jsonb, key text) RETURNS jsonb LANGUAGE sql IMMUTABLE AS $$
+    SELECT CASE
+        WHEN key IS NULL THEN counts
+        ELSE counts || jsonb_build_object(key, coalesce((counts ->> key)::integer, 0) + 1)
+    END
+$$;
+
+-- Adds one application to its listing's aggregates (keys are computed by the API,
+-- see chalicelib/utils/insights.py); the row lock serializes concurrent applications.
+-- Returns false, without counting the application, when the listing has no aggregates
+-- row yet: its earlier applications (e.g. from before this table) were never counted,
+-- so the API builds the row from all of them instead.
+CREATE OR REPLACE FUNCTION record_listing_application (
+    p_listing_id uuid,
+    p_major text,
+    p_grad_year text,
+    p_gpa double precision,
+    p_gpa_bucket text,
+    p_colleges text[]
+) RETURNS boolean LANGUAGE plpgsql AS $$
+DECLARE
+    agg listing_insights;
+    college text;
+BEGIN
+    SELECT * INTO agg FROM listing_insights WHERE listing_id = p_listing_id FOR UPDATE;
+    IF NOT FOUND THEN
+        RETURN false;
+    END IF;
+
+    agg.applicant_count := agg.applicant_count + 1;
+    IF p_gpa IS NOT NULL THEN
+        agg.gpa_sum := agg.gpa_sum + p_gpa;
+        agg.gpa_count := agg.gpa_count + 1;
+    END IF;
+    agg.majors := jsonb_increment(agg.majors, p_major);
+    agg.grad_years := jsonb_increment(agg.grad_years, p_grad_year);
+    agg.gpa_buckets := jsonb_increment(agg.gpa_buckets, p_gpa_bucket);
+    FOREACH college IN ARRAY coalesce(p_colleges, '{}'::text[]) LOOP
+        agg.colleges := jsonb_increment(agg.colleges, college);
+    END LOOP;
+
+    UPDATE listing_insights
+    SET applicant_count = agg.applicant_count,
+        gpa_sum = agg.gpa_sum,
+        gpa_count = agg.gpa_count,
+        majors = agg.majors,
+        grad_years = agg.grad_years,
+        colleges = agg.colleges,
+        gpa_buckets = agg.gpa_buckets,
+        updated_at = now()
+    WHERE listing_id = p_listing_id;
+    RETURN true;
+END
+$$;
+
+-- Dashboard and pie-chart bucket counts of a listing, grouped by Postgres instead of
+-- the API (the `summary` insights format). Follows InsightsService's rules for empty
+-- values and title casing; buckets are sorted by count and carry no applicant lists.
+-- Ties for the most common major/grad year go to the smallest value (first major in
+-- code point order, earliest year), as in the API (see chalicelib/utils/insights.py).
+CREATE OR REPLACE FUNCTION listing_insights_summary (p_listing_id uuid) RETURNS jsonb LANGUAGE sql STABLE AS $$
+    WITH
+        apps AS (
+            SELECT * FROM applications WHERE listing_id = p_listing_id
+        ),
+        buckets AS (
+            SELECT 'colleges' AS metric, to_jsonb(college.key) AS name, count(*) AS value
+            FROM apps, jsonb_each(coalesce(apps.colleges, '{}')) AS college
+            WHERE college.value = 'true'::jsonb
+            GROUP BY 2
+            UNION ALL
+            SELECT 'gpa', CASE WHEN coalesce(gpa, 0) = 0 THEN '"N/A"'::jsonb ELSE to_jsonb(gpa) END, count(*)
+            FROM apps GROUP BY 2
+            UNION ALL
+            SELECT 'gradYear', to_jsonb(grad_year), count(*)
+            FROM apps GROUP BY 2
+            UNION ALL
+            SELECT 'major', to_jsonb(initcap(major)), count(*)
+            FROM apps GROUP BY 2
+            UNION ALL
+            SELECT 'minor',
+                CASE
+                    WHEN coalesce(minor, '') = '' OR lower(minor) IN ('na', 'n/a', 'n a', 'n / a') THEN '"N/A"'::jsonb
+                    ELSE to_jsonb(initcap(minor))
+                END,
+                count(*)
+            FROM apps GROUP BY 2
+            UNION ALL
+            SELECT 'linkedin', to_jsonb(CASE WHEN coalesce(linkedin, '') IN ('', 'N/A') THEN 'N/A' ELSE 'hasURL' END), count(*)
+            FROM apps GROUP BY 2
+            UNION ALL
+            SELECT 'website', to_jsonb(CASE WHEN coalesce(website, '') IN ('', 'N/A') THEN 'N/A' ELSE 'hasURL' END), count(*)
+            FROM apps GROUP BY 2
+        ),
+        distribution AS (
+            SELECT metric, jsonb_agg(jsonb_build_object('name', name, 'value', value) ORDER BY value DESC, name) AS buckets
+            FROM buckets GROUP BY metric
+        ),
+        totals AS (
+            SELECT count(*) AS applicant_count, round(avg(gpa)::numeric, 1) AS avg_gpa FROM apps
+        ),
+        common_major AS (
+            SELECT initcap(major) AS major FROM apps WHERE major <> ''
+            GROUP BY 1 ORDER BY count(*) DESC, initcap(major) COLLATE "C" LIMIT 1
+        ),
+        common_grad_year AS (
+            SELECT grad_year FROM apps
+            GROUP BY 1 ORDER BY count(*) DESC, grad_year LIMIT 1
+        )
+    SELECT jsonb_build_object(
+        'dashboard', jsonb_build_object(
+            'applicantCount', totals.applicant_count,
+            'avgGpa', coalesce(to_jsonb(totals.avg_gpa), '"N/A"'),
+            'commonMajor', coalesce((SELECT to_jsonb(major) FROM common_major), '"N/A"'),
+            'commonGradYear', coalesce((SELECT to_jsonb(grad_year) FROM common_grad_year), '"N/A"')
+        ),
+        'distribution', (
+            SELECT jsonb_object_agg(fields.metric, coalesce(distribution.buckets, '[]'))
+            FROM unnest(ARRAY['colleges', 'gpa', 'gradYear', 'major', 'minor', 'linkedin', 'website']) AS fields (metric)
+            LEFT JOIN distribution USING (metric)
+        )
+    )
+    FROM totals
+$$;
@@ -0,0 +1,118 @@
+-- Attendance of each rushee over a rush timeframe, served by the timeframe analytics
+-- (and the applicant views) without joining every event to its attendees. A
+-- timeframe has either no rows (never built) or a row for every rushee who checked
+-- in: the rows are built all at once from events_rush_attendees (on first use and by
+-- POST /events/rush/timeframe/{id}/attendance/rebuild), then kept up to date by
+-- record_rush_checkin() on every check-in.
+CREATE TABLE
+    rushee_attendance (
+        timeframe_id uuid NOT NULL,
+        rushee_id uuid NOT NULL,
+        attended_events jsonb NOT NULL DEFAULT '[]',
+        num_events_attended integer NOT NULL DEFAULT 0,
+        threshold boolean NOT NULL DEFAULT false,
+        updated_at timestamptz NOT NULL DEFAULT now (),
+        PRIMARY KEY (timeframe_id, rushee_id),
+        FOREIGN KEY (timeframe_id) REFERENCES event_timeframes_rush (id) ON DELETE CASCADE,
+        FOREIGN KEY (rushee_id) REFERENCES rushees (id) ON DELETE CASCADE
+    );
+
+COMMENT ON COLUMN rushee_attendance.attended_events IS 'Ids of the timeframe events the rushee checked in to, in event date order';
+
+-- Recomputes the rushee's attendance row from their check-ins to the timeframe's
+-- events (events_rush_attendees, the check-in just saved included) and re-tests the
+-- threshold (the rule's event ids are resolved by the API, see
+-- chalicelib/utils/rush_events.py); the row lock serializes concurrent check-ins of
+-- the same rushee. Returns false, without writing, when the timeframe has no
+-- attendance rows yet: the API then builds the rows of every rushee at once.
+CREATE OR REPLACE FUNCTION record_rush_checkin (
+    p_timeframe_id uuid,
+    p_rushee_id uuid,
+    p_mandatory_events uuid[],
+    p_minimum_mandatory_events integer,
+    p_remaining_events uuid[],
+    p_minimum_remaining_events integer
+) RETURNS boolean LANGUAGE plpgsql AS $$
+DECLARE
+    attended jsonb;
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM rushee_attendance WHERE timeframe_id = p_timeframe_id) THEN
+        RETURN false;
+    END IF;
+
+    INSERT INTO rushee_attendance (timeframe_id, rushee_id) VALUES (p_timeframe_id, p_rushee_id)
+    ON CONFLICT (timeframe_id, rushee_id) DO NOTHING;
+
+    PERFORM 1 FROM rushee_attendance
+    WHERE timeframe_id = p_timeframe_id AND rushee_id = p_rushee_id FOR UPDATE;
+
+    SELECT coalesce(jsonb_agg(events.id::text ORDER BY events.date, events.id), '[]') INTO attended
+    FROM events_rush AS events
+    JOIN events_rush_attendees AS attendees ON attendees.event_id = events.id
+    WHERE events.timeframe_id = p_timeframe_id AND attendees.rushee_id = p_rushee_id;
+
+    UPDATE rushee_attendance
+    SET attended_events = attended,
+        num_events_attended = jsonb_array_length(attended),
+        threshold = (
+            SELECT count(*) FILTER (WHERE event_id::uuid = ANY (coalesce(p_mandatory_events, '{}'))) >= p_minimum_mandatory_events
+                AND count(*) FILTER (WHERE event_id::uuid = ANY (coalesce(p_remaining_events, '{}'))) >= p_minimum_remaining_events
+            FROM jsonb_array_elements_text(attended) AS attended_event (event_id)
+        ),
+        updated_at = now()
+    WHERE timeframe_id = p_timeframe_id AND rushee_id = p_rushee_id;
+    RETURN true;
+END
+$$;
+
+-- Applications of a listing, each with the rush data of the rushee sharing its email
+-- (`threshold`, and `events`: {name, attended} in event date order, as an array since
+-- jsonb objects do not keep key order) when that rushee attended any event of the
+-- listing's rush timeframe (`timeframe_id`). One jsonb value, so it is not truncated
+-- at PostgREST's max_rows. `needs_rebuild` is set when a rushee who
+-- checked in to the timeframe has no rushee_attendance row (e.g. the timeframe
+-- predates the table).
+CREATE OR REPLACE FUNCTION listing_applicants_with_rush (p_listing_id uuid) RETURNS jsonb LANGUAGE sql STABLE AS $$
+    WITH
+        timeframe AS (
+            SELECT id FROM event_timeframes_rush WHERE listing_id = p_listing_id
+        ),
+        events AS (
+            SELECT id, name, date FROM events_rush WHERE timeframe_id = (SELECT id FROM timeframe)
+        )
+    SELECT jsonb_build_object(
+        'timeframe_id', (SELECT id FROM timeframe),
+        'applicants', coalesce(jsonb_agg(
+            to_jsonb(apps) || CASE
+                WHEN rush.threshold IS NULL THEN '{}'::jsonb
+                ELSE jsonb_build_object(
+                    'threshold', rush.threshold,
+                    'events', (
+                        SELECT coalesce(jsonb_agg(jsonb_build_object('name', events.name, 'attended', rush.attended_events ? events.id::text) ORDER BY events.date, events.id), '[]')
+                        FROM events
+                    )
+                )
+            END
+            ORDER BY apps.date_applied, apps.id
+        ), '[]'),
+        'needs_rebuild', EXISTS (
+            SELECT 1 FROM events_rush_attendees AS attendees
+            WHERE attendees.event_id IN (SELECT id FROM events)
+                AND NOT EXISTS (
+                    SELECT 1 FROM rushee_attendance AS attendance
+                    WHERE attendance.timeframe_id = (SELECT id FROM timeframe)
+                        AND attendance.rushee_id = attendees.rushee_id
+                )
+        )
+    )
+    FROM applications AS apps
+    LEFT JOIN LATERAL (
+        SELECT attendance.threshold, attendance.attended_events
+        FROM rushees
+        JOIN rushee_attendance AS attendance ON attendance.rushee_id = rushees.id
+        WHERE rushees.email = apps.email AND attendance.timeframe_id = (SELECT id FROM timeframe)
+        ORDER BY attendance.num_events_attended DESC
+        LIMIT 1
+    ) AS rush ON true
+    WHERE apps.listing_id = p_listing_id
+$$;
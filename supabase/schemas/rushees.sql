@@ -3,4 +3,7 @@ CREATE TABLE
         id uuid PRIMARY KEY,
         name text NOT NULL,
         email text NOT NULL
-    );
\ No newline at end of file
+    );
+
+-- Rushees are matched to applications by email (see listing_applicants_with_rush())
+CREATE INDEX rushees_email_idx ON rushees (email);
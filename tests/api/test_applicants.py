@@ -6,6 +6,7 @@ from chalice.test import Client
 from unittest.mock import Mock, patch
 import pytest
 from chalicelib.api import applicants
+from chalicelib.utils.pagination import encode_cursor
 
 from app import app
 
@@ -62,6 +63,37 @@ def test_get_all_applicants(test_client):
         assert response.json_body == TEST_APPLICANTS
 
 
+def test_get_all_applicants_paginated(test_client):
+    client, mock_applicant_service = test_client
+    page = {"items": TEST_APPLICANTS[:1], "next_cursor": "next"}
+    mock_applicant_service.get_all.return_value = page
+    cursor = encode_cursor("sample_id0")
+
+    with patch("chalicelib.decorators.jwt.decode") as mock_decode:
+        mock_decode.return_value = {"roles": ["admin"]}
+        response = client.http.get(
+            f"/applicants?limit=1&cursor={cursor}",
+            headers={"Authorization": "Bearer SAMPLE_TOKEN_STRING"},
+        )
+
+        assert response.status_code == 200
+        assert response.json_body == page
+        mock_applicant_service.get_all.assert_called_with(limit=1, cursor=cursor)
+
+
+def test_get_all_applicants_rejects_invalid_limit(test_client):
+    client, _ = test_client
+
+    with patch("chalicelib.decorators.jwt.decode") as mock_decode:
+        mock_decode.return_value = {"roles": ["admin"]}
+        response = client.http.get(
+            "/applicants?limit=zero",
+            headers={"Authorization": "Bearer SAMPLE_TOKEN_STRING"},
+        )
+
+        assert response.status_code == 400
+
+
 def test_get_all_applicants_from_listing(test_client):
     client, mock_applicant_service = test_client
     mock_applicant_service.get_all_from_listing.return_value = TEST_APPLICANTS
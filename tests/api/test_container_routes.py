@@ -0,0 +1,50 @@
+import os
+os.environ["CHALICE_TESTING"] = "1"
+
+import json
+
+import pytest
+from chalice.app import Blueprint, Chalice
+from chalice.test import Client
+
+from chalicelib.api import listings
+from chalicelib.container import build_container
+from chalicelib.modules.supabase_client import SupabaseClient
+from tests.fakes import FakeSupabaseClient
+
+
+@pytest.fixture
+def container_client(monkeypatch):
+    """A Chalice app whose routes get their services from the real container, as in app.py"""
+    supabase = FakeSupabaseClient()
+    supabase.seed("listings", [{"id": "l-1", "title": "Fall Recruitment"}])
+    supabase.seed("applications", [{"id": "a-1", "listing_id": "l-1", "email": "ada@bu.edu"}])
+    SupabaseClient.set_client(supabase)
+
+    # fresh blueprint and app: the module blueprint also holds the routes of other tests
+    monkeypatch.setattr(listings, "listings_api", Blueprint(listings.__name__))
+    container = build_container()
+    listings.register_routes(listing_service=container.provider("listing_service"))
+    test_app = Chalice(app_name="container-routes")
+    test_app.register_blueprint(listings.listings_api)
+
+    with Client(test_app) as client:
+        yield client, container
+    SupabaseClient.reset_client()
+
+
+def test_get_listing_through_lazy_service_provider(container_client):
+    client, _ = container_client
+
+    response = client.http.get("/listings/l-1")
+
+    assert response.status_code == 200
+    assert json.loads(response.body)["title"] == "Fall Recruitment"
+
+
+def test_lazy_service_providers_forward_get(container_client):
+    _, container = container_client
+
+    # `get` belongs to the services, not to their lazy proxies
+    assert container.provider("listing_service").get("l-1")["id"] == "l-1"
+    assert container.provider("applicant_service").get("a-1")["email"] == "ada@bu.edu"
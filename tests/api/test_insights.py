@@ -1,3 +1,78 @@
+import os
+os.environ["CHALICE_TESTING"] = "1"
+
+import pytest
+from chalice.test import Client
+from unittest.mock import Mock, patch
+
+from app import app
+from chalicelib.api import insights
+
+
+@pytest.fixture(scope="module")
+def test_client():
+    mock_insights_service = Mock()
+    insights.register_routes(insights_service=mock_insights_service)
+    app.register_blueprint(insights.insights_api)
+
+    with Client(app) as client:
+        yield client, mock_insights_service
+
+
+def test_get_listing_insights_defaults_to_full_format(test_client):
+    client, mock_insights_service = test_client
+    mock_insights_service.reset_mock()
+    mock_insights_service.get_insights_from_listing.return_value = ({"applicantCount": 0}, {})
+
+    with patch("chalicelib.decorators.jwt.decode") as mock_decode:
+        mock_decode.return_value = {"roles": ["admin"]}
+        response = client.http.get(
+            "/insights/listing/l-1",
+            headers={"Authorization": "Bearer SAMPLE_TOKEN_STRING"},
+        )
+
+    assert response.status_code == 200
+    assert response.json_body == [{"applicantCount": 0}, {}]
+    mock_insights_service.get_insights_from_listing.assert_called_once_with(
+        "l-1", response_format="full"
+    )
+
+
+def test_get_listing_insights_compact_format(test_client):
+    client, mock_insights_service = test_client
+    mock_insights_service.reset_mock()
+    mock_insights_service.get_insights_from_listing.return_value = {"applicants": {}}
+
+    with patch("chalicelib.decorators.jwt.decode") as mock_decode:
+        mock_decode.return_value = {"roles": ["member"]}
+        response = client.http.get(
+            "/insights/listing/l-1?format=compact",
+            headers={"Authorization": "Bearer SAMPLE_TOKEN_STRING"},
+        )
+
+    assert response.status_code == 200
+    mock_insights_service.get_insights_from_listing.assert_called_once_with(
+        "l-1", response_format="compact"
+    )
+
+
+
+def test_compare_listings_splits_listing_ids(test_client):
+    client, mock_insights_service = test_client
+    mock_insights_service.reset_mock()
+    mock_insights_service.compare_listings.return_value = {"listings": ["l-1", "l-2"]}
+
+    with patch("chalicelib.decorators.jwt.decode") as mock_decode:
+        mock_decode.return_value = {"roles": ["member"]}
+        response = client.http.get(
+            "/insights/compare?listing_ids=l-1,%20l-2,",
+            headers={"Authorization": "Bearer SAMPLE_TOKEN_STRING"},
+        )
+
+    assert response.status_code == 200
+    assert response.json_body == {"listings": ["l-1", "l-2"]}
+    mock_insights_service.compare_listings.assert_called_once_with(["l-1", "l-2"])
+
 # TODO: refactor insights first
 # from chalice.test import Client
 # from unittest.mock import patch
@@ -34,3 +109,69 @@
 #                 # Check the response status code and body
 #                 assert response.status_code == 200
 #                 assert response.json_body == [SAMPLE_DASHBOARD, SAMPLE_DISTRIBUTION]
+
+
+def test_get_listing_dashboard(test_client):
+    client, mock_insights_service = test_client
+    mock_insights_service.reset_mock()
+    mock_insights_service.get_listing_dashboard.return_value = {"applicantCount": 3}
+
+    with patch("chalicelib.decorators.jwt.decode") as mock_decode:
+        mock_decode.return_value = {"roles": ["member"]}
+        response = client.http.get(
+            "/insights/listing/l-1/dashboard",
+            headers={"Authorization": "Bearer SAMPLE_TOKEN_STRING"},
+        )
+
+    assert response.status_code == 200
+    assert response.json_body == {"applicantCount": 3}
+    mock_insights_service.get_listing_dashboard.assert_called_once_with("l-1")
+
+
+def test_get_listing_stats(test_client):
+    client, mock_insights_service = test_client
+    mock_insights_service.reset_mock()
+    mock_insights_service.get_listing_stats.return_value = {"gpa": {"count": 3}}
+
+    with patch("chalicelib.decorators.jwt.decode") as mock_decode:
+        mock_decode.return_value = {"roles": ["member"]}
+        response = client.http.get(
+            "/insights/listing/l-1/stats",
+            headers={"Authorization": "Bearer SAMPLE_TOKEN_STRING"},
+        )
+
+    assert response.status_code == 200
+    assert response.json_body == {"gpa": {"count": 3}}
+    mock_insights_service.get_listing_stats.assert_called_once_with("l-1")
+
+
+def test_rebuild_listing_aggregates(test_client):
+    client, mock_insights_service = test_client
+    mock_insights_service.reset_mock()
+    mock_insights_service.rebuild_listing_aggregates.return_value = {"applicant_count": 3}
+
+    with patch("chalicelib.decorators.jwt.decode") as mock_decode:
+        mock_decode.return_value = {"roles": ["admin"]}
+        response = client.http.post(
+            "/insights/listing/l-1/rebuild",
+            headers={"Authorization": "Bearer SAMPLE_TOKEN_STRING"},
+        )
+
+    assert response.status_code == 200
+    assert response.json_body == {"applicant_count": 3}
+    mock_insights_service.rebuild_listing_aggregates.assert_called_once_with("l-1")
+
+
+def test_rebuild_listing_aggregates_requires_admin(test_client):
+    client, mock_insights_service = test_client
+    mock_insights_service.reset_mock()
+
+    with patch("chalicelib.decorators.jwt.decode") as mock_decode:
+        mock_decode.return_value = {"roles": ["member"]}
+        response = client.http.post(
+            "/insights/listing/l-1/rebuild",
+            headers={"Authorization": "Bearer SAMPLE_TOKEN_STRING"},
+        )
+
+    assert response.status_code == 401
+    mock_insights_service.rebuild_listing_aggregates.assert_not_called()
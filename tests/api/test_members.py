@@ -95,7 +95,7 @@ def test_update_member(test_client):
     args, kwargs = mock_service.update.call_args
     assert kwargs["user_id"] == TEST_MEMBER_DATA[0]["id"]
     assert kwargs["data"] == update_member_data
-    assert kwargs["headers"]["authorization"] == "Bearer TOKEN"
+    assert "headers" not in kwargs
 
 
 def test_get_all_members(test_client):
@@ -0,0 +1,44 @@
+import pytest
+
+from chalicelib.modules.token_cache import verified_tokens
+from chalicelib.repositories.repository_factory import RepositoryFactory
+from chalicelib.services.EventsRushService import EventsRushService
+
+
+@pytest.fixture(autouse=True)
+def clear_verified_tokens():
+    # API tests reuse the same token string with different patched claims
+    verified_tokens.clear()
+    yield
+    verified_tokens.clear()
+
+
+class FakeClock:
+    """Stands in for `time.monotonic`/`time.time`: returns `now`, which tests move by hand."""
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def events_rush_service():
+    """Builds an EventsRushService whose repositories all read `client` (e.g. a FakeSupabaseClient)."""
+
+    def build(client) -> EventsRushService:
+        return EventsRushService(
+            event_timeframes_rush_repo=RepositoryFactory.event_timeframes_rush(client=client),
+            events_rush_repo=RepositoryFactory.events_rush(client=client),
+            events_rush_attendees_repo=RepositoryFactory.events_rush_attendees(client=client),
+            rushees_repo=RepositoryFactory.rushees(client=client),
+            rushee_attendance_repo=RepositoryFactory.rushee_attendance(client=client),
+        )
+
+    return build
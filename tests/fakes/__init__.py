@@ -0,0 +1,4 @@
+from tests.fakes.fake_supabase import FakeSupabaseClient, load_schema
+from tests.fakes import sql_functions  # noqa: F401  (registers the Postgres function stand-ins)
+
+__all__ = ["FakeSupabaseClient", "load_schema"]
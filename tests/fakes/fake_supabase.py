@@ -0,0 +1,746 @@
+import copy
+import json
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from postgrest.exceptions import APIError
+
+SCHEMA_DIR = Path(__file__).resolve().parents[2] / "supabase" / "schemas"
+
+# Matches `max_rows` in supabase/config.toml
+MAX_ROWS = 1000
+
+# Python stand-ins for the Postgres functions of supabase/schemas (see sql_functions.py)
+SQL_FUNCTIONS: Dict[str, Callable[..., Any]] = {}
+
+
+def sql_function(name: str):
+    """Registers a stand-in for the Postgres function `name` on every fake client."""
+
+    def register(function: Callable[..., Any]) -> Callable[..., Any]:
+        SQL_FUNCTIONS[name] = function
+        return function
+
+    return register
+
+
+########## SCHEMA ##########
+
+
+@dataclass
+class Column:
+    name: str
+    type: str
+    not_null: bool = False
+    default: Optional[str] = None
+
+
+@dataclass
+class ForeignKey:
+    columns: Tuple[str, ...]
+    ref_table: str
+    ref_columns: Tuple[str, ...]
+    on_delete_cascade: bool = False
+
+
+@dataclass
+class TableSchema:
+    name: str
+    columns: Dict[str, Column] = field(default_factory=dict)
+    primary_key: Tuple[str, ...] = ()
+    unique: List[Tuple[str, ...]] = field(default_factory=list)
+    foreign_keys: List[ForeignKey] = field(default_factory=list)
+
+    def unique_keys(self) -> List[Tuple[str, ...]]:
+        return ([self.primary_key] if self.primary_key else []) + self.unique
+
+
+_CREATE_TABLE = re.compile(
+    r"CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?\"?(\w+)\"?\s*\(", re.IGNORECASE
+)
+_FOREIGN_KEY = re.compile(
+    r"FOREIGN\s+KEY\s*\(([^)]*)\)\s*REFERENCES\s+\"?(\w+)\"?\s*\(([^)]*)\)(.*)",
+    re.IGNORECASE | re.DOTALL,
+)
+_COLUMN_KEYWORDS = {"not", "null", "primary", "unique", "default", "references", "check", "constraint"}
+
+
+def load_schema(paths: Optional[Iterable[Union[str, Path]]] = None) -> Dict[str, TableSchema]:
+    """
+    Parses the `CREATE TABLE` statements of the given SQL files (by default every
+    file in supabase/schemas) into table definitions.
+    """
+    if paths is None:
+        paths = sorted(SCHEMA_DIR.glob("*.sql"))
+
+    tables: Dict[str, TableSchema] = {}
+    for path in paths:
+        sql = re.sub(r"--[^\n]*", "", Path(path).read_text())
+        for match in _CREATE_TABLE.finditer(sql):
+            body = _balanced(sql, match.end() - 1)
+            table = _parse_table(match.group(1), body)
+            tables[table.name] = table
+    return tables
+
+
+def _balanced(text: str, open_index: int) -> str:
+    """Returns the text between the parenthesis at `open_index` and its match."""
+    depth = 0
+    for index in range(open_index, len(text)):
+        if text[index] == "(":
+            depth += 1
+        elif text[index] == ")":
+            depth -= 1
+            if depth == 0:
+                return text[open_index + 1 : index]
+    raise ValueError("Unbalanced parentheses in schema.")
+
+
+def _split_top_level(text: str, separator: str = ",") -> List[str]:
+    parts, depth, current = [], 0, []
+    for char in text:
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        if char == separator and depth == 0:
+            parts.append("".join(current).strip())
+            current = []
+        else:
+            current.append(char)
+    if "".join(current).strip():
+        parts.append("".join(current).strip())
+    return parts
+
+
+def _names(text: str) -> Tuple[str, ...]:
+    return tuple(name.strip().strip('"') for name in text.split(","))
+
+
+def _parse_table(name: str, body: str) -> TableSchema:
+    table = TableSchema(name=name)
+    for item in _split_top_level(body):
+        definition = re.sub(r"^CONSTRAINT\s+\w+\s+", "", item, flags=re.IGNORECASE)
+        upper = definition.upper()
+
+        if re.match(r"PRIMARY\s+KEY\b", upper):
+            table.primary_key = _names(_balanced(definition, definition.index("(")))
+        elif re.match(r"UNIQUE\b", upper):
+            table.unique.append(_names(_balanced(definition, definition.index("("))))
+        elif re.match(r"FOREIGN\s+KEY\b", upper):
+            columns, ref_table, ref_columns, rest = _FOREIGN_KEY.match(definition).groups()
+            table.foreign_keys.append(
+                ForeignKey(
+                    columns=_names(columns),
+                    ref_table=ref_table,
+                    ref_columns=_names(ref_columns),
+                    on_delete_cascade="ON DELETE CASCADE" in rest.upper(),
+                )
+            )
+        elif re.match(r"CHECK\b", upper):
+            continue
+        else:
+            table.columns[definition.split()[0]] = _parse_column(table, definition)
+    return table
+
+
+def _parse_column(table: TableSchema, definition: str) -> Column:
+    tokens = definition.split()
+    name = tokens[0]
+    type_tokens = []
+    for token in tokens[1:]:
+        if token.lower() in _COLUMN_KEYWORDS:
+            break
+        type_tokens.append(token)
+
+    upper = definition.upper()
+    column = Column(name=name, type=" ".join(type_tokens).lower())
+    column.not_null = "NOT NULL" in upper or "PRIMARY KEY" in upper
+
+    default = re.search(r"DEFAULT\s+(.+?)(?:\s+(?:NOT\s+NULL|PRIMARY|UNIQUE|REFERENCES)\b|$)", definition, re.IGNORECASE)
+    if default:
+        column.default = default.group(1).strip()
+    if "PRIMARY KEY" in upper:
+        table.primary_key = (name,)
+    if re.search(r"\bUNIQUE\b", upper):
+        table.unique.append((name,))
+    return column
+
+
+########## SELECT PARSING ##########
+
+
+@dataclass
+class SelectItem:
+    """One entry of a PostgREST `select`: a column (or `*`) or an embedded resource."""
+
+    name: str
+    alias: Optional[str] = None
+    children: Optional[List["SelectItem"]] = None
+
+    @property
+    def is_embed(self) -> bool:
+        return self.children is not None
+
+
+def parse_select(select_query: str) -> List[SelectItem]:
+    """Parses e.g. `"*, user_roles: user_roles (role: roles (id,name))"`."""
+    items = []
+    for part in _split_top_level(select_query or "*"):
+        children = None
+        if "(" in part:
+            open_index = part.index("(")
+            children = parse_select(_balanced(part, open_index))
+            part = part[:open_index]
+
+        part = part.split("::")[0].strip()
+        alias = None
+        if ":" in part:
+            alias, part = (piece.strip() for piece in part.split(":", 1))
+        name = part.split("!")[0].strip()
+        items.append(SelectItem(name=name, alias=alias, children=children))
+    return items
+
+
+########## QUERY BUILDER ##########
+
+
+@dataclass
+class FakeResponse:
+    """Stand-in for postgrest's `APIResponse`."""
+
+    data: Any
+    count: Optional[int] = None
+
+
+def _normalize(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if value is None:
+        return "null"
+    return str(value)
+
+
+def _compare(left: Any, right: Any) -> int:
+    try:
+        left_value, right_value = float(left), float(right)
+    except (TypeError, ValueError):
+        left_value, right_value = _normalize(left), _normalize(right)
+    return (left_value > right_value) - (left_value < right_value)
+
+
+def _sort_key(value: Any) -> Tuple:
+    # nulls sort last ascending (and first descending), as in Postgres
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return (value is None, 0, value, "")
+    return (value is None, 1, 0, _normalize(value))
+
+
+def _match(operator: str, value: Any, criteria: Any) -> bool:
+    if operator == "eq":
+        return value is not None and _normalize(value) == _normalize(criteria)
+    if operator == "neq":
+        return value is not None and _normalize(value) != _normalize(criteria)
+    if operator == "in":
+        if isinstance(criteria, str):
+            criteria = [c.strip().strip('"') for c in criteria.strip("()").split(",")]
+        if not isinstance(criteria, frozenset):
+            criteria = frozenset(_normalize(c) for c in criteria)
+        return value is not None and _normalize(value) in criteria
+    if operator == "is":
+        expected = {"null": None, "true": True, "false": False}[_normalize(criteria).lower()]
+        return value is expected
+    if value is None:
+        return False
+    if operator == "gt":
+        return _compare(value, criteria) > 0
+    if operator == "gte":
+        return _compare(value, criteria) >= 0
+    if operator == "lt":
+        return _compare(value, criteria) < 0
+    if operator == "lte":
+        return _compare(value, criteria) <= 0
+    raise NotImplementedError(f"Filter operator '{operator}' is not supported by the fake.")
+
+
+class FakeQueryBuilder:
+    """
+    Chainable stand-in for postgrest's request builders. Filters are collected as
+    they are chained and applied when `execute()` makes the (simulated) round trip.
+    """
+
+    def __init__(self, client: "FakeSupabaseClient", table_name: str):
+        self._client = client
+        self._table_name = table_name
+        self._method = "select"
+        self._select_query = "*"
+        self._payload: Any = None
+        self._on_conflict: Optional[str] = None
+        self._ignore_duplicates = False
+        self._filters: List[Tuple[str, bool, str, Any]] = []
+        self._order: List[Tuple[str, bool]] = []
+        self._limit: Optional[int] = None
+        self._negate_next = False
+
+    # -- request methods --
+
+    def select(self, *columns: str, count: Optional[str] = None) -> "FakeQueryBuilder":
+        self._method = "select"
+        self._select_query = ",".join(columns) if columns else "*"
+        return self
+
+    def insert(self, json: Union[Dict, List[Dict]], **_) -> "FakeQueryBuilder":
+        self._method = "insert"
+        self._payload = json
+        return self
+
+    def upsert(
+        self,
+        json: Union[Dict, List[Dict]],
+        on_conflict: str = "",
+        ignore_duplicates: bool = False,
+        **_,
+    ) -> "FakeQueryBuilder":
+        self._method = "upsert"
+        self._payload = json
+        self._on_conflict = on_conflict or None
+        self._ignore_duplicates = ignore_duplicates
+        return self
+
+    def update(self, json: Dict, **_) -> "FakeQueryBuilder":
+        self._method = "update"
+        self._payload = json
+        return self
+
+    def delete(self, **_) -> "FakeQueryBuilder":
+        self._method = "delete"
+        return self
+
+    # -- filters --
+
+    @property
+    def not_(self) -> "FakeQueryBuilder":
+        self._negate_next = True
+        return self
+
+    def _add_filter(self, column: str, operator: str, criteria: Any) -> "FakeQueryBuilder":
+        self._filters.append((column, self._negate_next, operator, criteria))
+        self._negate_next = False
+        return self
+
+    def eq(self, column: str, value: Any) -> "FakeQueryBuilder":
+        return self._add_filter(column, "eq", value)
+
+    def neq(self, column: str, value: Any) -> "FakeQueryBuilder":
+        return self._add_filter(column, "neq", value)
+
+    def gt(self, column: str, value: Any) -> "FakeQueryBuilder":
+        return self._add_filter(column, "gt", value)
+
+    def gte(self, column: str, value: Any) -> "FakeQueryBuilder":
+        return self._add_filter(column, "gte", value)
+
+    def lt(self, column: str, value: Any) -> "FakeQueryBuilder":
+        return self._add_filter(column, "lt", value)
+
+    def lte(self, column: str, value: Any) -> "FakeQueryBuilder":
+        return self._add_filter(column, "lte", value)
+
+    def in_(self, column: str, values: Iterable[Any]) -> "FakeQueryBuilder":
+        # normalized once, not per row
+        return self._add_filter(column, "in", frozenset(_normalize(v) for v in values))
+
+    def is_(self, column: str, value: Any) -> "FakeQueryBuilder":
+        return self._add_filter(column, "is", value)
+
+    def filter(self, column: str, operator: str, criteria: Any) -> "FakeQueryBuilder":
+        negate = operator.startswith("not.")
+        if negate:
+            operator = operator[len("not.") :]
+        self._negate_next = self._negate_next != negate
+        return self._add_filter(column, operator, criteria)
+
+    # -- modifiers --
+
+    def order(self, column: str, desc: bool = False, **_) -> "FakeQueryBuilder":
+        self._order.append((column, desc))
+        return self
+
+    def limit(self, size: int, **_) -> "FakeQueryBuilder":
+        self._limit = size
+        return self
+
+    def execute(self) -> FakeResponse:
+        return self._client._round_trip(
+            (self._table_name, self._method), lambda: self._run()
+        )
+
+    # -- evaluation --
+
+    def _matches(self, row: Dict) -> bool:
+        for column, negate, operator, criteria in self._filters:
+            if _match(operator, row.get(column), criteria) == negate:
+                return False
+        return True
+
+    def _run(self) -> FakeResponse:
+        db = self._client
+        if self._method == "insert":
+            return FakeResponse(db._insert(self._table_name, self._payload))
+        if self._method == "upsert":
+            return FakeResponse(
+                db._upsert(
+                    self._table_name, self._payload, self._on_conflict, self._ignore_duplicates
+                )
+            )
+
+        rows = [row for row in db._rows(self._table_name) if self._matches(row)]
+        if self._method == "update":
+            return FakeResponse(db._update(self._table_name, rows, self._payload))
+        if self._method == "delete":
+            return FakeResponse(db._delete(self._table_name, rows))
+
+        for column, desc in reversed(self._order):
+            rows.sort(key=lambda row: _sort_key(row.get(column)), reverse=desc)
+        rows = rows[: min(self._limit or MAX_ROWS, MAX_ROWS)]
+        items = parse_select(self._select_query)
+        return FakeResponse([db._project(self._table_name, row, items) for row in rows])
+
+
+class FakeRPCBuilder:
+    def __init__(self, client: "FakeSupabaseClient", name: str, params: Dict):
+        self._client = client
+        self._name = name
+        self._params = params
+
+    def execute(self) -> FakeResponse:
+        function = self._client._functions.get(self._name)
+        if function is None:
+            raise _api_error("PGRST202", f"Could not find the function public.{self._name}")
+        return self._client._round_trip(
+            ("rpc", self._name),
+            lambda: FakeResponse(function(self._client, **(self._params or {}))),
+        )
+
+
+def _api_error(code: str, message: str) -> APIError:
+    return APIError({"code": code, "message": message, "details": None, "hint": None})
+
+
+########## CLIENT ##########
+
+
+class FakeSupabaseClient:
+    """
+    In-memory stand-in for the supabase `Client`, for tests and benchmarks.
+
+    - Tables, primary keys, UNIQUE constraints and foreign keys are read from
+      supabase/schemas/*.sql. Writes raise `APIError`s with Postgres codes on
+      constraint violations (23502 not null, 23503 foreign key, 23505 unique).
+    - Embedded selects follow PostgREST's rules: many-to-one and one-to-one embeds
+      return an object, one-to-many and many-to-many (through a join table) a list.
+    - Every `execute()` is one round trip. `latency_seconds` is slept per round
+      trip (outside the lock, so concurrent requests overlap) and `stats()` reports
+      how many round trips each table/method made.
+    - Postgres functions can be stood in for with `register_rpc`.
+    """
+
+    def __init__(
+        self,
+        schema: Optional[Dict[str, TableSchema]] = None,
+        latency_seconds: float = 0.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.schema = schema if schema is not None else load_schema()
+        self.latency_seconds = latency_seconds
+        self._sleep = sleep
+        self._lock = threading.RLock()
+        self._tables: Dict[str, List[Dict]] = {name: [] for name in self.schema}
+        # (table, columns) -> (table version, {key: rows}); rebuilt after writes
+        self._indexes: Dict[Tuple[str, Tuple[str, ...]], Tuple[int, Dict]] = {}
+        self._versions: Counter = Counter()
+        self._functions: Dict[str, Callable[..., Any]] = dict(SQL_FUNCTIONS)
+        self.round_trips: Counter = Counter()
+
+    # -- supabase Client interface --
+
+    def table(self, table_name: str) -> FakeQueryBuilder:
+        return FakeQueryBuilder(self, table_name)
+
+    from_ = table
+
+    def rpc(self, fn: str, params: Optional[Dict] = None, **_) -> FakeRPCBuilder:
+        return FakeRPCBuilder(self, fn, params or {})
+
+    # -- test helpers --
+
+    def register_rpc(self, name: str, function: Callable[..., Any]):
+        """Registers `function(client, **params)` as the Postgres function `name`."""
+        self._functions[name] = function
+
+    def seed(self, table_name: str, rows: Iterable[Dict]):
+        """Loads rows directly (defaults applied, constraints not checked, no round trip)."""
+        with self._lock:
+            self._table(table_name).extend(self._with_defaults(table_name, row) for row in rows)
+            self._versions[table_name] += 1
+
+    def dump(self, table_name: str) -> List[Dict]:
+        """Returns a copy of every row of the table (no round trip)."""
+        with self._lock:
+            return copy.deepcopy(self._table(table_name))
+
+    def stats(self) -> dict:
+        total = sum(self.round_trips.values())
+        return {
+            "round_trips": total,
+            "simulated_latency_seconds": total * self.latency_seconds,
+            "by_call": {f"{table}.{method}": count for (table, method), count in self.round_trips.items()},
+        }
+
+    def reset_stats(self):
+        self.round_trips.clear()
+
+    # -- internals --
+
+    def _round_trip(self, key: Tuple[str, str], run: Callable[[], FakeResponse]) -> FakeResponse:
+        if self.latency_seconds:
+            self._sleep(self.latency_seconds)
+        with self._lock:
+            self.round_trips[key] += 1
+            return copy.deepcopy(run())
+
+    def _table(self, table_name: str) -> List[Dict]:
+        if table_name not in self._tables:
+            raise _api_error("42P01", f'relation "public.{table_name}" does not exist')
+        return self._tables[table_name]
+
+    def _rows(self, table_name: str) -> List[Dict]:
+        return list(self._table(table_name))
+
+    def _lookup(self, table_name: str, columns: Tuple[str, ...], key: Tuple[str, ...]) -> List[Dict]:
+        """Returns the rows whose `columns` equal `key` (normalized), via a cached index."""
+        version = self._versions[table_name]
+        cached = self._indexes.get((table_name, columns))
+        if cached is None or cached[0] != version:
+            index: Dict[Tuple[str, ...], List[Dict]] = {}
+            for row in self._tables.get(table_name, []):
+                index.setdefault(_key(row, columns), []).append(row)
+            cached = self._indexes[(table_name, columns)] = (version, index)
+        return cached[1].get(key, [])
+
+    def _index_appended(self, table_name: str, row: Dict):
+        """Bumps the table version after appending `row`, adding it to the up-to-date indexes
+        (so that checking each row of a bulk insert does not rebuild them)."""
+        version = self._versions[table_name]
+        self._versions[table_name] = version + 1
+        for (name, columns), (cached_version, index) in self._indexes.items():
+            if name == table_name and cached_version == version:
+                index.setdefault(_key(row, columns), []).append(row)
+                self._indexes[(name, columns)] = (version + 1, index)
+
+    def _with_defaults(self, table_name: str, data: Dict) -> Dict:
+        row = {}
+        for name, column in self.schema[table_name].columns.items():
+            if name in data:
+                row[name] = data[name]
+            elif column.default is not None:
+                row[name] = _default_value(column)
+            else:
+                row[name] = None
+        unknown = set(data) - set(row)
+        if unknown:
+            raise _api_error(
+                "PGRST204",
+                f"Could not find the '{sorted(unknown)[0]}' column of '{table_name}' in the schema cache",
+            )
+        return row
+
+    def _check(self, table_name: str, row: Dict, ignore: Optional[Dict] = None):
+        table = self.schema[table_name]
+        for name, column in table.columns.items():
+            if column.not_null and row.get(name) is None:
+                raise _api_error(
+                    "23502",
+                    f'null value in column "{name}" of relation "{table_name}" violates not-null constraint',
+                )
+        for key in table.unique_keys():
+            values = _key(row, key)
+            if "null" in values:
+                continue
+            for other in self._lookup(table_name, key, values):
+                if other is not ignore:
+                    raise _api_error(
+                        "23505",
+                        f'duplicate key value violates unique constraint "{table_name}_{"_".join(key)}_key"',
+                    )
+        for fk in table.foreign_keys:
+            values = _key(row, fk.columns)
+            if "null" in values:
+                continue
+            if not self._lookup(fk.ref_table, fk.ref_columns, values):
+                raise _api_error(
+                    "23503",
+                    f'insert or update on table "{table_name}" violates foreign key constraint '
+                    f'"{table_name}_{"_".join(fk.columns)}_fkey"',
+                )
+
+    def _insert(self, table_name: str, payload: Union[Dict, List[Dict]]) -> List[Dict]:
+        rows = payload if isinstance(payload, list) else [payload]
+        table = self._table(table_name)
+        inserted = []
+        try:
+            for data in rows:
+                row = self._with_defaults(table_name, data)
+                self._check(table_name, row)
+                table.append(row)
+                inserted.append(row)
+                self._index_appended(table_name, row)
+        except APIError:
+            # a failed statement leaves the table untouched
+            for row in inserted:
+                table.remove(row)
+            self._versions[table_name] += 1
+            raise
+        return inserted
+
+    def _upsert(
+        self,
+        table_name: str,
+        payload: Union[Dict, List[Dict]],
+        on_conflict: Optional[str],
+        ignore_duplicates: bool,
+    ) -> List[Dict]:
+        conflict = _names(on_conflict) if on_conflict else self.schema[table_name].primary_key
+        self._table(table_name)
+        written = []
+        for data in payload if isinstance(payload, list) else [payload]:
+            existing = next(iter(self._lookup(table_name, conflict, _key(data, conflict))), None)
+            if existing is None:
+                written.extend(self._insert(table_name, data))
+            elif not ignore_duplicates:
+                written.extend(self._update(table_name, [existing], data))
+        return written
+
+    def _update(self, table_name: str, rows: List[Dict], data: Dict) -> List[Dict]:
+        unknown = set(data) - set(self.schema[table_name].columns)
+        if unknown:
+            raise _api_error(
+                "PGRST204",
+                f"Could not find the '{sorted(unknown)[0]}' column of '{table_name}' in the schema cache",
+            )
+        for row in rows:
+            self._check(table_name, {**row, **data}, ignore=row)
+        for row in rows:
+            row.update(data)
+        self._versions[table_name] += 1
+        return rows
+
+    def _delete(self, table_name: str, rows: List[Dict]) -> List[Dict]:
+        table = self._table(table_name)
+        for row in rows:
+            table.remove(row)
+            self._versions[table_name] += 1
+            self._cascade(table_name, row)
+        return rows
+
+    def _cascade(self, table_name: str, deleted: Dict):
+        for child_name, child in self.schema.items():
+            for fk in child.foreign_keys:
+                if fk.ref_table != table_name:
+                    continue
+                dependents = list(self._lookup(child_name, fk.columns, _key(deleted, fk.ref_columns)))
+                if dependents and not fk.on_delete_cascade:
+                    raise _api_error(
+                        "23503",
+                        f'update or delete on table "{table_name}" violates foreign key constraint '
+                        f'on table "{child_name}"',
+                    )
+                self._delete(child_name, dependents)
+
+    # -- embedding --
+
+    def _project(self, table_name: str, row: Dict, items: List[SelectItem]) -> Dict:
+        result = {}
+        for item in items:
+            if item.is_embed:
+                result[item.alias or item.name] = self._embed(table_name, row, item)
+            elif item.name == "*":
+                result.update(row)
+            elif item.name in row:
+                result[item.alias or item.name] = row[item.name]
+            else:
+                raise _api_error("42703", f"column {table_name}.{item.name} does not exist")
+        return result
+
+    def _embed(self, table_name: str, row: Dict, item: SelectItem) -> Union[Dict, List, None]:
+        target = item.name
+        if target not in self.schema:
+            raise _api_error(
+                "PGRST200",
+                f"Could not find a relationship between '{table_name}' and '{target}' in the schema cache",
+            )
+
+        def related(child: str, fk: ForeignKey, source: Dict) -> List[Dict]:
+            return self._lookup(child, fk.columns, _key(source, fk.ref_columns))
+
+        # many-to-one: this table references the target
+        for fk in self.schema[table_name].foreign_keys:
+            if fk.ref_table == target:
+                parent = next(iter(self._lookup(target, fk.ref_columns, _key(row, fk.columns))), None)
+                return self._project(target, parent, item.children) if parent else None
+
+        # one-to-many (or one-to-one when the referencing columns are unique)
+        for fk in self.schema[target].foreign_keys:
+            if fk.ref_table == table_name:
+                children = [self._project(target, r, item.children) for r in related(target, fk, row)]
+                if fk.columns in self.schema[target].unique_keys():
+                    return children[0] if children else None
+                return children
+
+        # many-to-many through a join table whose primary key covers both references
+        for junction in self.schema.values():
+            to_source = next((fk for fk in junction.foreign_keys if fk.ref_table == table_name), None)
+            to_target = next((fk for fk in junction.foreign_keys if fk.ref_table == target), None)
+            if (
+                to_source and to_target
+                and set(to_source.columns + to_target.columns) <= set(junction.primary_key)
+            ):
+                results = []
+                for link in related(junction.name, to_source, row):
+                    results.extend(
+                        self._project(target, r, item.children)
+                        for r in self._lookup(target, to_target.ref_columns, _key(link, to_target.columns))
+                    )
+                return results
+
+        raise _api_error(
+            "PGRST200",
+            f"Could not find a relationship between '{table_name}' and '{target}' in the schema cache",
+        )
+
+
+def _key(row: Dict, columns: Tuple[str, ...]) -> Tuple[str, ...]:
+    return tuple(_normalize(row.get(c)) for c in columns)
+
+
+def _default_value(column: Column) -> Any:
+    expression = column.default.lower().replace(" ", "").split("::")[0]
+    if column.type == "jsonb":
+        return json.loads(expression.strip("'"))
+    if expression.startswith("gen_random_uuid"):
+        return str(uuid.uuid4())
+    if expression.startswith("now"):
+        return datetime.now(timezone.utc).isoformat()
+    if expression in ("true", "false"):
+        return expression == "true"
+    try:
+        return int(expression)
+    except ValueError:
+        return expression.strip("'")
@@ -0,0 +1,190 @@
+"""
+Implementations that were replaced by faster versions, kept verbatim (or with the
+differences stated in their docstrings) so that the tests can check output parity
+and the benchmarks (benchmarks/) can measure the speedup.
+"""
+
+# `chalicelib/utils/rush_events.py` before the threshold rules were configurable per timeframe
+mandatory_events = ["Info Session 1", "Info Session 2"]
+remaining_events = ["Professional Panel", "Resume Night", "Social Event"]
+minimum_remaining_events = 2
+
+
+def is_rush_threshold_met(events_attended: list[dict], events: dict) -> bool:
+    """
+    Determine if rushee has attended enough events to apply.
+
+    Args:
+        events_attended (list[dict]): list of dicts with 'id' and 'attended' keys
+        events (dict): dict of event_id -> event object
+
+    Returns:
+        bool: True if attended at least 1 mandatory and 2 remaining events
+    """
+    # Get names of attended events
+    attended_names = [
+        events[ea["id"]]["name"] for ea in events_attended if ea.get("attended")
+    ]
+
+    has_attended_mandatory = any(name in mandatory_events for name in attended_names)
+    attended_remaining = sum(1 for name in attended_names if name in remaining_events)
+    return has_attended_mandatory and attended_remaining >= minimum_remaining_events
+
+
+def pie_chart_insights_linear_scan(data):
+    """
+    `InsightsService._get_pie_chart_insights` before it used dict-keyed buckets.
+
+    Differs from the original where the service's bucketing rules changed since, so
+    that it stays an oracle for the dict-keyed version:
+    - the empty-value check of `minor`/`gpa` calls `str(val).lower()` where the
+      original called `val.lower()`, which raised AttributeError on numeric GPAs (so
+      /insights/listing/{id} answered 400 "Failed to get insights" for any listing
+      with one);
+    - `gradYear` is read from the `grad_year` column, where the original read a
+      `gradYear` key that application rows do not have (its gradYear buckets were
+      always empty);
+    - a null `colleges` counts as no college selected, where the original raised.
+    """
+    distribution = {
+        "colleges": [],
+        "gpa": [],
+        "gradYear": [],
+        "major": [],
+        "minor": [],
+        "linkedin": [],
+        "website": [],
+    }
+    fields = ["colleges", "gpa", "gradYear", "major", "minor", "linkedin", "website"]
+
+    def findInsightsObject(metric, metric_val):
+        found_object = None
+        for distribution_object in distribution[metric]:
+            if distribution_object["name"] == metric_val:
+                found_object = distribution_object
+                break
+        return found_object
+
+    for applicant in data:
+        for metric, val in applicant.items():
+            metric = "gradYear" if metric == "grad_year" else metric
+            if metric not in fields:
+                continue
+
+            if metric in ["linkedin", "website"]:
+                val = "N/A" if (not val or val == "N/A") else "hasURL"
+
+            elif metric in ["minor", "gpa"] and (
+                not val or str(val).lower() in ["na", "n/a", "n a", "n / a"]
+            ):
+                val = "N/A"
+
+            elif metric == "colleges":
+                for college, status in (val or {}).items():
+                    if not status:
+                        continue
+
+                    found_college = findInsightsObject(metric, college)
+                    if found_college:
+                        found_college["value"] += 1
+                        found_college["applicants"] += [applicant]
+                    else:
+                        distribution[metric] += [
+                            {"name": college, "value": 1, "applicants": [applicant]}
+                        ]
+                continue
+
+            found_object = findInsightsObject(metric, val)
+            if found_object:
+                found_object["value"] += 1
+                found_object["applicants"] += [applicant]
+            else:
+                distribution[metric] += [{"name": val, "value": 1, "applicants": [applicant]}]
+
+    return distribution
+
+
+def rush_analytics_linear_scan(rush_events):
+    """`EventsRushService.get_rush_timeframe_analytics` before it used attendance bitmasks."""
+    rushee_dict = {}
+    rush_events_dict = {}
+
+    # Extract all rushees and events
+    for event in rush_events:
+        # Get rushees
+        event_id = event["id"]
+        for rushee in event.get("rushees", []):
+            rushee_id = rushee["id"]
+            if rushee_id not in rushee_dict:
+                rushee_dict[rushee_id] = rushee.copy()
+
+        # Get map of events (for quick lookups)
+        event_copy = event.copy()
+        event_copy.pop("rushees", None)
+        event_copy["num_attendees"] = len(event["rushees"])
+
+        rush_events_dict[event_id] = event_copy
+
+    # Track rushee event attendance
+    for rushee_id, rushee in rushee_dict.items():
+        events_attended = []
+        for event in rush_events:
+            event_id = event["id"]
+            event_rushees = event.get("rushees", [])
+
+            attended = False
+            if any(r.get("id") == rushee_id for r in event_rushees):
+                attended = True
+
+            events_attended.append({"id": event_id, "attended": attended})
+
+        rushee["events_attended"] = events_attended
+        rushee["threshold"] = is_rush_threshold_met(
+            events_attended=events_attended, events=rush_events_dict
+        )
+        rushee["num_events_attended"] = sum(
+            [e["attended"] for e in events_attended]
+        )
+
+    return rushee_dict, rush_events_dict
+
+
+def applicants_from_listing_in_python(
+    listings_repo, applications_repo, event_timeframes_rush_repo, events_rush_service, id
+):
+    """`ApplicantService.get_all_from_listing` before the rushee join moved into Postgres."""
+    listing = listings_repo.get_by_id(id_value=id)
+    listing_id = listing["id"]
+    applications = applications_repo.get_all_by_field(
+        field="listing_id", value=id
+    )
+
+    # Collect rush information (events-attended)
+    rush_category_data = event_timeframes_rush_repo.get_with_custom_select(
+        filters={"listing_id": listing_id}
+    )
+
+    if rush_category_data:
+        rush_category_id = rush_category_data[0]["id"]
+        analytics = events_rush_service.get_rush_timeframe_analytics(rush_category_id)
+
+        # remap rushees dict from rush_id → email
+        rushees = {
+            rushee_data["email"]: rushee_data
+            for rushee_data in analytics.get("rushees", {}).values()
+        }
+        events = analytics.get("events", {})
+
+        for applicant in applications:
+            email = applicant["email"]
+            rushee = rushees.get(email, None)
+            if not rushee:
+                continue
+
+            applicant["threshold"] = rushee["threshold"]
+            applicant["events"] = {
+                events[event_attended["id"]]["name"]: event_attended["attended"]
+                for event_attended in rushee["events_attended"]
+            }
+
+    return applications
@@ -0,0 +1,171 @@
+import copy
+import json
+from collections import Counter
+from datetime import datetime, timezone
+from decimal import ROUND_HALF_UP, Decimal
+
+from chalicelib.utils.insights import add_application
+from tests.fakes.fake_supabase import FakeSupabaseClient, sql_function
+
+
+@sql_function("record_listing_application")
+def record_listing_application(db: FakeSupabaseClient, **params):
+    """supabase/schemas/listing_insights.sql: record_listing_application()"""
+    rows = db._lookup("listing_insights", ("listing_id",), (params["p_listing_id"],))
+    if not rows:
+        return False
+
+    aggregate = rows[0]
+    add_application(aggregate, params)
+    db._update(
+        "listing_insights", [aggregate], {"updated_at": datetime.now(timezone.utc).isoformat()}
+    )
+    return True
+
+
+
+@sql_function("record_rush_checkin")
+def record_rush_checkin(db: FakeSupabaseClient, **params):
+    """supabase/schemas/rushee_attendance.sql: record_rush_checkin()"""
+    key = (params["p_timeframe_id"], params["p_rushee_id"])
+    if not db._lookup("rushee_attendance", ("timeframe_id",), (key[0],)):
+        return False
+
+    rows = db._lookup("rushee_attendance", ("timeframe_id", "rushee_id"), key)
+    if rows:
+        attendance = rows[0]
+    else:
+        attendance = db._insert("rushee_attendance", {"timeframe_id": key[0], "rushee_id": key[1]})[0]
+
+    checked_in = {row["event_id"] for row in db._lookup("events_rush_attendees", ("rushee_id",), (key[1],))}
+    events = sorted(db._lookup("events_rush", ("timeframe_id",), (key[0],)), key=lambda e: (e["date"], e["id"]))
+    attended_events = [event["id"] for event in events if event["id"] in checked_in]
+    mandatory = sum(1 for event_id in attended_events if event_id in (params["p_mandatory_events"] or []))
+    remaining = sum(1 for event_id in attended_events if event_id in (params["p_remaining_events"] or []))
+
+    db._update(
+        "rushee_attendance",
+        [attendance],
+        {
+            "attended_events": attended_events,
+            "num_events_attended": len(attended_events),
+            "threshold": mandatory >= params["p_minimum_mandatory_events"]
+            and remaining >= params["p_minimum_remaining_events"],
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+        },
+    )
+    return True
+
+
+@sql_function("listing_applicants_with_rush")
+def listing_applicants_with_rush(db: FakeSupabaseClient, **params):
+    """supabase/schemas/rushee_attendance.sql: listing_applicants_with_rush()"""
+    timeframe = next(iter(db._lookup("event_timeframes_rush", ("listing_id",), (params["p_listing_id"],))), None)
+    timeframe_id = timeframe["id"] if timeframe else None
+    events = sorted(db._lookup("events_rush", ("timeframe_id",), (str(timeframe_id),)), key=lambda e: (e["date"], e["id"]))
+    attendance = db._lookup("rushee_attendance", ("timeframe_id",), (str(timeframe_id),))
+
+    applicants = []
+    apps = db._lookup("applications", ("listing_id",), (params["p_listing_id"],))
+    for app in sorted(apps, key=lambda app: (app["date_applied"], app["id"])):
+        applicant = copy.deepcopy(app)
+        # LEFT JOIN LATERAL ... ORDER BY num_events_attended DESC LIMIT 1
+        matches = [
+            row
+            for rushee in db._lookup("rushees", ("email",), (app["email"],))
+            for row in db._lookup("rushee_attendance", ("timeframe_id", "rushee_id"), (str(timeframe_id), rushee["id"]))
+        ]
+        if matches:
+            rush = max(matches, key=lambda row: row["num_events_attended"])
+            applicant["threshold"] = rush["threshold"]
+            applicant["events"] = [
+                {"name": event["name"], "attended": event["id"] in rush["attended_events"]} for event in events
+            ]
+        applicants.append(applicant)
+
+    with_rows = {row["rushee_id"] for row in attendance}
+    return {
+        "timeframe_id": timeframe_id,
+        "applicants": applicants,
+        "needs_rebuild": any(
+            attendee["rushee_id"] not in with_rows
+            for event in events
+            for attendee in db._lookup("events_rush_attendees", ("event_id",), (event["id"],))
+        ),
+    }
+
+@sql_function("listing_insights_summary")
+def listing_insights_summary(db: FakeSupabaseClient, **params):
+    """supabase/schemas/listing_insights.sql: listing_insights_summary(), clause by clause"""
+    apps = db._lookup("applications", ("listing_id",), (params["p_listing_id"],))
+
+    def url(value):
+        return "N/A" if (value or "") in ("", "N/A") else "hasURL"
+
+    def minor(value):
+        if (value or "") == "" or value.lower() in ("na", "n/a", "n a", "n / a"):
+            return "N/A"
+        return initcap(value)
+
+    grouped = {
+        "colleges": [college for app in apps for college, selected in (app["colleges"] or {}).items() if selected is True],
+        "gpa": ["N/A" if not app["gpa"] else app["gpa"] for app in apps],
+        "gradYear": [app["grad_year"] for app in apps],
+        "major": [initcap(app["major"]) for app in apps],
+        "minor": [minor(app["minor"]) for app in apps],
+        "linkedin": [url(app["linkedin"]) for app in apps],
+        "website": [url(app["website"]) for app in apps],
+    }
+    gpas = [app["gpa"] for app in apps if app["gpa"] is not None]
+
+    return {
+        "dashboard": {
+            "applicantCount": len(apps),
+            "avgGpa": round_numeric(sum(gpas) / len(gpas), 1) if gpas else "N/A",
+            "commonMajor": _most_common([initcap(app["major"]) for app in apps if app["major"]]),
+            "commonGradYear": _most_common([app["grad_year"] for app in apps]),
+        },
+        "distribution": {
+            metric: [
+                {"name": name, "value": value}
+                for name, value in sorted(Counter(names).items(), key=lambda item: (-item[1], json.dumps(item[0])))
+            ]
+            for metric, names in grouped.items()
+        },
+    }
+
+
+def initcap(value: str) -> str:
+    """
+    Postgres initcap(): a letter is upper-cased when the character before it is not
+    alphanumeric (so after spaces, hyphens, apostrophes and underscores) and
+    lower-cased otherwise (so "3d" stays "3d").
+    """
+    result = []
+    after_alnum = False
+    for char in value:
+        converted = char.lower() if after_alnum else char.upper()
+        # toupper()/tolower() map one character to one character
+        result.append(converted if len(converted) == 1 else char)
+        after_alnum = char.isalnum()
+    return "".join(result)
+
+
+def round_numeric(value: float, digits: int) -> float:
+    """
+    Postgres round(value::numeric, digits): the cast keeps 15 significant digits
+    (DBL_DIG), and numeric rounds half away from zero (3.25 -> 3.3, where Python's
+    round() gives 3.2).
+    """
+    exact = Decimal(f"{value:.15g}")
+    return float(exact.quantize(Decimal(1).scaleb(-digits), rounding=ROUND_HALF_UP))
+
+
+def _most_common(values):
+    # GROUP BY value ORDER BY count(*) DESC, value (COLLATE "C", NULLS LAST) LIMIT 1;
+    # a NULL value becomes "N/A" through coalesce(to_jsonb(...), '"N/A"')
+    counts = Counter(values)
+    if not counts:
+        return "N/A"
+    value = min(counts, key=lambda value: (-counts[value], value is None, value if value is not None else 0))
+    return "N/A" if value is None else value
@@ -0,0 +1,179 @@
+import random
+import uuid
+from dataclasses import dataclass
+from typing import Dict, List
+
+from tests.fakes import FakeSupabaseClient
+
+COLLEGES = ["CAS", "Pardee", "QST", "COM", "ENG", "CFA", "CDS", "CGS", "Sargent", "SHA", "Wheelock", "Other"]
+MAJORS = [
+    "economics", "finance", "computer science", "mathematics", "data science", "accounting",
+    "marketing", "international relations", "biology", "psychology", "philosophy",
+    "mechanical engineering", "political science", "statistics", "management information systems",
+]
+MINORS = ["n/a", "N/A", "", "business administration", "computer science", "mathematics", "spanish", "statistics"]
+QUESTIONS = [
+    "Why are you interested in Phi Chi Theta?",
+    "Describe a time you worked on a team.",
+    "What is something you are passionate about?",
+]
+EVENT_NAMES = [
+    "Info Session 1", "Info Session 2", "Professional Panel", "Resume Night", "Social Event",
+    "Coffee Chat", "Case Workshop", "Networking Night", "Alumni Panel", "Game Night",
+]
+FIRST_NAMES = ["Ada", "Bo", "Cy", "Dee", "Eli", "Fay", "Gus", "Hal", "Ivy", "Jo", "Kai", "Lu"]
+LAST_NAMES = ["Ng", "Ortiz", "Patel", "Quinn", "Rossi", "Silva", "Tran", "Ueda", "Vance", "Wu"]
+WORDS = "we build teams lead projects learn quickly care deeply about community finance data impact".split()
+
+
+@dataclass(frozen=True)
+class Scale:
+    """Size of a synthetic dataset; rushees and applications are spread over the listings."""
+
+    listings: int = 20
+    applications_per_listing: int = 1000
+    events_per_timeframe: int = 10
+    rushees: int = 20_000
+    max_events_per_rushee: int = 4
+    # share of a listing's applicants who also attended its rush events
+    rushee_application_rate: float = 0.6
+
+
+class SyntheticDataset:
+    """
+    Deterministic rows for every table touched by the listing, insights and rush
+    services, shaped like the rows PostgREST returns for supabase/schemas/*.sql.
+    The same `seed` and `scale` always produce the same rows.
+    """
+
+    def __init__(self, scale: Scale = Scale(), seed: int = 1234):
+        self.scale = scale
+        self._rng = random.Random(seed)
+        self.tables: Dict[str, List[Dict]] = {
+            "listings": [],
+            "applications": [],
+            "event_timeframes_rush": [],
+            "events_rush": [],
+            "rushees": [],
+            "events_rush_attendees": [],
+        }
+        self._generate()
+
+    @property
+    def listing_ids(self) -> List[str]:
+        return [listing["id"] for listing in self.tables["listings"]]
+
+    @property
+    def timeframe_ids(self) -> List[str]:
+        return [timeframe["id"] for timeframe in self.tables["event_timeframes_rush"]]
+
+    def applications_for(self, listing_id: str) -> List[Dict]:
+        return [a for a in self.tables["applications"] if a["listing_id"] == listing_id]
+
+    def load_into(self, client: FakeSupabaseClient) -> FakeSupabaseClient:
+        for table_name, rows in self.tables.items():
+            client.seed(table_name, rows)
+        return client
+
+    def application(self, listing_id: str, email: str = None) -> Dict:
+        """Returns one application row (without an `id`) for `listing_id`."""
+        rng = self._rng
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        has_gpa = rng.random() < 0.9
+        return {
+            "listing_id": listing_id,
+            "email": email or f"{first}.{last}.{rng.getrandbits(32):x}@bu.edu".lower(),
+            "first_name": first,
+            "last_name": last,
+            "preferred_name": rng.choice([None, first]),
+            "gpa": round(rng.uniform(2.4, 4.0), 2) if has_gpa else None,
+            "has_gpa": has_gpa,
+            "grad_month": rng.choice(["May", "December"]),
+            "grad_year": rng.randint(2025, 2029),
+            "image": f"https://bucket.s3.amazonaws.com/image/{listing_id}/{last}_{first}.png",
+            "website": rng.choice([None, "", "N/A", f"https://{first.lower()}.dev"]),
+            "linkedin": rng.choice([None, f"https://linkedin.com/in/{first.lower()}{last.lower()}"]),
+            "resume": f"https://bucket.s3.amazonaws.com/resume/{listing_id}/{last}_{first}.pdf",
+            "major": rng.choice(MAJORS),
+            "minor": rng.choice(MINORS),
+            "phone": f"617{rng.randint(0, 9_999_999):07d}",
+            "colleges": {college: rng.random() < 0.15 for college in COLLEGES},
+            "responses": [
+                {
+                    "question": question,
+                    "response": " ".join(rng.choice(WORDS) for _ in range(rng.randint(40, 120))),
+                }
+                for question in QUESTIONS
+            ],
+        }
+
+    def _uuid(self) -> str:
+        return str(uuid.UUID(int=self._rng.getrandbits(128), version=4))
+
+    def _generate(self):
+        rng, scale, tables = self._rng, self.scale, self.tables
+        rushees_per_timeframe = scale.rushees // scale.listings
+
+        for index in range(scale.listings):
+            listing_id = self._uuid()
+            tables["listings"].append(
+                {
+                    "id": listing_id,
+                    "title": f"Recruitment Cycle {index + 1}",
+                    "date_created": f"20{10 + index:02d}-08-01T00:00:00+00:00",
+                    "deadline": "2099-12-31T23:59:59+00:00",
+                    "is_encrypted": False,
+                    "is_visible": True,
+                    "questions": [{"question": q, "additional": ""} for q in QUESTIONS],
+                }
+            )
+
+            timeframe_id = self._uuid()
+            tables["event_timeframes_rush"].append(
+                {
+                    "id": timeframe_id,
+                    "listing_id": listing_id,
+                    "name": f"Rush {index + 1}",
+                    "default_rush_timeframe": index == scale.listings - 1,
+                }
+            )
+
+            event_ids = []
+            for event_index in range(scale.events_per_timeframe):
+                event_ids.append(self._uuid())
+                tables["events_rush"].append(
+                    {
+                        "id": event_ids[-1],
+                        "timeframe_id": timeframe_id,
+                        "name": EVENT_NAMES[event_index % len(EVENT_NAMES)],
+                        "code": f"{rng.randint(0, 999_999):06d}",
+                        "location": "GSU Ballroom",
+                        "date": f"20{10 + index:02d}-09-{event_index + 1:02d}T18:00:00+00:00",
+                        "deadline": f"20{10 + index:02d}-09-{event_index + 1:02d}T21:00:00+00:00",
+                        "event_cover_image": f"https://bucket.s3.amazonaws.com/image/rush/{event_ids[-1]}/v1.png",
+                        "event_cover_image_name": "cover.png",
+                        "event_cover_image_version": "v1",
+                    }
+                )
+
+            emails = []
+            for _ in range(rushees_per_timeframe):
+                rushee_id = self._uuid()
+                email = f"rushee.{rushee_id[:8]}@bu.edu"
+                emails.append(email)
+                tables["rushees"].append(
+                    {"id": rushee_id, "name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}", "email": email}
+                )
+                attended = rng.sample(event_ids, rng.randint(0, min(scale.max_events_per_rushee, len(event_ids))))
+                tables["events_rush_attendees"].extend(
+                    {
+                        "event_id": event_id,
+                        "rushee_id": rushee_id,
+                        "checkin_time": f"20{10 + index:02d}-09-01T18:{rng.randint(0, 59):02d}:00+00:00",
+                    }
+                    for event_id in attended
+                )
+
+            for _ in range(scale.applications_per_listing):
+                email = rng.choice(emails) if rng.random() < scale.rushee_application_rate else None
+                tables["applications"].append({"id": self._uuid(), **self.application(listing_id, email)})
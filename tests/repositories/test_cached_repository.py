@@ -0,0 +1,170 @@
+import pytest
+from unittest.mock import MagicMock
+from chalice.app import NotFoundError
+from chalicelib.repositories.cached_repository import CacheConfig, CachedRepository
+from chalicelib.repositories.repository_factory import RepositoryFactory
+from tests.fakes import FakeSupabaseClient
+
+
+@pytest.fixture
+def mock_client():
+    return MagicMock()
+
+
+def make_repo(mock_client, clock, **config):
+    return CachedRepository(
+        "roles",
+        "id",
+        client=mock_client,
+        cache_config=CacheConfig(**{"ttl_seconds": 60, "max_entries": 8, **config}),
+        clock=clock,
+    )
+
+
+def test_cached_repository_serves_repeated_reads_from_memory(mock_client, clock):
+    repo = make_repo(mock_client, clock)
+    select_execute = mock_client.table().select().execute
+    select_execute.return_value.data = [{"id": "1", "name": "admin"}]
+    select_execute.reset_mock()
+
+    assert repo.get_all() == [{"id": "1", "name": "admin"}]
+    assert repo.get_all() == [{"id": "1", "name": "admin"}]
+
+    select_execute.assert_called_once()
+    assert repo.stats()["hits"] == 1
+    assert repo.stats()["misses"] == 1
+    assert repo.stats()["hit_ratio"] == 0.5
+
+
+def test_cached_repository_returns_copies(mock_client, clock):
+    repo = make_repo(mock_client, clock)
+    mock_client.table().select().eq().execute.return_value.data = [
+        {"id": "1", "code": "secret"}
+    ]
+
+    repo.get_by_id("1").pop("code")
+
+    assert repo.get_by_id("1") == {"id": "1", "code": "secret"}
+
+
+def test_cached_repository_expires_entries_after_ttl(mock_client, clock):
+    repo = make_repo(mock_client, clock)
+    select_execute = mock_client.table().select().execute
+    select_execute.return_value.data = []
+    select_execute.reset_mock()
+
+    repo.get_all()
+    clock.now = 60
+    repo.get_all()
+
+    assert select_execute.call_count == 2
+
+
+def test_cached_repository_evicts_least_recently_used(mock_client, clock):
+    repo = make_repo(mock_client, clock, max_entries=2)
+    mock_client.table().select().eq().execute.return_value.data = [{"id": "x"}]
+
+    repo.get_by_id("1")
+    repo.get_by_id("2")
+    repo.get_by_id("1")
+    repo.get_by_id("3")
+
+    assert repo.stats()["size"] == 2
+    repo.get_by_id("1")
+    assert repo.stats()["hits"] == 2
+
+
+def test_cached_repository_writes_invalidate_cache(mock_client, clock):
+    repo = make_repo(mock_client, clock)
+    select_execute = mock_client.table().select().execute
+    select_execute.return_value.data = []
+    select_execute.reset_mock()
+
+    repo.get_all()
+    repo.create({"name": "eboard"})
+    repo.get_all()
+
+    assert select_execute.call_count == 2
+
+
+def test_cached_repository_parent_writes_invalidate_dependents(mock_client, clock):
+    parent = CachedRepository("listings", "id", client=mock_client, clock=clock)
+    child = make_repo(mock_client, clock, invalidated_by=("listings",))
+    unrelated = make_repo(mock_client, clock)
+    select_execute = mock_client.table().select().execute
+    select_execute.return_value.data = []
+    child.get_all()
+    unrelated.get_all()
+    select_execute.reset_mock()
+
+    parent.delete("1")
+    child.get_all()
+    unrelated.get_all()
+
+    assert select_execute.call_count == 1
+
+
+def test_cached_repository_cascaded_deletes_are_not_served_from_cache():
+    client = FakeSupabaseClient()
+    client.seed("listings", [{"id": "l-1", "title": "Fall Recruitment"}])
+    client.seed("event_timeframes_rush", [{"id": "t-1", "listing_id": "l-1", "name": "Fall"}])
+    client.seed("events_rush", [{"id": "e-1", "timeframe_id": "t-1", "name": "Info Session"}])
+    listings_repo = RepositoryFactory.listings(client=client)
+    timeframes_repo = RepositoryFactory.event_timeframes_rush(client=client)
+    events_repo = RepositoryFactory.events_rush(client=client)
+    assert len(timeframes_repo.get_all()) == len(events_repo.get_all_by_field("timeframe_id", "t-1")) == 1
+
+    # cascades to the timeframe, then to its events
+    listings_repo.delete("l-1")
+
+    assert timeframes_repo.get_all() == []
+    assert events_repo.get_all_by_field("timeframe_id", "t-1") == []
+
+
+def test_cached_repository_toggle_reads_fresh_value(mock_client, clock):
+    repo = make_repo(mock_client, clock)
+    query = mock_client.table().select().eq()
+    query.execute.return_value.data = [{"id": "1", "is_visible": False}]
+    repo.get_by_id("1")
+
+    # another container toggled the row; the cached copy is stale
+    query.execute.return_value.data = [{"id": "1", "is_visible": True}]
+    mock_client.table().update().eq().execute.return_value.data = [
+        {"id": "1", "is_visible": False}
+    ]
+
+    repo.toggle_boolean_field("1", "is_visible")
+
+    mock_client.table().update.assert_called_with({"is_visible": False})
+
+
+def test_cached_repository_skips_embedded_selects(mock_client, clock):
+    repo = make_repo(mock_client, clock)
+    select_execute = mock_client.table().select().execute
+    select_execute.return_value.data = []
+    select_execute.reset_mock()
+
+    repo.get_all(select_query="*, events_rush(*)")
+    repo.get_all(select_query="*, events_rush(*)")
+
+    assert select_execute.call_count == 2
+
+
+def test_cached_repository_does_not_cache_not_found(mock_client, clock):
+    repo = make_repo(mock_client, clock)
+    query = mock_client.table().select().eq()
+    query.execute.return_value.data = []
+
+    with pytest.raises(NotFoundError):
+        repo.get_by_id("1")
+
+    query.execute.return_value.data = [{"id": "1"}]
+    assert repo.get_by_id("1") == {"id": "1"}
+
+
+def test_repository_factory_enables_cache_per_table(mock_client):
+    assert isinstance(RepositoryFactory.roles(client=mock_client), CachedRepository)
+    assert isinstance(RepositoryFactory.listings(client=mock_client), CachedRepository)
+    assert not isinstance(
+        RepositoryFactory.applications(client=mock_client), CachedRepository
+    )
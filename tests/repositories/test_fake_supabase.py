@@ -0,0 +1,112 @@
+import pytest
+from postgrest.exceptions import APIError
+
+from chalicelib.repositories.base_repository import BaseRepository
+from chalicelib.services.MemberService import MemberService
+from tests.fakes import FakeSupabaseClient, load_schema
+
+
+@pytest.fixture
+def client():
+    client = FakeSupabaseClient()
+    client.seed(
+        "roles",
+        [{"id": "r-admin", "name": "admin"}, {"id": "r-member", "name": "member"}],
+    )
+    client.seed(
+        "users",
+        [
+            {"id": "u-1", "name": "Ada", "email": "ada@example.com", "is_eboard": False, "is_new_user": False},
+            {"id": "u-2", "name": "Bob", "email": "bob@example.com", "is_eboard": True, "is_new_user": True},
+        ],
+    )
+    client.seed("user_roles", [{"user_id": "u-1", "role_id": "r-admin"}])
+    return client
+
+
+def test_load_schema_reads_keys_and_relationships():
+    schema = load_schema()
+
+    assert schema["user_roles"].primary_key == ("user_id", "role_id")
+    assert ("listing_id",) in schema["event_timeframes_rush"].unique
+    assert ("name",) in schema["roles"].unique
+    assert schema["ping_health"].columns["id"].default.startswith("gen_random_uuid")
+    assert "checkin_time" in schema["events_rush_attendees"].columns
+    assert [fk.ref_table for fk in schema["events_rush_attendees"].foreign_keys] == [
+        "events_rush",
+        "rushees",
+    ]
+
+
+def test_repository_reads_and_writes_against_fake(client):
+    repo = BaseRepository("users", "id", client=client)
+
+    repo.update("u-2", {"is_new_user": False})
+
+    assert repo.get_by_id("u-2")["is_new_user"] is False
+    assert [u["id"] for u in repo.get_all_by_field("is_eboard", True)] == ["u-2"]
+    assert repo.get_many_by_ids(["u-1", "missing"]).missing == ["missing"]
+
+
+def test_insert_violating_primary_key_raises_unique_violation(client):
+    repo = BaseRepository("user_roles", "user_id", client=client)
+
+    with pytest.raises(APIError) as exc_info:
+        repo.create({"user_id": "u-1", "role_id": "r-admin"})
+
+    assert exc_info.value.code == "23505"
+    assert len(client.dump("user_roles")) == 1
+
+
+def test_upsert_ignoring_duplicates_keeps_existing_rows(client):
+    repo = BaseRepository("user_roles", "user_id", client=client)
+
+    repo.sync_relation(owner_id="u-1", desired_ids=["r-admin", "r-member"], related_field="role_id")
+
+    assert sorted(r["role_id"] for r in client.dump("user_roles")) == ["r-admin", "r-member"]
+
+
+def test_member_get_all_resolves_nested_embeds(client):
+    service = MemberService(
+        users_repo=BaseRepository("users", "id", client=client),
+        user_roles_repo=BaseRepository("user_roles", "user_id", client=client),
+        roles_repo=BaseRepository("roles", "id", client=client),
+    )
+
+    users = {u["id"]: u for u in service.get_all()}
+
+    assert users["u-1"]["user_roles"] == [{"role": {"id": "r-admin", "name": "admin"}}]
+    assert users["u-2"]["user_roles"] == []
+
+
+def test_many_to_many_and_one_to_one_embeds(client):
+    client.seed("listings", [{"id": "l-1", "title": "Fall", "deadline": "2025-01-01", "is_encrypted": False, "is_visible": True}])
+    client.seed("event_timeframes_rush", [{"id": "t-1", "listing_id": "l-1", "name": "Fall Rush"}])
+    client.seed("events_rush", [{"id": "e-1", "timeframe_id": "t-1", "name": "Info Session 1"}])
+    client.seed("rushees", [{"id": "rh-1", "name": "Cy", "email": "cy@example.com"}])
+    client.seed("events_rush_attendees", [{"event_id": "e-1", "rushee_id": "rh-1"}])
+
+    events = client.table("events_rush").select("*, rushees(*)").execute().data
+    listing = client.table("listings").select("id, timeframe: event_timeframes_rush (id)").execute().data
+
+    assert events[0]["rushees"] == [{"id": "rh-1", "name": "Cy", "email": "cy@example.com"}]
+    assert listing == [{"id": "l-1", "timeframe": {"id": "t-1"}}]
+
+
+def test_delete_cascades_to_referencing_rows(client):
+    client.table("users").delete().eq("id", "u-1").execute()
+
+    assert client.dump("user_roles") == []
+
+
+def test_round_trips_are_counted_and_delayed():
+    slept = []
+    client = FakeSupabaseClient(latency_seconds=0.05, sleep=slept.append)
+    client.register_rpc("count_roles", lambda db, **params: len(db.dump("roles")))
+
+    client.table("roles").select("*").execute()
+    assert client.rpc("count_roles").execute().data == 0
+
+    assert slept == [0.05, 0.05]
+    assert client.stats()["round_trips"] == 2
+    assert client.stats()["by_call"] == {"roles.select": 1, "rpc.count_roles": 1}
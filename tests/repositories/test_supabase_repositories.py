@@ -1,10 +1,11 @@
 import pytest
 from unittest.mock import patch, MagicMock
 from chalicelib.modules.supabase_client import SupabaseClient
-from chalicelib.repositories.base_repository import BaseRepository
+from chalicelib.repositories.base_repository import BaseRepository, chunk_in_values
 from chalicelib.repositories.repository_factory import RepositoryFactory
 from chalice.app import NotFoundError
 from postgrest.exceptions import APIError
+from chalicelib.utils.pagination import Page, decode_cursor, encode_cursor
 
 
 @pytest.fixture
@@ -262,3 +263,162 @@ def test_base_repository_delete_raises_api_error_on_api_error(mock_supabase):
 
     with pytest.raises(APIError) as exc_info:
         repo.delete("abc123")
+
+
+def test_chunk_in_values_deduplicates_and_respects_budget():
+    values = ["a" * 7, "b" * 7, "a" * 7, "c" * 7]
+
+    chunks = chunk_in_values(values, max_chars=20)
+
+    assert chunks == [["a" * 7, "b" * 7], ["c" * 7]]
+
+
+def test_base_repository_get_many_by_ids_returns_found_and_missing(mock_supabase):
+    repo = BaseRepository("test_table", "id")
+    repo.client = mock_supabase
+    mock_supabase.table().select().in_().execute.return_value.data = [
+        {"id": "1", "name": "Alice"},
+        {"id": "3", "name": "Carol"},
+    ]
+
+    result = repo.get_many_by_ids(["1", "2", "3", "1"])
+    mock_supabase.table().select().in_.assert_called_with("id", ["1", "2", "3"])
+
+    assert result.found == {
+        "1": {"id": "1", "name": "Alice"},
+        "3": {"id": "3", "name": "Carol"},
+    }
+    assert result.missing == ["2"]
+
+
+def test_base_repository_get_many_by_field_in_chunks_large_lists(mock_supabase):
+    repo = BaseRepository("test_table", "id")
+    repo.client = mock_supabase
+    mock_supabase.table().select().in_().execute.return_value.data = [{"id": "x"}]
+    mock_supabase.table().select().in_.reset_mock()
+
+    ids = [f"{i:036d}" for i in range(500)]
+    result = repo.get_many_by_field_in("id", ids)
+
+    calls = mock_supabase.table().select().in_.call_args_list
+    assert len(calls) > 1
+    assert [value for call in calls for value in call.args[1]] == ids
+    assert len(result) == len(calls)
+
+
+def test_base_repository_delete_many_by_ids_reports_missing(mock_supabase):
+    repo = BaseRepository("test_table", "id")
+    repo.client = mock_supabase
+    mock_supabase.table().delete().in_().execute.return_value.data = [{"id": "1"}]
+
+    result = repo.delete_many_by_ids(["1", "2"])
+    mock_supabase.table().delete().in_.assert_called_with("id", ["1", "2"])
+
+    assert list(result.found) == ["1"]
+    assert result.missing == ["2"]
+
+
+def test_base_repository_create_many_inserts_rows_in_one_call(mock_supabase):
+    repo = BaseRepository("test_table", "id")
+    repo.client = mock_supabase
+    mock_supabase.table().insert().execute.return_value.data = [{"id": 1}, {"id": 2}]
+
+    result = repo.create_many([{"id": 1}, {"id": 2}])
+    mock_supabase.table().insert.assert_called_with([{"id": 1}, {"id": 2}])
+
+    assert result == [{"id": 1}, {"id": 2}]
+
+
+def test_base_repository_upsert_many_passes_conflict_target(mock_supabase):
+    repo = BaseRepository("test_table", "id")
+    repo.client = mock_supabase
+    mock_supabase.table().upsert().execute.return_value.data = [{"id": 1}]
+
+    repo.upsert_many([{"id": 1}], on_conflict="id")
+    mock_supabase.table().upsert.assert_called_with(
+        [{"id": 1}], on_conflict="id", ignore_duplicates=False
+    )
+
+
+def test_base_repository_sync_relation_deletes_stale_and_upserts_desired(mock_supabase):
+    repo = BaseRepository("user_roles", "user_id")
+    repo.client = mock_supabase
+    delete_query = mock_supabase.table().delete().eq()
+
+    repo.sync_relation("user-1", ["r1", "r2"], related_field="role_id")
+
+    mock_supabase.table().delete().eq.assert_called_with("user_id", "user-1")
+    delete_query.not_.in_.assert_called_with("role_id", ["r1", "r2"])
+    delete_query.not_.in_().execute.assert_called_once()
+    mock_supabase.table().upsert.assert_called_with(
+        [
+            {"user_id": "user-1", "role_id": "r1"},
+            {"user_id": "user-1", "role_id": "r2"},
+        ],
+        on_conflict="user_id,role_id",
+        ignore_duplicates=True,
+    )
+
+
+def test_base_repository_sync_relation_with_no_desired_ids_clears_owner(mock_supabase):
+    repo = BaseRepository("user_roles", "user_id")
+    repo.client = mock_supabase
+    delete_query = mock_supabase.table().delete().eq()
+
+    assert repo.sync_relation("user-1", [], related_field="role_id") == []
+
+    delete_query.execute.assert_called_once()
+    delete_query.not_.in_.assert_not_called()
+
+
+def test_base_repository_get_page_returns_next_cursor_when_more_rows(mock_supabase):
+    repo = BaseRepository("test_table", "id")
+    repo.client = mock_supabase
+    query = mock_supabase.table().select()
+    query.order().limit().execute.return_value.data = [{"id": 1}, {"id": 2}, {"id": 3}]
+
+    page = repo.get_page(limit=2)
+
+    query.order.assert_called_with("id")
+    query.order().limit.assert_called_with(3)
+    assert page.items == [{"id": 1}, {"id": 2}]
+    assert decode_cursor(page.next_cursor) == 2
+
+
+def test_base_repository_get_page_continues_after_cursor(mock_supabase):
+    repo = BaseRepository("test_table", "id")
+    repo.client = mock_supabase
+    query = mock_supabase.table().select().gt()
+    query.order().limit().execute.return_value.data = [{"id": 3}]
+
+    page = repo.get_page(limit=2, cursor=encode_cursor(2))
+
+    mock_supabase.table().select().gt.assert_called_with("id", 2)
+    assert page.items == [{"id": 3}]
+    assert page.next_cursor is None
+
+
+def test_base_repository_get_page_uses_in_filter_for_list_values(mock_supabase):
+    repo = BaseRepository("test_table", "id")
+    repo.client = mock_supabase
+    query = mock_supabase.table().select().eq().in_()
+    query.order().limit().execute.return_value.data = [{"id": 1}]
+
+    page = repo.get_page(limit=2, filters={"status": "open", "listing_id": ("l-1", "l-2")})
+
+    mock_supabase.table().select().eq.assert_called_with("status", "open")
+    mock_supabase.table().select().eq().in_.assert_called_with("listing_id", ["l-1", "l-2"])
+    assert page.items == [{"id": 1}]
+
+
+def test_base_repository_iter_all_streams_every_page(mock_supabase):
+    repo = BaseRepository("test_table", "id")
+    pages = [
+        Page(items=[{"id": 1}, {"id": 2}], next_cursor=encode_cursor(2)),
+        Page(items=[{"id": 3}], next_cursor=None),
+    ]
+
+    with patch.object(repo, "get_page", side_effect=pages) as mock_get_page:
+        assert list(repo.iter_all(page_size=2)) == [{"id": 1}, {"id": 2}, {"id": 3}]
+
+    assert mock_get_page.call_args_list[1].kwargs["cursor"] == encode_cursor(2)
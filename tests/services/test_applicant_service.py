@@ -1,6 +1,10 @@
 import pytest
 from unittest.mock import patch, Mock
+from chalicelib.repositories.repository_factory import RepositoryFactory
 from chalicelib.services.ApplicantService import ApplicantService
+from tests.fakes import FakeSupabaseClient
+from tests.fakes.reference import applicants_from_listing_in_python
+from tests.fakes.synthetic import Scale, SyntheticDataset
 
 SAMPLE_LISTING = {
     "id": "1",
@@ -28,13 +32,11 @@ SAMPLE_APPLICANTS = [
 def service():
     mock_applicants_repo = Mock()
     mock_listings_repo = Mock()
-    mock_event_timeframes_rush_repo = Mock()
     mock_events_rush_service = Mock()
 
     mock_applicants_service = ApplicantService(
         applications_repo=mock_applicants_repo,
         listings_repo=mock_listings_repo,
-        event_timeframes_rush_repo=mock_event_timeframes_rush_repo,
         events_rush_service=mock_events_rush_service,
     )
     return (
@@ -42,12 +44,11 @@ def service():
         mock_events_rush_service,
         mock_applicants_repo,
         mock_listings_repo,
-        mock_event_timeframes_rush_repo,
     )
 
 
 def test_get_applicant(service):
-    applicants_service, _, mock_applicants_repo, _, _ = service
+    applicants_service, _, mock_applicants_repo, _ = service
 
     mock_applicants_repo.get_by_id.return_value = SAMPLE_APPLICANTS
 
@@ -58,7 +59,7 @@ def test_get_applicant(service):
 
 
 def test_get_all_applicants(service):
-    applicants_service, _, mock_applicants_repo, _, _ = service
+    applicants_service, _, mock_applicants_repo, _ = service
 
     mock_applicants_repo.get_all.return_value = SAMPLE_APPLICANTS
 
@@ -72,24 +73,142 @@ def test_get_all_applicants(service):
 def test_get_all_applicants_from_listing_unencrypted_no_events(service):
     (
         applicants_service,
-        _,
+        mock_events_rush_service,
         mock_applicants_repo,
         mock_listings_repo,
-        mock_event_timeframes_rush_repo,
     ) = service
 
-    mock_applicants_repo.get_all_by_field.return_value = SAMPLE_APPLICANTS
+    mock_applicants_repo.rpc.return_value = {
+        "timeframe_id": None,
+        "applicants": SAMPLE_APPLICANTS,
+        "needs_rebuild": False,
+    }
     mock_listings_repo.get_by_id.return_value = SAMPLE_LISTING
-    mock_event_timeframes_rush_repo.get_with_custom_select.return_value = None
 
     result = applicants_service.get_all_from_listing(SAMPLE_LISTING["id"])
 
     mock_listings_repo.get_by_id.assert_called_once_with(id_value=SAMPLE_LISTING["id"])
-    mock_applicants_repo.get_all_by_field.assert_called_once_with(
-        field="listing_id", value=SAMPLE_LISTING["id"]
+    mock_applicants_repo.rpc.assert_called_once_with(
+        "listing_applicants_with_rush", {"p_listing_id": SAMPLE_LISTING["id"]}
     )
+    mock_events_rush_service.rebuild_rushee_attendance.assert_not_called()
 
     assert result == SAMPLE_APPLICANTS
     assert len(result) == 2
 
-# TODO: Add unittests for listing with rush events
\ No newline at end of file
+
+def test_get_all_applicants_from_listing_rebuilds_missing_attendance(service):
+    (
+        applicants_service,
+        mock_events_rush_service,
+        mock_applicants_repo,
+        mock_listings_repo,
+    ) = service
+
+    mock_listings_repo.get_by_id.return_value = SAMPLE_LISTING
+    mock_applicants_repo.rpc.side_effect = [
+        {"timeframe_id": "t-1", "applicants": SAMPLE_APPLICANTS, "needs_rebuild": True},
+        {"timeframe_id": "t-1", "applicants": SAMPLE_APPLICANTS, "needs_rebuild": False},
+    ]
+
+    result = applicants_service.get_all_from_listing(SAMPLE_LISTING["id"])
+
+    mock_events_rush_service.rebuild_rushee_attendance.assert_called_once_with("t-1")
+    assert mock_applicants_repo.rpc.call_count == 2
+    assert result == SAMPLE_APPLICANTS
+
+
+@pytest.fixture
+def rush_dataset():
+    return SyntheticDataset(Scale(listings=2, applications_per_listing=60, rushees=80), seed=24)
+
+
+@pytest.fixture
+def fake_applicant_service(events_rush_service):
+    def build(client) -> ApplicantService:
+        return ApplicantService(
+            applications_repo=RepositoryFactory.applications(client=client),
+            listings_repo=RepositoryFactory.listings(client=client),
+            events_rush_service=events_rush_service(client),
+        )
+
+    return build
+
+
+def test_get_all_applicants_from_listing_matches_python_join(rush_dataset, fake_applicant_service):
+    client = rush_dataset.load_into(FakeSupabaseClient())
+    service = fake_applicant_service(client)
+
+    for listing_id in rush_dataset.listing_ids:
+        expected = applicants_from_listing_in_python(
+            service.listings_repo,
+            service.applications_repo,
+            RepositoryFactory.event_timeframes_rush(client=client),
+            service.events_rush_service,
+            listing_id,
+        )
+        result = service.get_all_from_listing(listing_id)
+
+        assert sorted(result, key=lambda a: a["id"]) == sorted(expected, key=lambda a: a["id"])
+        assert any("threshold" in applicant for applicant in result)
+
+
+def test_get_all_applicants_from_listing_rebuilds_partial_attendance(rush_dataset, fake_applicant_service):
+    client = rush_dataset.load_into(FakeSupabaseClient())
+    service = fake_applicant_service(client)
+    listing_id = rush_dataset.listing_ids[0]
+    timeframe_id = rush_dataset.timeframe_ids[0]
+    expected = applicants_from_listing_in_python(
+        service.listings_repo,
+        service.applications_repo,
+        RepositoryFactory.event_timeframes_rush(client=client),
+        service.events_rush_service,
+        listing_id,
+    )
+    # attendance predating `rushee_attendance`, then one check-in recorded on its own
+    attendee = client.dump("events_rush_attendees")[0]
+    service.events_rush_service.rushee_attendance_repo.delete_by_field("timeframe_id", timeframe_id)
+    client.seed(
+        "rushee_attendance",
+        [{"timeframe_id": timeframe_id, "rushee_id": attendee["rushee_id"], "attended_events": [attendee["event_id"]], "num_events_attended": 1}],
+    )
+
+    result = service.get_all_from_listing(listing_id)
+
+    assert sorted(result, key=lambda a: a["id"]) == sorted(expected, key=lambda a: a["id"])
+    assert sum("threshold" in applicant for applicant in result) > 1
+
+
+def test_get_all_applicants_from_listing_orders_events_by_date(fake_applicant_service):
+    client = FakeSupabaseClient()
+    client.seed("listings", [{"id": "listing-1", "title": "Rush", "is_encrypted": False}])
+    client.seed("event_timeframes_rush", [{"id": "timeframe-1", "listing_id": "listing-1", "name": "Rush"}])
+    # created out of date order, with names that do not sort by date either
+    client.seed(
+        "events_rush",
+        [
+            {"id": "event-3", "timeframe_id": "timeframe-1", "name": "Coffee Chat", "date": "2026-09-03T18:00:00+00:00"},
+            {"id": "event-1", "timeframe_id": "timeframe-1", "name": "Social", "date": "2026-09-01T18:00:00+00:00"},
+            {"id": "event-2", "timeframe_id": "timeframe-1", "name": "Info Session", "date": "2026-09-02T18:00:00+00:00"},
+        ],
+    )
+    client.seed("rushees", [{"id": "rushee-1", "name": "John Doe", "email": "jdoe@bu.edu"}])
+    client.seed("events_rush_attendees", [{"event_id": "event-3", "rushee_id": "rushee-1"}])
+    client.seed("applications", [{"id": "app-1", "listing_id": "listing-1", "email": "jdoe@bu.edu"}])
+
+    [applicant] = fake_applicant_service(client).get_all_from_listing("listing-1")
+
+    assert list(applicant["events"].items()) == [("Social", False), ("Info Session", False), ("Coffee Chat", True)]
+
+
+def test_get_all_applicants_from_listing_takes_one_query(rush_dataset, fake_applicant_service):
+    client = rush_dataset.load_into(FakeSupabaseClient())
+    service = fake_applicant_service(client)
+    listing_id = rush_dataset.listing_ids[0]
+    service.get_all_from_listing(listing_id)  # builds the rushee attendance
+    client.reset_stats()
+
+    service.get_all_from_listing(listing_id)
+
+    # the listing is cached
+    assert client.stats()["by_call"] == {"rpc.listing_applicants_with_rush": 1}
@@ -84,3 +84,40 @@ def test_delete_timeframe(service):
     result = service_inst.delete_timeframe(timeframe_id=SAMPLE_TIMEFRAMES[0]["id"])
     mock_event_timeframes_member_repo.delete.assert_called_once_with(SAMPLE_TIMEFRAMES[0]["id"])
     assert result == {"statusCode": 200}
+
+
+def test_checkin_reads_event_and_timeframe_in_one_lookup(service):
+    (
+        service_inst,
+        mock_events_member_repo,
+        mock_event_timeframes_member_repo,
+        mock_events_member_attendees_repo,
+        _,
+        _,
+        mock_users_repo,
+        _,
+        _,
+    ) = service
+    mock_users_repo.get_by_id.return_value = {
+        "id": "user-1",
+        "name": "Name",
+        "email": "whyphi@bu.edu",
+    }
+    mock_events_member_repo.get_by_id.return_value = {
+        "id": "event-1",
+        "code": "CODE",
+        "spreadsheet_tab": "Tab",
+        "spreadsheet_col": "D",
+        "name": "Event",
+        "timeframe": {"spreadsheet_id": "sheet-1"},
+    }
+
+    with patch(
+        "chalicelib.services.EventsMemberService.GoogleSheetsModule"
+    ) as MockGoogleSheetsModule, patch("chalicelib.services.EventsMemberService.ses"):
+        gs = MockGoogleSheetsModule.return_value
+        gs.find_matching_email.return_value = 3
+        service_inst.checkin("event-1", {"id": "user-1", "code": "code"})
+
+    mock_event_timeframes_member_repo.get_by_id.assert_not_called()
+    assert gs.find_matching_email.call_args.kwargs["spreadsheet_id"] == "sheet-1"
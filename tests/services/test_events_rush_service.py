@@ -0,0 +1,220 @@
+import copy
+import json
+
+import pytest
+from chalice.app import BadRequestError
+
+from chalicelib.services.EventsRushService import build_rush_analytics
+from tests.fakes import FakeSupabaseClient
+from tests.fakes.fake_supabase import MAX_ROWS
+from tests.fakes.reference import rush_analytics_linear_scan
+from tests.fakes.synthetic import Scale, SyntheticDataset
+
+
+def test_rush_analytics_match_linear_scan_byte_for_byte(events_rush_service):
+    dataset = SyntheticDataset(Scale(listings=1, applications_per_listing=0, rushees=300), seed=21)
+    service = events_rush_service(dataset.load_into(FakeSupabaseClient()))
+    rush_events = service.events_rush_repo.get_with_custom_select(
+        filters={"timeframe_id": dataset.timeframe_ids[0]}, select_query="*, rushees(*)"
+    )
+    rush_events.sort(key=lambda e: e.get("date", ""))
+    # an event nobody attended
+    rush_events.append({**rush_events[0], "id": "e-empty", "rushees": []})
+
+    expected = rush_analytics_linear_scan(copy.deepcopy(rush_events))
+    result = build_rush_analytics(copy.deepcopy(rush_events))
+
+    assert json.dumps(result) == json.dumps(expected)
+
+
+@pytest.fixture
+def rush_client():
+    client = FakeSupabaseClient()
+    client.seed("listings", [{"id": "l-1", "title": "Fall Recruitment"}])
+    client.seed("event_timeframes_rush", [{"id": "t-1", "listing_id": "l-1", "name": "Fall"}])
+    client.seed(
+        "events_rush",
+        [
+            {"id": "e-2", "timeframe_id": "t-1", "name": "Professional Panel", "code": "2", "date": "2025-09-02", "deadline": "2099-01-01T00:00:00+00:00"},
+            {"id": "e-1", "timeframe_id": "t-1", "name": "Info Session 1", "code": "1", "date": "2025-09-01", "deadline": "2099-01-01T00:00:00+00:00"},
+            {"id": "e-3", "timeframe_id": "t-1", "name": "Social Event", "code": "3", "date": "2025-09-03", "deadline": "2099-01-01T00:00:00+00:00"},
+        ],
+    )
+    client.seed(
+        "rushees",
+        [{"id": "r-1", "name": "Ada", "email": "ada@bu.edu"}, {"id": "r-2", "name": "Bo", "email": "bo@bu.edu"}],
+    )
+    client.seed(
+        "events_rush_attendees",
+        [
+            {"event_id": event_id, "rushee_id": rushee_id}
+            for event_id, rushee_id in [("e-1", "r-1"), ("e-2", "r-1"), ("e-3", "r-1"), ("e-2", "r-2")]
+        ],
+    )
+    return client
+
+
+def test_get_rush_timeframe_analytics(rush_client, events_rush_service):
+    analytics = events_rush_service(rush_client).get_rush_timeframe_analytics("t-1")
+
+    assert list(analytics["events"]) == ["e-1", "e-2", "e-3"]
+    assert analytics["events"]["e-2"]["num_attendees"] == 2
+    assert analytics["rushees"]["r-1"]["num_events_attended"] == 3
+    assert analytics["rushees"]["r-1"]["threshold"] is True
+    assert analytics["rushees"]["r-2"]["events_attended"] == [
+        {"id": "e-1", "attended": False},
+        {"id": "e-2", "attended": True},
+        {"id": "e-3", "attended": False},
+    ]
+    assert analytics["rushees"]["r-2"]["threshold"] is False
+
+
+def test_get_rush_timeframe_analytics_uses_timeframe_rules(rush_client, events_rush_service):
+    service = events_rush_service(rush_client)
+    service.update_threshold_rules("t-1", {"mandatory_events": [], "minimum_mandatory_events": 0, "minimum_remaining_events": 1})
+
+    analytics = service.get_rush_timeframe_analytics("t-1")
+
+    assert analytics["timeframe"]["threshold_rules"]["minimum_remaining_events"] == 1
+    assert analytics["rushees"]["r-2"]["threshold"] is True
+
+
+def test_get_rush_timeframe_analytics_reads_rushee_attendance(events_rush_service):
+    # more attendance rows than PostgREST's max_rows
+    dataset = SyntheticDataset(Scale(listings=1, applications_per_listing=0, rushees=3000), seed=23)
+    client = dataset.load_into(FakeSupabaseClient())
+    service = events_rush_service(client)
+    timeframe_id = dataset.timeframe_ids[0]
+    rush_events = service.events_rush_repo.get_with_custom_select(
+        filters={"timeframe_id": timeframe_id}, select_query="*, rushees(*)"
+    )
+    rush_events.sort(key=lambda e: e.get("date", ""))
+    expected_rushees, expected_events = build_rush_analytics(rush_events)
+
+    service.get_rush_timeframe_analytics(timeframe_id)  # builds the attendance rows
+    client.reset_stats()
+    analytics = service.get_rush_timeframe_analytics(timeframe_id)
+
+    assert analytics["rushees"] == expected_rushees
+    assert analytics["events"] == expected_events
+    assert len(client.dump("rushee_attendance")) == len(expected_rushees) > MAX_ROWS
+    # the timeframe and its events are cached; attendees are not joined
+    assert set(client.stats()["by_call"]) == {"rushee_attendance.select"}
+
+
+def test_checkin_rush_records_attendance(rush_client, events_rush_service):
+    service = events_rush_service(rush_client)
+    service.rebuild_rushee_attendance("t-1")
+
+    service.checkin_rush("e-1", {"code": "1", "rusheeId": "r-2"})
+    service.checkin_rush("e-3", {"code": "3", "rusheeId": "r-2"})
+
+    row = next(row for row in rush_client.dump("rushee_attendance") if row["rushee_id"] == "r-2")
+    assert row["attended_events"] == ["e-1", "e-2", "e-3"]
+    assert row["num_events_attended"] == 3
+    assert row["threshold"] is True
+    assert service.get_rush_timeframe_analytics("t-1")["rushees"]["r-2"]["threshold"] is True
+
+
+def test_checkin_rush_builds_attendance_of_earlier_checkins(rush_client, events_rush_service):
+    # check-ins from before the timeframe had attendance rows
+    service = events_rush_service(rush_client)
+
+    service.checkin_rush("e-1", {"code": "1", "rusheeId": "r-2"})
+
+    rows = {row["rushee_id"]: row for row in rush_client.dump("rushee_attendance")}
+    assert rows["r-1"]["attended_events"] == ["e-1", "e-2", "e-3"]
+    assert rows["r-2"]["attended_events"] == ["e-1", "e-2"]
+    assert service.get_rush_timeframe_analytics("t-1")["rushees"]["r-1"]["num_events_attended"] == 3
+
+
+def test_checkin_rush_recounts_checkins_missing_from_the_row(rush_client, events_rush_service):
+    service = events_rush_service(rush_client)
+    service.rebuild_rushee_attendance("t-1")
+    # a check-in whose attendance was never recorded
+    rush_client.seed("events_rush_attendees", [{"event_id": "e-1", "rushee_id": "r-2"}])
+
+    service.checkin_rush("e-3", {"code": "3", "rusheeId": "r-2"})
+
+    row = next(row for row in rush_client.dump("rushee_attendance") if row["rushee_id"] == "r-2")
+    assert (row["attended_events"], row["threshold"]) == (["e-1", "e-2", "e-3"], True)
+
+
+def test_checkin_rush_succeeds_when_attendance_fails(rush_client, events_rush_service):
+    service = events_rush_service(rush_client)
+    rush_client.register_rpc("record_rush_checkin", lambda db, **params: 1 / 0)
+
+    assert service.checkin_rush("e-1", {"code": "1", "rusheeId": "r-2"}) == {"msg": True}
+    assert {"event_id": "e-1", "rushee_id": "r-2"}.items() <= rush_client.dump("events_rush_attendees")[-1].items()
+
+
+def test_rebuild_rushee_attendance_repairs_rows(rush_client, events_rush_service):
+    service = events_rush_service(rush_client)
+    service.rebuild_rushee_attendance("t-1")
+    # check-ins whose attendance was never recorded
+    rush_client.seed(
+        "events_rush_attendees",
+        [{"event_id": "e-1", "rushee_id": "r-2"}, {"event_id": "e-3", "rushee_id": "r-2"}],
+    )
+
+    result = service.rebuild_rushee_attendance("t-1")
+
+    rows = {row["rushee_id"]: row for row in rush_client.dump("rushee_attendance")}
+    assert result == {"timeframe_id": "t-1", "rushees": 2}
+    assert rows["r-1"]["attended_events"] == ["e-1", "e-2", "e-3"]
+    assert rows["r-2"]["attended_events"] == ["e-1", "e-2", "e-3"]
+    assert (rows["r-2"]["num_events_attended"], rows["r-2"]["threshold"]) == (3, True)
+
+
+def test_rebuild_rushee_attendance_updates_rows_in_place(rush_client, events_rush_service):
+    service = events_rush_service(rush_client)
+    service.rebuild_rushee_attendance("t-1")
+    # a rushee whose check-ins were removed since the last rebuild
+    rush_client.seed("rushee_attendance", [{"timeframe_id": "t-1", "rushee_id": "r-9", "attended_events": ["e-1"]}])
+    rush_client.reset_stats()
+
+    service.rebuild_rushee_attendance("t-1")
+
+    assert {row["rushee_id"] for row in rush_client.dump("rushee_attendance")} == {"r-1", "r-2"}
+    assert rush_client.stats()["by_call"]["rushee_attendance.delete"] == 1
+    rush_client.reset_stats()
+
+    service.rebuild_rushee_attendance("t-1")
+
+    # nothing stale: the rows are only upserted
+    assert "rushee_attendance.delete" not in rush_client.stats()["by_call"]
+    assert {row["rushee_id"] for row in rush_client.dump("rushee_attendance")} == {"r-1", "r-2"}
+
+
+def test_update_threshold_rules_rejects_bad_rules(rush_client, events_rush_service):
+    with pytest.raises(BadRequestError, match="must be a list"):
+        events_rush_service(rush_client).update_threshold_rules("t-1", {"remaining_events": "Social Event"})
+
+
+def test_preview_threshold_rules_reuses_analytics_attendance(rush_client, events_rush_service):
+    service = events_rush_service(rush_client)
+    service.get_rush_timeframe_analytics("t-1")
+    rush_client.reset_stats()
+
+    strict = service.preview_threshold_rules("t-1", {})
+    lenient = service.preview_threshold_rules("t-1", {"minimum_remaining_events": 1})
+
+    assert rush_client.stats()["round_trips"] == 0
+    assert (strict["rushees"], strict["passing"]) == (2, 1)
+    assert lenient["passing"] == 1
+    assert lenient["rules"]["minimum_remaining_events"] == 1
+    # the saved rules are unchanged
+    assert rush_client.dump("event_timeframes_rush")[0].get("threshold_rules") is None
+
+
+def test_preview_threshold_rules_loads_attendance_once_after_checkin(rush_client, events_rush_service):
+    service = events_rush_service(rush_client)
+    service.get_rush_timeframe_analytics("t-1")
+    service._forget_attendance("t-1")  # as after a check-in
+    rush_client.reset_stats()
+
+    preview = service.preview_threshold_rules("t-1", {"mandatory_events": ["Social Event"]})
+    service.preview_threshold_rules("t-1", {})
+
+    assert rush_client.stats()["round_trips"] == 1
+    assert (preview["rushees"], preview["passing"]) == (2, 1)
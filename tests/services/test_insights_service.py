@@ -1,3 +1,18 @@
+import copy
+import json
+from unittest.mock import Mock
+
+import pytest
+from chalice.app import BadRequestError, NotFoundError
+
+from chalicelib.repositories.repository_factory import RepositoryFactory
+from chalicelib.services.InsightsService import InsightsService, build_distribution
+from chalicelib.services.ListingService import ListingService
+from chalicelib.utils.insight_stats import numeric_stats
+from tests.fakes import FakeSupabaseClient
+from tests.fakes.reference import pie_chart_insights_linear_scan
+from tests.fakes.synthetic import Scale, SyntheticDataset
+
 # TODO: refactor insights first
 
 # import pytest
@@ -119,3 +134,377 @@
 #     assert len(result) == 2
 #     assert result_dash == json.dumps(SAMPLE_DASHBOARD_NO_GPA, sort_keys=True)
 #     assert result_dist == json.dumps(SAMPLE_DISTRIBUTION_NO_GPA, sort_keys=True)
+
+
+EDGE_CASE_APPLICANTS = [
+    {"id": "a", "gpa": "N/A", "minor": None, "major": "Finance", "website": "", "linkedin": "N/A", "colleges": {"CAS": True, "QST": False}},
+    {"id": "b", "gpa": 3.5, "minor": "n / a", "major": "Finance", "website": "https://b.dev", "colleges": {"QST": True, "CAS": True}},
+    {"id": "c", "gpa": "3.5", "minor": "Math", "major": "Economics", "grad_year": 2026, "colleges": {}},
+    {"id": "d", "gpa": None, "minor": "", "grad_year": 2026.0, "major": "", "colleges": {"QST": True}},
+]
+
+
+def synthetic_applicants(count: int):
+    dataset = SyntheticDataset(Scale(listings=1, applications_per_listing=0, rushees=0), seed=7)
+    return [{"id": str(i), **dataset.application("listing")} for i in range(count)] + EDGE_CASE_APPLICANTS
+
+
+def test_pie_chart_insights_match_linear_scan_byte_for_byte():
+    applicants = synthetic_applicants(2_000)
+    insights_service = InsightsService(applications_repo=Mock(), listing_insights_repo=Mock(), listings_repo=Mock())
+
+    expected = pie_chart_insights_linear_scan(copy.deepcopy(applicants))
+    result = insights_service._get_pie_chart_insights(copy.deepcopy(applicants))
+
+    assert json.dumps(result) == json.dumps(expected)
+
+
+def test_get_insights_reads_grad_year_column_and_null_colleges():
+    # the default format used to read a `gradYear` key that application rows do not
+    # have (no gradYear buckets, commonGradYear "N/A") and failed on null colleges
+    applications_repo = Mock()
+    applications_repo.get_all_by_field.return_value = [
+        {"id": "a", "gpa": 3.5, "major": "finance", "minor": "", "grad_year": 2026, "colleges": None},
+        {"id": "b", "gpa": 3.7, "major": "finance", "minor": "", "grad_year": 2027, "colleges": {"CAS": True}},
+        {"id": "c", "gpa": 3.9, "major": "math", "minor": "", "grad_year": 2026, "colleges": {}},
+    ]
+    insights_service = InsightsService(applications_repo=applications_repo, listing_insights_repo=Mock(), listings_repo=Mock())
+
+    dashboard, distribution = insights_service.get_insights_from_listing("l-1")
+
+    assert dashboard["commonGradYear"] == 2026
+    assert [(bucket["name"], bucket["value"]) for bucket in distribution["gradYear"]] == [(2026, 2), (2027, 1)]
+    assert [(bucket["name"], bucket["value"]) for bucket in distribution["colleges"]] == [("CAS", 1)]
+
+
+def test_build_distribution_stores_members():
+    distribution = build_distribution(EDGE_CASE_APPLICANTS, member=lambda a: a["id"])
+
+    assert distribution["colleges"] == [
+        {"name": "CAS", "value": 2, "applicants": ["a", "b"]},
+        {"name": "QST", "value": 2, "applicants": ["b", "d"]},
+    ]
+    assert distribution["gpa"] == [
+        {"name": "N/A", "value": 2, "applicants": ["a", "d"]},
+        {"name": 3.5, "value": 1, "applicants": ["b"]},
+        {"name": "3.5", "value": 1, "applicants": ["c"]},
+    ]
+    assert distribution["gradYear"] == [{"name": 2026, "value": 2, "applicants": ["c", "d"]}]
+
+
+def test_get_insights_compact_references_applicants_by_id():
+    applications_repo = Mock()
+    applications_repo.get_all_by_field.return_value = copy.deepcopy(EDGE_CASE_APPLICANTS)
+    insights_service = InsightsService(applications_repo=applications_repo, listing_insights_repo=Mock(), listings_repo=Mock())
+
+    full_dashboard, full_distribution = insights_service.get_insights_from_listing("l-1")
+    compact = insights_service.get_insights_from_listing("l-1", response_format="compact")
+
+    assert compact["dashboard"] == full_dashboard
+    assert compact["stats"] == numeric_stats(EDGE_CASE_APPLICANTS)
+    assert list(compact["applicants"]) == ["a", "b", "c", "d"]
+    for metric, buckets in full_distribution.items():
+        assert compact["distribution"][metric] == [
+            {**bucket, "applicants": [a["id"] for a in bucket["applicants"]]}
+            for bucket in buckets
+        ]
+
+
+def test_get_insights_rejects_unknown_format():
+    insights_service = InsightsService(applications_repo=Mock(), listing_insights_repo=Mock(), listings_repo=Mock())
+
+    with pytest.raises(BadRequestError, match="format must be one of"):
+        insights_service.get_insights_from_listing("l-1", response_format="xml")
+
+
+@pytest.fixture
+def supabase():
+    dataset = SyntheticDataset(Scale(listings=1, applications_per_listing=0, rushees=0), seed=11)
+    client = dataset.load_into(FakeSupabaseClient())
+    return client, dataset
+
+
+def test_incremental_aggregates_match_rebuild(supabase):
+    client, dataset = supabase
+    listing_id = dataset.listing_ids[0]
+    listing_service = ListingService(
+        listings_repo=Mock(),
+        applications_repo=RepositoryFactory.applications(client=client),
+        event_timeframes_rush_repo=Mock(),
+        listing_insights_repo=RepositoryFactory.listing_insights(client=client),
+    )
+    insights_service = InsightsService(
+        applications_repo=RepositoryFactory.applications(client=client),
+        listing_insights_repo=RepositoryFactory.listing_insights(client=client),
+        listings_repo=RepositoryFactory.listings(client=client),
+    )
+
+    for i in range(50):
+        application = {"id": f"00000000-0000-4000-8000-{i:012d}", **dataset.application(listing_id)}
+        listing_service.applications_repo.create(data=application)
+        listing_service._record_application_insights(application)
+    incremental = client.dump("listing_insights")[0]
+
+    rebuilt = insights_service.rebuild_listing_aggregates(listing_id)
+
+    for field in ("applicant_count", "gpa_count", "majors", "grad_years", "colleges", "gpa_buckets"):
+        assert incremental[field] == rebuilt[field]
+    assert incremental["gpa_sum"] == pytest.approx(rebuilt["gpa_sum"])
+
+
+def test_first_recorded_application_counts_earlier_applications(supabase):
+    client, dataset = supabase
+    listing_id = dataset.listing_ids[0]
+    # applications made before the listing had a `listing_insights` row
+    client.seed(
+        "applications",
+        [{"id": f"00000000-0000-4000-8000-{i:012d}", **dataset.application(listing_id)} for i in range(10)],
+    )
+    listing_service = ListingService(
+        listings_repo=Mock(),
+        applications_repo=RepositoryFactory.applications(client=client),
+        event_timeframes_rush_repo=Mock(),
+        listing_insights_repo=RepositoryFactory.listing_insights(client=client),
+    )
+    insights_service = InsightsService(
+        applications_repo=RepositoryFactory.applications(client=client),
+        listing_insights_repo=RepositoryFactory.listing_insights(client=client),
+        listings_repo=RepositoryFactory.listings(client=client),
+    )
+
+    application = {"id": "a-1", **dataset.application(listing_id)}
+    listing_service.applications_repo.create(data=application)
+    listing_service._record_application_insights(application)
+
+    assert insights_service.get_listing_dashboard(listing_id)["applicantCount"] == 11
+    assert client.dump("listing_insights")[0]["applicant_count"] == 11
+
+
+def test_get_listing_dashboard_reads_one_row(supabase):
+    client, dataset = supabase
+    listing_id = dataset.listing_ids[0]
+    client.seed("applications", [{"id": "a-1", **dataset.application(listing_id), "major": "finance"}])
+    insights_service = InsightsService(
+        applications_repo=RepositoryFactory.applications(client=client),
+        listing_insights_repo=RepositoryFactory.listing_insights(client=client),
+        listings_repo=RepositoryFactory.listings(client=client),
+    )
+
+    # built on first use, then served from the aggregate row
+    assert insights_service.get_listing_dashboard(listing_id)["commonMajor"] == "Finance"
+    client.reset_stats()
+    assert insights_service.get_listing_dashboard(listing_id)["applicantCount"] == 1
+    assert client.stats()["by_call"] == {"listing_insights.select": 1}
+
+
+def test_get_listing_stats_reads_only_numeric_columns(supabase):
+    client, dataset = supabase
+    listing_id = dataset.listing_ids[0]
+    applications = [{"id": f"a-{i}", **dataset.application(listing_id)} for i in range(50)]
+    client.seed("applications", applications)
+    insights_service = InsightsService(
+        applications_repo=RepositoryFactory.applications(client=client),
+        listing_insights_repo=Mock(),
+        listings_repo=RepositoryFactory.listings(client=client),
+    )
+    client.reset_stats()
+
+    stats = insights_service.get_listing_stats(listing_id)
+
+    assert stats == numeric_stats(applications)
+    assert client.stats()["by_call"] == {"applications.select": 1}
+    # the full format is still the (dashboard, distribution) pair
+    assert len(insights_service.get_insights_from_listing(listing_id)) == 2
+
+
+def test_get_listing_stats_of_unknown_listing(supabase):
+    client, _ = supabase
+    insights_service = InsightsService(
+        applications_repo=RepositoryFactory.applications(client=client),
+        listing_insights_repo=Mock(),
+        listings_repo=RepositoryFactory.listings(client=client),
+    )
+
+    with pytest.raises(NotFoundError):
+        insights_service.get_listing_stats("00000000-0000-4000-8000-000000000000")
+    with pytest.raises(BadRequestError, match="listing_id must be a UUID"):
+        insights_service.get_listing_stats("not-a-listing")
+
+
+def test_get_insights_summary_matches_python_insights(supabase):
+    client, dataset = supabase
+    listing_id = dataset.listing_ids[0]
+    client.seed(
+        "applications",
+        [{"id": f"00000000-0000-4000-8000-{i:012d}", **dataset.application(listing_id)} for i in range(300)]
+        + [
+            {"id": "a-1", **dataset.application(listing_id), "gpa": 0.0, "minor": "N / A", "website": "N/A"},
+            {"id": "a-2", **dataset.application(listing_id), "major": "", "colleges": None},
+        ],
+    )
+    insights_service = InsightsService(
+        applications_repo=RepositoryFactory.applications(client=client),
+        listing_insights_repo=Mock(),
+        listings_repo=RepositoryFactory.listings(client=client),
+    )
+
+    dashboard, distribution = insights_service.get_insights_from_listing(listing_id)
+    client.reset_stats()
+    summary = insights_service.get_insights_from_listing(listing_id, response_format="summary")
+
+    assert client.stats()["by_call"] == {"rpc.listing_insights_summary": 1}
+    assert summary["dashboard"] == dashboard
+    assert list(summary["distribution"]) == list(distribution)
+    for metric, buckets in distribution.items():
+        counts = [bucket["value"] for bucket in summary["distribution"][metric]]
+        assert counts == sorted(counts, reverse=True)
+        assert {json.dumps(b["name"]): b["value"] for b in summary["distribution"][metric]} == {
+            json.dumps(b["name"]): b["value"] for b in buckets
+        }
+
+
+def test_get_insights_summary_follows_postgres_semantics(supabase):
+    # the fake runs a Python stand-in of listing_insights_summary; these are the
+    # values Postgres gives for the same rows
+    client, dataset = supabase
+    listing_id = dataset.listing_ids[0]
+    client.seed(
+        "applications",
+        [
+            {**dataset.application(listing_id), "id": "a-1", "date_applied": "2026-01-03T00:00:00+00:00",
+             "major": "o'NEIL-studies", "grad_year": 2027, "gpa": 3.0},
+            {**dataset.application(listing_id), "id": "a-2", "date_applied": "2026-01-02T00:00:00+00:00",
+             "major": "3d animation", "grad_year": 2028, "gpa": 3.5},
+            {**dataset.application(listing_id), "id": "a-3", "date_applied": "2026-01-01T00:00:00+00:00",
+             "major": "data_science", "grad_year": 2029, "gpa": None},
+        ],
+    )
+    insights_service = InsightsService(
+        applications_repo=RepositoryFactory.applications(client=client),
+        listing_insights_repo=Mock(),
+        listings_repo=RepositoryFactory.listings(client=client),
+    )
+
+    summary = insights_service.get_insights_from_listing(listing_id, response_format="summary")
+
+    # round(3.25::numeric, 1) rounds half away from zero
+    assert summary["dashboard"]["avgGpa"] == 3.3
+    # one application each: the smallest value wins (code point order), not the first row
+    assert summary["dashboard"]["commonMajor"] == "3d Animation"
+    assert summary["dashboard"]["commonGradYear"] == 2027
+    assert {bucket["name"] for bucket in summary["distribution"]["major"]} == {
+        "O'Neil-Studies",
+        "3d Animation",
+        "Data_Science",
+    }
+
+
+def test_dashboards_break_ties_alike(supabase):
+    client, dataset = supabase
+    listing_id = dataset.listing_ids[0]
+    client.seed(
+        "applications",
+        [
+            {**dataset.application(listing_id), "id": "a-1", "major": "finance", "grad_year": 2027},
+            {**dataset.application(listing_id), "id": "a-2", "major": "economics", "grad_year": 2026},
+        ],
+    )
+    insights_service = InsightsService(
+        applications_repo=RepositoryFactory.applications(client=client),
+        listing_insights_repo=RepositoryFactory.listing_insights(client=client),
+        listings_repo=RepositoryFactory.listings(client=client),
+    )
+
+    full, _ = insights_service.get_insights_from_listing(listing_id)
+    summary = insights_service.get_insights_from_listing(listing_id, response_format="summary")["dashboard"]
+    aggregate = insights_service.get_listing_dashboard(listing_id)
+
+    for dashboard in (full, summary, aggregate):
+        assert (dashboard["commonMajor"], dashboard["commonGradYear"]) == ("Economics", 2026)
+
+
+def test_get_insights_summary_of_listing_without_applications(supabase):
+    client, dataset = supabase
+    insights_service = InsightsService(
+        applications_repo=RepositoryFactory.applications(client=client),
+        listing_insights_repo=Mock(),
+        listings_repo=RepositoryFactory.listings(client=client),
+    )
+
+    summary = insights_service.get_insights_from_listing(dataset.listing_ids[0], response_format="summary")
+
+    assert summary["dashboard"] == insights_service._get_dashboard_insights([])
+    assert all(buckets == [] for buckets in summary["distribution"].values())
+
+
+def test_compare_listings_aligns_each_listing_with_its_own_insights():
+    dataset = SyntheticDataset(Scale(listings=3, applications_per_listing=400, rushees=50), seed=13)
+    client = dataset.load_into(FakeSupabaseClient())
+    insights_service = InsightsService(
+        applications_repo=RepositoryFactory.applications(client=client),
+        listing_insights_repo=Mock(),
+        listings_repo=RepositoryFactory.listings(client=client),
+    )
+    # a listing without applications
+    client.seed("listings", [{"id": "00000000-0000-4000-8000-000000000000", "title": "Empty"}])
+    listing_ids = [*dataset.listing_ids[:2], "00000000-0000-4000-8000-000000000000"]
+
+    comparison = insights_service.compare_listings(listing_ids)
+
+    # the 800 applications of all three listings in one read
+    assert client.stats()["by_call"] == {"listings.select": 1, "applications.select": 1}
+    assert comparison["listings"] == listing_ids
+    for position, listing_id in enumerate(listing_ids):
+        dashboard, distribution = insights_service.get_insights_from_listing(listing_id)
+        assert {key: values[position] for key, values in comparison["dashboard"].items()} == dashboard
+        assert comparison["stats"][position] == insights_service.get_listing_stats(listing_id)
+        for metric, buckets in distribution.items():
+            counts = {bucket["name"]: bucket["values"][position] for bucket in comparison["distribution"][metric]}
+            assert {name: count for name, count in counts.items() if count} == {
+                bucket["name"]: bucket["value"] for bucket in buckets
+            }
+
+
+def test_compare_listings_validates_listing_ids():
+    insights_service = InsightsService(applications_repo=Mock(), listing_insights_repo=Mock(), listings_repo=Mock())
+
+    with pytest.raises(BadRequestError, match="at least one listing"):
+        insights_service.compare_listings([])
+    with pytest.raises(BadRequestError, match="At most 10 listings"):
+        insights_service.compare_listings([f"00000000-0000-4000-8000-{i:012d}" for i in range(11)])
+    with pytest.raises(BadRequestError, match="listing_ids must be a UUID"):
+        insights_service.compare_listings(["00000000-0000-4000-8000-000000000000", "l-1"])
+    insights_service.applications_repo.iter_all.assert_not_called()
+
+
+def test_compare_listings_normalizes_and_checks_listing_ids(supabase):
+    client, dataset = supabase
+    listing_id = dataset.listing_ids[0]
+    client.seed("applications", [{"id": "a-1", **dataset.application(listing_id)}])
+    insights_service = InsightsService(
+        applications_repo=RepositoryFactory.applications(client=client),
+        listing_insights_repo=Mock(),
+        listings_repo=RepositoryFactory.listings(client=client),
+    )
+
+    comparison = insights_service.compare_listings([listing_id.upper(), f" {listing_id} "])
+
+    assert comparison["listings"] == [listing_id]
+    assert comparison["dashboard"]["applicantCount"] == [1]
+    with pytest.raises(NotFoundError, match="00000000-0000-4000-8000-000000000000"):
+        insights_service.compare_listings([listing_id, "00000000-0000-4000-8000-000000000000"])
+
+
+def test_get_listing_dashboard_of_unknown_listing(supabase):
+    client, _ = supabase
+    insights_service = InsightsService(
+        applications_repo=RepositoryFactory.applications(client=client),
+        listing_insights_repo=RepositoryFactory.listing_insights(client=client),
+        listings_repo=RepositoryFactory.listings(client=client),
+    )
+
+    with pytest.raises(NotFoundError):
+        insights_service.get_listing_dashboard("00000000-0000-4000-8000-000000000000")
+    with pytest.raises(BadRequestError):
+        insights_service.get_listing_dashboard("not-a-listing")
+    assert client.dump("listing_insights") == []
@@ -44,6 +44,7 @@ def service():
         listings_repo=mock_listings_repo,
         applications_repo=mock_applicants_repo,
         event_timeframes_rush_repo=mock_events_rush_repo,
+        listing_insights_repo=Mock(),
     )
     return mock_listing_service, mock_listings_repo, mock_applicants_repo, mock_events_rush_repo
 
@@ -366,3 +367,31 @@ def test_apply_deadline_passed(mock_validate, mock_datetime, service):
     assert isinstance(response, Response)
     assert response.status_code == 410
     assert "deadline" in response.body.lower()
+
+
+def test_record_application_insights_calls_rpc(service):
+    listing_service, _, _, _ = service
+
+    listing_service._record_application_insights(
+        {"listing_id": "1", "major": "finance", "grad_year": 2026, "gpa": 3.5, "colleges": {"CAS": True}}
+    )
+
+    listing_service.listing_insights_repo.rpc.assert_called_once_with(
+        "record_listing_application",
+        {
+            "p_listing_id": "1",
+            "p_major": "Finance",
+            "p_grad_year": "2026",
+            "p_gpa": 3.5,
+            "p_gpa_bucket": "3.5",
+            "p_colleges": ["CAS"],
+        },
+    )
+
+
+def test_record_application_insights_does_not_fail_the_application(service):
+    listing_service, _, _, _ = service
+    listing_service.listing_insights_repo.rpc.side_effect = Exception("RPC failed")
+
+    # the aggregates can be rebuilt later; the application itself was saved
+    listing_service._record_application_insights({"listing_id": "1", "colleges": {}})
@@ -0,0 +1,126 @@
+import pytest
+from unittest.mock import Mock
+from chalice.app import BadRequestError
+
+from chalicelib.models.roles import Roles
+from chalicelib.repositories.base_repository import BulkResult
+from chalicelib.request_context import (
+    Principal,
+    reset_current_principal,
+    set_current_principal,
+)
+from chalicelib.services.MemberService import MemberService
+
+
+@pytest.fixture
+def service():
+    mock_users_repo = Mock()
+    mock_user_roles_repo = Mock()
+    mock_roles_repo = Mock()
+    member_service = MemberService(
+        users_repo=mock_users_repo,
+        user_roles_repo=mock_user_roles_repo,
+        roles_repo=mock_roles_repo,
+    )
+    return member_service, mock_users_repo, mock_user_roles_repo, mock_roles_repo
+
+
+@pytest.fixture
+def principal():
+    token = set_current_principal(
+        Principal(user_id="user-1", roles=frozenset({Roles.MEMBER}), exp=None)
+    )
+    yield
+    reset_current_principal(token)
+
+
+def test_update_uses_request_principal(service, principal):
+    member_service, mock_users_repo, _, _ = service
+
+    result = member_service.update("user-1", {"id": "user-1", "name": "New Name"})
+
+    assert result is True
+    mock_users_repo.update.assert_called_once_with("user-1", {"name": "New Name"})
+
+
+def test_update_rejects_other_users(service, principal):
+    member_service, mock_users_repo, _, _ = service
+
+    with pytest.raises(BadRequestError, match="not authorized"):
+        member_service.update("user-2", {"name": "New Name"})
+
+    mock_users_repo.update.assert_not_called()
+
+
+def test_update_requires_authenticated_request(service):
+    member_service, mock_users_repo, _, _ = service
+
+    with pytest.raises(BadRequestError, match="not authenticated"):
+        member_service.update("user-1", {"name": "New Name"})
+
+    mock_users_repo.update.assert_not_called()
+
+
+def test_delete_removes_users_in_one_bulk_call(service):
+    member_service, mock_users_repo, _, _ = service
+    mock_users_repo.delete_many_by_ids.return_value = BulkResult(
+        found={"1": {"id": "1"}, "2": {"id": "2"}}, missing=[]
+    )
+
+    result = member_service.delete(["1", "2"])
+
+    assert result["success"] is True
+    mock_users_repo.delete_many_by_ids.assert_called_once_with(["1", "2"])
+    mock_users_repo.delete.assert_not_called()
+
+
+def test_delete_reports_missing_users(service):
+    member_service, mock_users_repo, _, _ = service
+    mock_users_repo.delete_many_by_ids.return_value = BulkResult(
+        found={"1": {"id": "1"}}, missing=["2"]
+    )
+
+    with pytest.raises(BadRequestError, match="Users not found"):
+        member_service.delete(["1", "2"])
+
+
+BASE_ROLES = [{"id": "r-admin", "name": "admin"}, {"id": "r-member", "name": "member"}]
+
+
+def test_create_inserts_user_roles_in_one_call(service):
+    member_service, mock_users_repo, mock_user_roles_repo, mock_roles_repo = service
+    mock_roles_repo.get_all.return_value = BASE_ROLES
+
+    result = member_service.create({"name": "Name", "roles": ["admin", "member"]})
+
+    assert result["success"] is True
+    user_id = mock_users_repo.create.call_args.args[0]["id"]
+    mock_user_roles_repo.create_many.assert_called_once_with(
+        [
+            {"user_id": user_id, "role_id": "r-admin"},
+            {"user_id": user_id, "role_id": "r-member"},
+        ]
+    )
+    mock_user_roles_repo.create.assert_not_called()
+
+
+def test_update_roles_syncs_relation(service):
+    member_service, _, mock_user_roles_repo, mock_roles_repo = service
+    mock_roles_repo.get_all.return_value = BASE_ROLES
+
+    assert member_service.update_roles("user-1", ["member"]) is True
+
+    mock_user_roles_repo.sync_relation.assert_called_once_with(
+        owner_id="user-1", desired_ids=["r-member"], related_field="role_id"
+    )
+    mock_user_roles_repo.delete_by_field.assert_not_called()
+
+
+def test_update_roles_rejects_unknown_roles_before_writing(service):
+    member_service, _, mock_user_roles_repo, mock_roles_repo = service
+    mock_roles_repo.get_all.return_value = BASE_ROLES
+
+    with pytest.raises(BadRequestError, match="Invalid role name"):
+        member_service.update_roles("user-1", ["member", "wizard"])
+
+    mock_user_roles_repo.sync_relation.assert_not_called()
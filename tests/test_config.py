@@ -0,0 +1,157 @@
+import dataclasses
+import pytest
+from unittest.mock import Mock, patch
+
+from chalicelib import config
+from chalicelib.config import Settings, get_settings, load_settings, reset_settings
+from chalicelib.modules.aws_ssm import AWS_SSM
+
+
+@pytest.fixture(autouse=True)
+def clear_settings():
+    reset_settings()
+    yield
+    reset_settings()
+
+
+def test_load_settings_fetches_all_parameters_in_one_call(monkeypatch):
+    monkeypatch.setenv("ENV", "prod")
+    with patch.object(config, "aws_ssm") as mock_ssm:
+        mock_ssm.get_parameter_values.return_value = {
+            "/Zap/AUTH_SECRET": "secret",
+            "/Zap/sentry/dsn": "dsn",
+            "/Zap/prod/SUPABASE_URL": "https://supabase.test",
+            "/Zap/prod/SUPABASE_KEY": "key",
+            "/Zap/GOOGLE_SERVICE_ACCOUNT_CREDENTIALS": "{}",
+            "/Zap/MONGO_ADMIN_USER": "user",
+            "/Zap/MONGO_ADMIN_PASSWORD": "password",
+            "/Vault/POSTHOG_API_KEY": "posthog-key",
+            "/Vault/POSTHOG_PROJECT_ID": "posthog-project",
+        }
+
+        settings = load_settings()
+
+    mock_ssm.get_parameter_values.assert_called_once()
+    assert settings.env == "prod"
+    assert settings.auth_secret == "secret"
+    assert settings.sentry_dsn == "dsn"
+    assert settings.supabase_url == "https://supabase.test"
+    assert settings.supabase_key == "key"
+    assert settings.posthog_project_id == "posthog-project"
+    assert settings.ssm_round_trips == 1
+    assert settings.missing_parameters == ()
+
+
+def test_load_settings_reports_missing_parameters(monkeypatch):
+    monkeypatch.setenv("ENV", "staging")
+    with patch.object(config, "aws_ssm") as mock_ssm:
+        mock_ssm.get_parameter_values.return_value = {"/Zap/AUTH_SECRET": "secret"}
+
+        settings = load_settings()
+
+    assert settings.auth_secret == "secret"
+    assert settings.supabase_url is None
+    assert "/Zap/staging/SUPABASE_URL" in settings.missing_parameters
+
+
+def test_load_settings_survives_ssm_failure(monkeypatch):
+    monkeypatch.setenv("ENV", "staging")
+    with patch.object(config, "aws_ssm") as mock_ssm:
+        mock_ssm.get_parameter_values.side_effect = Exception("no credentials")
+
+        settings = load_settings()
+
+    assert settings.auth_secret is None
+    assert len(settings.missing_parameters) == len(
+        config.get_parameter_names("staging")
+    )
+
+
+def test_load_settings_reads_local_supabase_params_from_env(monkeypatch):
+    monkeypatch.setenv("ENV", "local")
+    monkeypatch.setenv("SUPABASE_URL", "http://localhost:54321")
+    monkeypatch.setenv("SUPABASE_KEY", "local-key")
+    with patch.object(config, "aws_ssm") as mock_ssm:
+        mock_ssm.get_parameter_values.return_value = {}
+
+        settings = load_settings()
+
+    requested = mock_ssm.get_parameter_values.call_args[0][0]
+    assert not any("SUPABASE" in name for name in requested)
+    assert "/Zap/sentry/dsn" not in requested
+    assert settings.supabase_url == "http://localhost:54321"
+    assert settings.supabase_key == "local-key"
+
+
+def test_get_settings_is_cached_and_immutable(monkeypatch):
+    monkeypatch.setenv("ENV", "local")
+    with patch.object(config, "aws_ssm") as mock_ssm:
+        mock_ssm.get_parameter_values.side_effect = lambda names: {name: "value" for name in names}
+
+        first = get_settings()
+        second = get_settings()
+
+    assert first is second
+    mock_ssm.get_parameter_values.assert_called_once()
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        first.auth_secret = "changed"
+
+
+def test_get_settings_retries_after_ssm_failure(monkeypatch):
+    monkeypatch.setenv("ENV", "staging")
+    with patch.object(config, "aws_ssm") as mock_ssm:
+        mock_ssm.get_parameter_values.side_effect = [
+            Exception("no credentials"),
+            {name: "value" for name in config.get_parameter_names("staging").values()},
+        ]
+
+        first = get_settings()
+        second = get_settings()
+        third = get_settings()
+
+    assert first.auth_secret is None
+    assert second.auth_secret == "value"
+    assert third is second
+    assert mock_ssm.get_parameter_values.call_count == 2
+
+
+def test_get_parameter_values_batches_names_by_ten():
+    ssm = AWS_SSM.__new__(AWS_SSM)
+    ssm.client = Mock()
+    ssm.client.get_parameters.side_effect = lambda Names, WithDecryption: {
+        "Parameters": [{"Name": name, "Value": name.lower()} for name in Names]
+    }
+    names = [f"/Zap/PARAM_{i}" for i in range(12)]
+
+    values = ssm.get_parameter_values(names)
+
+    assert ssm.client.get_parameters.call_count == 2
+    assert values["/Zap/PARAM_11"] == "/zap/param_11"
+    assert len(values) == 12
+
+
+def test_settings_repr_hides_secrets():
+    settings = Settings(
+        env="prod",
+        auth_secret="auth-value",
+        supabase_url="https://example.supabase.co",
+        supabase_key="supabase-value",
+        google_service_account_credentials='{"private_key": "google-value"}',
+        posthog_api_key="posthog-value",
+        mongo_admin_password="mongo-value",
+    )
+
+    text = repr(settings)
+
+    assert "https://example.supabase.co" in text
+    for secret in ["auth-value", "supabase-value", "google-value", "posthog-value", "mongo-value"]:
+        assert secret not in text
+
+
+def test_google_sheets_module_requires_service_account_credentials():
+    from chalicelib.modules.google_sheets import GoogleSheetsModule
+
+    config.set_settings(Settings(env="local"))
+
+    with pytest.raises(Exception, match="/Zap/GOOGLE_SERVICE_ACCOUNT_CREDENTIALS"):
+        GoogleSheetsModule()
@@ -0,0 +1,139 @@
+import threading
+import pytest
+from unittest.mock import MagicMock, Mock
+
+from chalicelib.container import Container, build_container
+from chalicelib.modules.supabase_client import SupabaseClient
+
+
+@pytest.fixture
+def mock_supabase():
+    SupabaseClient.set_client(MagicMock())
+    yield
+    SupabaseClient.reset_client()
+
+
+def test_container_builds_providers_lazily_and_once():
+    repo_factory = Mock(return_value=object())
+    container = Container()
+    container.register("repo", repo_factory)
+
+    provider = container.provider("repo")
+    repo_factory.assert_not_called()
+
+    assert container.resolve("repo") is container.resolve("repo")
+    assert provider._lazy_initialized
+    repo_factory.assert_called_once()
+
+
+def test_container_shares_dependencies_between_providers():
+    container = Container()
+    container.register("repo", lambda: object())
+    container.register("service_a", lambda repo: {"repo": repo}, {"repo": "repo"})
+    container.register("service_b", lambda repo: {"repo": repo}, {"repo": "repo"})
+
+    assert container.resolve("service_a")["repo"] is container.resolve("service_b")["repo"]
+
+
+def test_container_graph_lists_dependencies():
+    container = Container()
+    container.register("repo", lambda: object())
+    container.register("service", lambda repo: repo, {"repo": "repo"})
+
+    assert container.graph() == {"repo": [], "service": ["repo"]}
+
+
+def test_container_override_swaps_factory_before_first_use():
+    container = Container()
+    container.register("repo", lambda: "base")
+    container.register("service", lambda repo: repo, {"repo": "repo"})
+
+    container.override("repo", lambda: "cached")
+
+    assert container.resolve("service") == "cached"
+
+
+def test_container_register_rejects_initialized_provider():
+    container = Container()
+    container.register("repo", lambda: "base")
+    container.resolve("repo")
+
+    with pytest.raises(ValueError):
+        container.override("repo", lambda: "cached")
+
+
+def test_container_detects_circular_dependencies():
+    container = Container()
+    container.register("a", lambda b: b, {"b": "b"})
+    container.register("b", lambda a: a, {"a": "a"})
+
+    with pytest.raises(RuntimeError, match="Circular dependency detected"):
+        container.resolve("a")
+
+
+def test_container_warm_builds_every_provider():
+    container = Container()
+    container.register("repo", lambda: object())
+    container.register("service", lambda repo: repo, {"repo": "repo"})
+
+    timings = container.warm()
+
+    assert set(timings) == {"repo", "service"}
+    assert container.provider("repo")._lazy_initialized
+    assert container.provider("service")._lazy_initialized
+
+
+def test_build_container_shares_repository_instances(mock_supabase):
+    container = build_container()
+
+    listing_service = container.resolve("listing_service")
+    insights_service = container.resolve("insights_service")
+    applicant_service = container.resolve("applicant_service")
+
+    assert listing_service.applications_repo is insights_service.applications_repo
+    assert listing_service.applications_repo is applicant_service.applications_repo
+    assert (
+        applicant_service.events_rush_service
+        is container.resolve("events_rush_service")
+    )
+
+
+def test_container_override_is_seen_by_existing_proxies():
+    container = Container()
+    container.register("repo", lambda: "base")
+    proxy = container.provider("repo")
+
+    container.override("repo", lambda: object())
+
+    assert proxy is container.provider("repo")
+    assert proxy._lazy_get() is container.resolve("repo")
+
+
+def test_container_resolves_concurrently_without_false_cycles():
+    container = Container()
+    started = threading.Event()
+
+    def slow_repo():
+        started.wait(1)
+        return object()
+
+    container.register("repo", slow_repo)
+    container.register("service", lambda repo: repo, {"repo": "repo"})
+
+    results, errors = [], []
+
+    def resolve():
+        try:
+            results.append(container.resolve("service"))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=resolve) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    started.set()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert results[0] is results[1]
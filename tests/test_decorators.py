@@ -6,6 +6,9 @@ import pytest
 from chalicelib.decorators import add_env_suffix, auth
 from chalicelib.handlers.error_handler import handle_exceptions
 from chalicelib.models.roles import Roles
+from chalicelib.modules.secret_provider import auth_secret
+from chalicelib.modules.token_cache import verified_tokens
+from chalicelib.request_context import get_current_principal
 from chalice.app import (
     UnauthorizedError,
     Response,
@@ -97,6 +100,13 @@ def test_handle_exceptions_general_exception():
     }
 
 
+@pytest.fixture(autouse=True)
+def reset_auth_secret():
+    auth_secret.invalidate()
+    yield
+    auth_secret.invalidate()
+
+
 @pytest.fixture
 def mock_blueprint():
     return Mock()
@@ -222,3 +232,125 @@ def test_auth_raises_when_role_not_authorized(mock_blueprint, mock_ssm):
         protected_route(mock_blueprint)
 
     assert "You do not have permission to access this resource." == str(e.value)
+
+
+def test_auth_fetches_secret_once_across_requests(mock_blueprint):
+    token = generate_token(
+        {"exp": datetime.now(timezone.utc) + timedelta(minutes=30), "roles": ["admin"]},
+        "SAMPLE_AUTH_SECRET",
+    )
+    mock_blueprint.current_request.headers = {"Authorization": f"Bearer {token}"}
+
+    @auth(mock_blueprint, roles=[Roles.ADMIN])
+    def protected_route(*_):
+        return {"message": "success"}
+
+    with patch("boto3.client") as mock_boto_client:
+        mock_ssm_client = Mock()
+        mock_ssm_client.get_parameter.return_value = {
+            "Parameter": {"Value": "SAMPLE_AUTH_SECRET"}
+        }
+        mock_boto_client.return_value = mock_ssm_client
+
+        for _ in range(3):
+            assert protected_route(mock_blueprint) == {"message": "success"}
+
+    mock_ssm_client.get_parameter.assert_called_once_with(
+        Name="/Zap/AUTH_SECRET", WithDecryption=True
+    )
+
+
+def test_auth_accepts_token_signed_with_rotated_secret(mock_blueprint):
+    token = generate_token(
+        {"exp": datetime.now(timezone.utc) + timedelta(minutes=30), "roles": ["admin"]},
+        "NEW_AUTH_SECRET",
+    )
+    mock_blueprint.current_request.headers = {"Authorization": f"Bearer {token}"}
+
+    @auth(mock_blueprint, roles=[Roles.ADMIN])
+    def protected_route(*_):
+        return {"message": "success"}
+
+    # Cache still holds the pre-rotation secret
+    auth_secret.prime("SAMPLE_AUTH_SECRET")
+
+    with patch("boto3.client") as mock_boto_client:
+        mock_ssm_client = Mock()
+        mock_ssm_client.get_parameter.return_value = {
+            "Parameter": {"Value": "NEW_AUTH_SECRET"}
+        }
+        mock_boto_client.return_value = mock_ssm_client
+
+        with patch.object(auth_secret, "min_refresh_interval_seconds", 0):
+            result = protected_route(mock_blueprint)
+
+    assert result == {"message": "success"}
+
+
+def test_auth_rejects_forged_token_when_ssm_is_unavailable(mock_blueprint):
+    token = generate_token(
+        {"exp": datetime.now(timezone.utc) + timedelta(minutes=30), "roles": ["admin"]},
+        "WRONG_SECRET",
+    )
+    mock_blueprint.current_request.headers = {"Authorization": f"Bearer {token}"}
+
+    @auth(mock_blueprint, roles=[Roles.ADMIN])
+    def protected_route(*_):  # pragma: no cover
+        return {"message": "should not reach"}
+
+    auth_secret.prime("SAMPLE_AUTH_SECRET")
+
+    with patch("boto3.client") as mock_boto_client:
+        mock_boto_client.return_value.get_parameter.side_effect = Exception("SSM down")
+
+        with patch.object(auth_secret, "min_refresh_interval_seconds", 0):
+            with pytest.raises(UnauthorizedError) as e:
+                protected_route(mock_blueprint)
+
+    assert "Invalid token." == str(e.value)
+
+
+def test_auth_verifies_repeated_token_once(mock_blueprint):
+    token = generate_token(
+        {"exp": datetime.now(timezone.utc) + timedelta(minutes=30), "roles": ["admin"]},
+        "SAMPLE_AUTH_SECRET",
+    )
+    mock_blueprint.current_request.headers = {"Authorization": f"Bearer {token}"}
+
+    @auth(mock_blueprint, roles=[Roles.ADMIN, Roles.MEMBER])
+    def protected_route(*_):
+        return {"message": "success"}
+
+    auth_secret.prime("SAMPLE_AUTH_SECRET")
+
+    with patch("chalicelib.decorators.jwt.decode", wraps=jwt.decode) as mock_decode:
+        for _ in range(3):
+            assert protected_route(mock_blueprint) == {"message": "success"}
+
+    mock_decode.assert_called_once()
+    assert verified_tokens.stats()["hits"] == 2
+    assert verified_tokens.stats()["misses"] == 1
+
+
+def test_auth_attaches_principal_for_the_route_only(mock_blueprint):
+    token = generate_token(
+        {
+            "_id": "user-1",
+            "exp": datetime.now(timezone.utc) + timedelta(minutes=30),
+            "roles": ["member"],
+        },
+        "SAMPLE_AUTH_SECRET",
+    )
+    mock_blueprint.current_request.headers = {"Authorization": f"Bearer {token}"}
+
+    @auth(mock_blueprint, roles=[Roles.MEMBER])
+    def protected_route(*_):
+        return get_current_principal()
+
+    auth_secret.prime("SAMPLE_AUTH_SECRET")
+
+    principal = protected_route(mock_blueprint)
+
+    assert principal.user_id == "user-1"
+    assert principal.roles == frozenset({Roles.MEMBER})
+    assert get_current_principal() is None
@@ -0,0 +1,70 @@
+import threading
+import time
+
+import pytest
+from chalice.app import NotFoundError
+
+from chalicelib.request_context import get_request_scope, request_scope
+from chalicelib.utils import fan_out as fan_out_module
+from chalicelib.utils.fan_out import FanOutTimeoutError, fan_out
+
+
+def test_fan_out_returns_results_in_call_order():
+    def slow(value, seconds):
+        time.sleep(seconds)
+        return value
+
+    assert fan_out(lambda: slow("a", 0.05), lambda: slow("b", 0), lambda: slow("c", 0.02)) == ["a", "b", "c"]
+
+
+def test_fan_out_runs_calls_in_parallel():
+    # each call waits for the other one: this only returns if they run at the same time
+    barrier = threading.Barrier(2, timeout=5)
+
+    assert fan_out(barrier.wait, barrier.wait, deadline_seconds=5) is not None
+
+
+def test_fan_out_raises_the_first_error_without_waiting():
+    release = threading.Event()
+
+    def fail():
+        raise NotFoundError("listing")
+
+    start = time.perf_counter()
+    with pytest.raises(NotFoundError, match="listing"):
+        fan_out(lambda: release.wait(5), fail)
+    release.set()
+
+    assert time.perf_counter() - start < 1
+
+
+def test_fan_out_raises_after_the_deadline():
+    release = threading.Event()
+
+    start = time.perf_counter()
+    with pytest.raises(FanOutTimeoutError, match="1 of 2 calls"):
+        fan_out(lambda: release.wait(5), lambda: "ok", deadline_seconds=0.05)
+    release.set()
+
+    assert time.perf_counter() - start < 1
+
+
+def test_fan_out_runs_calls_in_the_request_scope():
+    with request_scope() as scope:
+        scopes = fan_out(get_request_scope, get_request_scope)
+
+    assert scopes == [scope, scope]
+
+
+def test_nested_fan_out_runs_inline(monkeypatch):
+    monkeypatch.setattr(fan_out_module, "FAN_OUT_MAX_WORKERS", 2)
+    monkeypatch.setattr(fan_out_module, "_executor", None)
+
+    def nested():
+        # the outer calls hold both threads of the pool
+        return fan_out(threading.current_thread, threading.current_thread)
+
+    outer = fan_out(nested, nested, deadline_seconds=5)
+
+    for threads in outer:
+        assert threads[0] is threads[1] is not threading.current_thread()
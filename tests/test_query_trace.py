@@ -0,0 +1,97 @@
+import json
+from unittest.mock import MagicMock
+
+from chalicelib.handlers import query_trace
+from chalicelib.handlers.query_trace import report_query_trace
+from chalicelib.repositories.base_repository import BaseRepository
+from chalicelib.request_context import request_scope
+
+
+def make_repo():
+    repo = BaseRepository("users", "id", client=MagicMock())
+    repo.client.table().select().eq().execute.return_value.data = [
+        {"id": "1", "name": "Alice"}
+    ]
+    return repo
+
+
+def test_repository_calls_are_recorded_in_the_request_trace():
+    repo = make_repo()
+
+    with request_scope() as scope:
+        repo.get_all_by_field("name", "Alice", select_query="id, name")
+
+    (record,) = scope.queries
+    assert record.table == "users"
+    assert record.operation == "get_all_by_field"
+    assert record.params == {"field": "'name'", "value": "'Alice'"}
+    assert record.select_query == "id, name"
+    assert record.rows == 1
+    assert record.bytes > 0
+    assert record.failed is False
+
+
+def test_payload_size_is_estimated_from_the_first_row(monkeypatch):
+    repo = make_repo()
+    rows = [{"id": "0000", "name": "Alice"}] * 5000
+    repo.client.table().select().eq().execute.return_value.data = rows
+    row_bytes = len(json.dumps(rows[0]))
+    dumps = MagicMock(wraps=json.dumps)
+    monkeypatch.setattr(query_trace.json, "dumps", dumps)
+
+    with request_scope() as scope:
+        repo.get_all_by_field("name", "Alice")
+
+    assert scope.queries[0].bytes == 5000 * row_bytes
+    dumps.assert_called_once()
+
+
+def test_nested_repository_calls_are_recorded_once():
+    repo = make_repo()
+    repo.client.table().update().eq().execute.return_value.data = [{"id": "1"}]
+
+    with request_scope() as scope:
+        repo.toggle_boolean_field("1", "is_new_user")
+
+    assert [record.operation for record in scope.queries] == ["toggle_boolean_field"]
+
+
+def test_write_payloads_are_not_recorded():
+    repo = make_repo()
+
+    with request_scope() as scope:
+        repo.create({"email": "whyphi@bu.edu"})
+
+    assert scope.queries[0].params == {}
+
+
+def test_calls_outside_a_request_are_not_traced():
+    repo = make_repo()
+
+    repo.get_all()  # must not fail without a request scope
+
+
+def test_report_warns_over_budget_and_on_repeated_shapes(monkeypatch):
+    monkeypatch.setitem(query_trace.ROUTE_QUERY_BUDGETS, "/members/{user_id}", 3)
+    repo = make_repo()
+
+    with request_scope() as scope:
+        for user_id in range(7):
+            repo.get_by_id(str(user_id))
+
+    warnings = report_query_trace("/members/{user_id}", scope.queries)
+
+    assert len(warnings) == 2
+    assert "issued 7 queries (budget: 3)" in warnings[0]
+    assert "repeated fetch_by_id on 'users' 7 times" in warnings[1]
+
+
+def test_report_is_quiet_within_budget():
+    repo = make_repo()
+
+    with request_scope() as scope:
+        repo.get_by_id("1")
+        repo.get_by_id("1")  # served by the identity map
+
+    assert len(scope.queries) == 1
+    assert report_query_trace("/members/{user_id}", scope.queries) == []
@@ -0,0 +1,141 @@
+import threading
+
+import pytest
+from unittest.mock import MagicMock
+from chalice.app import NotFoundError
+
+from chalicelib.repositories.base_repository import BaseRepository
+from chalicelib.request_context import get_request_loader, request_scope
+from chalicelib.utils.fan_out import fan_out
+
+
+@pytest.fixture
+def repo():
+    repository = BaseRepository("users", "id", client=MagicMock())
+    repository.client.table().select().eq().execute.return_value.data = [
+        {"id": "1", "name": "Alice"}
+    ]
+    repository.client.table().select().eq().execute.reset_mock()
+    return repository
+
+
+def test_get_by_id_is_deduplicated_within_a_request(repo):
+    fetch = repo.client.table().select().eq().execute
+
+    with request_scope():
+        first = repo.get_by_id("1")
+        first["name"] = "changed"
+        assert repo.get_by_id("1") == {"id": "1", "name": "Alice"}
+
+    fetch.assert_called_once()
+
+
+def test_request_scope_is_cleared_after_the_request(repo):
+    fetch = repo.client.table().select().eq().execute
+
+    with request_scope():
+        repo.get_by_id("1")
+    with request_scope():
+        repo.get_by_id("1")
+
+    assert fetch.call_count == 2
+    assert get_request_loader(repo) is None
+
+
+def test_get_by_id_outside_a_request_is_not_cached(repo):
+    fetch = repo.client.table().select().eq().execute
+
+    repo.get_by_id("1")
+    repo.get_by_id("1")
+
+    assert fetch.call_count == 2
+
+
+def test_writes_evict_loaded_rows(repo):
+    fetch = repo.client.table().select().eq().execute
+
+    with request_scope():
+        repo.get_by_id("1")
+        repo.delete_by_field("name", "Alice")
+        repo.get_by_id("1")
+
+    assert fetch.call_count == 2
+
+
+def test_update_primes_identity_map_with_returned_row(repo):
+    fetch = repo.client.table().select().eq().execute
+    repo.client.table().update().eq().execute.return_value.data = [
+        {"id": "1", "name": "Bob"}
+    ]
+
+    with request_scope():
+        repo.update("1", {"name": "Bob"})
+        assert repo.get_by_id("1") == {"id": "1", "name": "Bob"}
+
+    fetch.assert_not_called()
+
+
+def test_deferred_lookups_share_one_in_query(repo):
+    repo.client.table().select().in_().execute.return_value.data = [
+        {"id": "1", "name": "Alice"},
+        {"id": "2", "name": "Bob"},
+    ]
+    in_filter = repo.client.table().select().in_
+    in_filter.reset_mock()
+
+    with request_scope():
+        loader = get_request_loader(repo)
+        alice, bob, carol = loader.defer("1"), loader.defer("2"), loader.defer("3")
+
+        assert alice()["name"] == "Alice"
+        assert bob()["name"] == "Bob"
+        with pytest.raises(NotFoundError):
+            carol()
+
+        # already loaded rows are served by get_by_id too
+        assert repo.get_by_id("2")["name"] == "Bob"
+
+    in_filter.assert_called_once_with("id", ["1", "2", "3"])
+    repo.client.table().select().eq().execute.assert_not_called()
+
+
+def test_parallel_lookups_do_not_wait_on_each_other(repo):
+    # each fetch waits for the other: serialized round trips would time out
+    both_fetching = threading.Barrier(2, timeout=5)
+
+    def fetch(name):
+        both_fetching.wait()
+        return {"name": name}
+
+    with request_scope():
+        loader = get_request_loader(repo)
+        alice, bob = fan_out(
+            lambda: loader.load("1", lambda: fetch("Alice")),
+            lambda: loader.load("2", lambda: fetch("Bob")),
+        )
+
+    assert (alice["name"], bob["name"]) == ("Alice", "Bob")
+
+
+def test_parallel_identical_lookups_share_one_round_trip(repo):
+    fetching = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        fetching.set()
+        release.wait(timeout=5)
+        return {"id": "1", "name": "Alice"}
+
+    def second_lookup():
+        fetching.wait(timeout=5)
+        threading.Timer(0.05, release.set).start()
+        return loader.load("1", fetch)
+
+    with request_scope():
+        loader = get_request_loader(repo)
+        first, second = fan_out(lambda: loader.load("1", fetch), second_lookup)
+
+    assert first == second == {"id": "1", "name": "Alice"}
+    assert len(calls) == 1
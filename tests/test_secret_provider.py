@@ -0,0 +1,108 @@
+from unittest.mock import Mock
+
+from chalicelib.modules.secret_provider import SecretProvider
+
+
+def make_provider(clock, values, **kwargs):
+    fetcher = Mock(side_effect=values)
+    provider = SecretProvider(
+        "/Zap/TEST_SECRET",
+        ttl_seconds=100,
+        refresh_ahead_seconds=20,
+        rotation_grace_seconds=50,
+        fetcher=fetcher,
+        clock=clock,
+        **kwargs,
+    )
+    return provider, fetcher
+
+
+def test_get_caches_secret_until_ttl_expires(clock):
+    provider, fetcher = make_provider(clock, ["secret-1", "secret-2"])
+
+    assert provider.get() == "secret-1"
+    clock.now = 79
+    assert provider.get() == "secret-1"
+    fetcher.assert_called_once_with("/Zap/TEST_SECRET")
+
+    clock.now = 100
+    assert provider.get() == "secret-2"
+    assert fetcher.call_count == 2
+
+
+def test_get_refreshes_in_background_before_expiry(clock, monkeypatch):
+    provider, fetcher = make_provider(clock, ["secret-1", "secret-2"])
+    started = []
+    monkeypatch.setattr(
+        provider, "_refresh_in_background", lambda: started.append(True)
+    )
+
+    provider.get()
+    clock.now = 85
+
+    # Cached value is still served while the refresh is scheduled
+    assert provider.get() == "secret-1"
+    assert started == [True]
+    assert fetcher.call_count == 1
+
+
+def test_background_refresh_failure_keeps_cached_value(clock):
+    provider, fetcher = make_provider(clock, ["secret-1", Exception("SSM down")])
+
+    provider.get()
+    provider._background_refresh()
+
+    assert provider.get() == "secret-1"
+    assert provider._refreshing is False
+
+
+def test_get_candidates_includes_previous_secret_during_rotation(clock):
+    provider, _ = make_provider(clock, ["secret-1", "secret-2"])
+
+    assert provider.get_candidates() == ["secret-1"]
+
+    provider.refresh()
+    assert provider.get_candidates() == ["secret-2", "secret-1"]
+
+    clock.now = 50
+    assert provider.get_candidates() == ["secret-2"]
+
+
+def test_refresh_on_rejection_is_rate_limited(clock):
+    provider, fetcher = make_provider(
+        clock, ["secret-1", "secret-2"], min_refresh_interval_seconds=10
+    )
+
+    provider.get()
+    assert provider.refresh_on_rejection() is False
+    assert fetcher.call_count == 1
+
+    clock.now = 10
+    assert provider.refresh_on_rejection() is True
+    assert provider.get() == "secret-2"
+
+
+def test_prime_seeds_cache_without_fetching(clock):
+    provider, fetcher = make_provider(clock, [])
+
+    provider.prime("primed-secret")
+
+    assert provider.get() == "primed-secret"
+    fetcher.assert_not_called()
+
+
+def test_refresh_on_rejection_returns_false_when_fetch_fails(clock):
+    provider, fetcher = make_provider(
+        clock, ["secret-1", Exception("SSM down")], min_refresh_interval_seconds=10
+    )
+
+    provider.get()
+    clock.now = 10
+
+    assert provider.refresh_on_rejection() is False
+    assert provider.get() == "secret-1"
+
+    # the failed attempt still counts towards the rate limit
+    clock.now = 15
+    assert provider.refresh_on_rejection() is False
+    assert fetcher.call_count == 2
@@ -0,0 +1,78 @@
+import pytest
+
+from chalicelib.models.roles import Roles
+from chalicelib.modules.token_cache import VerifiedTokenCache, token_digest
+
+
+@pytest.fixture
+def clock(clock):
+    clock.now = 1000.0
+    return clock
+
+
+def test_put_precomputes_role_set(clock):
+    cache = VerifiedTokenCache(clock=clock)
+
+    verified = cache.put("token", {"exp": 2000, "roles": ["admin", "member"]})
+
+    assert verified.roles == frozenset({Roles.ADMIN, Roles.MEMBER})
+    assert cache.get("token") is verified
+
+
+def test_entries_are_evicted_at_token_expiry(clock):
+    cache = VerifiedTokenCache(clock=clock)
+    cache.put("token", {"exp": 1010, "roles": []})
+
+    clock.now = 1009
+    assert cache.get("token") is not None
+
+    clock.now = 1010
+    assert cache.get("token") is None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_entries_are_capped_by_max_ttl(clock):
+    cache = VerifiedTokenCache(max_ttl_seconds=60, clock=clock)
+    cache.put("token", {"exp": 5000, "roles": []})
+
+    clock.now = 1060
+    assert cache.get("token") is None
+
+
+def test_expired_tokens_are_not_cached(clock):
+    cache = VerifiedTokenCache(clock=clock)
+    cache.put("token", {"exp": 999, "roles": []})
+
+    assert cache.stats()["size"] == 0
+
+
+def test_least_recently_used_entry_is_dropped(clock):
+    cache = VerifiedTokenCache(max_entries=2, clock=clock)
+    cache.put("a", {"roles": []})
+    cache.put("b", {"roles": []})
+    cache.get("a")
+    cache.put("c", {"roles": []})
+
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+
+
+def test_stats_report_hits_and_misses(clock):
+    cache = VerifiedTokenCache(clock=clock)
+    cache.get("token")
+    cache.put("token", {"roles": []})
+    cache.get("token")
+    cache.get("token")
+
+    stats = cache.stats()
+
+    assert (stats["hits"], stats["misses"]) == (2, 1)
+    assert stats["hit_ratio"] == pytest.approx(2 / 3)
+
+
+def test_cache_is_keyed_by_digest(clock):
+    cache = VerifiedTokenCache(clock=clock)
+    cache.put("secret-token", {"roles": []})
+
+    assert list(cache._entries) == [token_digest("secret-token")]
@@ -1,5 +1,34 @@
 import base64
+import gc
+import pytest
+from unittest.mock import Mock, patch
+from chalice.app import BadRequestError
 from chalicelib.utils.utils import decode_base64, get_file_extension_from_base64
+from chalicelib.utils.lazy import LazyProvider, registered_providers
+from chalicelib.utils.insight_stats import (
+    describe,
+    grad_year_spread,
+    numeric_column,
+    numeric_stats,
+)
+from chalicelib.utils.insights import (
+    aggregate_applications,
+    application_insight_params,
+    dashboard_from_aggregate,
+    empty_listing_insights,
+    gpa_bucket,
+)
+from chalicelib.utils.rush_events import (
+    DEFAULT_THRESHOLD_RULES,
+    compile_threshold_rules,
+    validate_threshold_rules,
+)
+from chalicelib.utils.pagination import (
+    MAX_PAGE_SIZE,
+    decode_cursor,
+    encode_cursor,
+    get_page_params,
+)
 
 
 def test_decode_base64():
@@ -46,3 +75,246 @@ def test_get_file_extension_invalid_data_uri():
 
     # Assertion to check if the function returns None for an invalid data URI format
     assert result is None
+
+
+def test_lazy_provider_builds_instance_on_first_use():
+    factory = Mock(return_value=Mock(value=42))
+    provider = LazyProvider(factory, name="test_provider")
+
+    assert not provider._lazy_initialized
+    factory.assert_not_called()
+
+    assert provider.value == 42
+    assert provider.value == 42
+    factory.assert_called_once()
+    assert provider._lazy_initialized
+    assert provider._lazy_init_seconds is not None
+
+
+def test_lazy_provider_supports_patching_attributes():
+    class Client:
+        def send(self):
+            return "real"
+
+    provider = LazyProvider(Client, name="client")
+
+    with patch.object(provider, "send", return_value="mocked"):
+        assert provider.send() == "mocked"
+
+    assert provider.send() == "real"
+
+
+def test_lazy_provider_reset_rebuilds_instance():
+    factory = Mock(side_effect=[Mock(value=1), Mock(value=2)])
+    provider = LazyProvider(factory, name="resettable")
+
+    assert provider.value == 1
+    provider._lazy_reset()
+    assert provider.value == 2
+
+
+def test_lazy_provider_forwards_get_and_reset_to_the_instance():
+    class Service:
+        def get(self, id):
+            return {"id": id}
+
+        def reset(self):
+            return "reset"
+
+    provider = LazyProvider(Service, name="service")
+
+    assert provider.get("abc") == {"id": "abc"}
+    assert provider.reset() == "reset"
+
+
+def test_registered_providers_drops_unreferenced_providers():
+    kept = LazyProvider(lambda: object(), name="kept")
+    LazyProvider(lambda: object(), name="throwaway")
+    gc.collect()
+
+    names = [provider._lazy_name for provider in registered_providers()]
+
+    assert "kept" in names
+    assert "throwaway" not in names
+    assert kept._lazy_initialized is False
+
+
+def test_get_page_params_defaults_to_unpaginated():
+    assert get_page_params(None) == (None, None)
+    assert get_page_params({}) == (None, None)
+
+
+def test_get_page_params_caps_limit_and_validates_cursor():
+    cursor = encode_cursor("abc")
+
+    assert get_page_params({"limit": "5000"}) == (MAX_PAGE_SIZE, None)
+    assert get_page_params({"cursor": cursor}) == (MAX_PAGE_SIZE, cursor)
+    assert decode_cursor(cursor) == "abc"
+
+    for params in [{"limit": "0"}, {"limit": "ten"}, {"cursor": "not-a-cursor"}]:
+        with pytest.raises(BadRequestError):
+            get_page_params(params)
+
+
+def test_gpa_bucket_floors_to_tenths():
+    assert gpa_bucket(3.47) == "3.4"
+    assert gpa_bucket(3.0) == "3.0"
+    assert gpa_bucket(4.0) == "4.0"
+    assert gpa_bucket(None) is None
+
+
+def test_application_insight_params_normalizes_keys():
+    params = application_insight_params(
+        {
+            "listing_id": "l-1",
+            "major": "computer science",
+            "grad_year": 2027,
+            "gpa": 3.91,
+            "colleges": {"CAS": True, "QST": False, "ENG": True},
+        }
+    )
+
+    assert params == {
+        "p_listing_id": "l-1",
+        "p_major": "Computer Science",
+        "p_grad_year": "2027",
+        "p_gpa": 3.91,
+        "p_gpa_bucket": "3.9",
+        "p_colleges": ["CAS", "ENG"],
+    }
+
+
+def test_dashboard_from_aggregate():
+    aggregate = aggregate_applications(
+        "l-1",
+        [
+            {"listing_id": "l-1", "major": "Finance", "grad_year": 2026, "gpa": 3.0, "colleges": {}},
+            {"listing_id": "l-1", "major": "Economics", "grad_year": 2027, "gpa": None, "colleges": {}},
+            {"listing_id": "l-1", "major": "", "grad_year": 2027, "gpa": 3.5, "colleges": {}},
+        ],
+    )
+
+    # Economics and Finance tie: the alphabetically first one wins
+    assert dashboard_from_aggregate(aggregate) == {
+        "applicantCount": 3,
+        "avgGpa": 3.2,
+        "commonMajor": "Economics",
+        "commonGradYear": 2027,
+    }
+    assert dashboard_from_aggregate(empty_listing_insights("l-2"))["avgGpa"] == "N/A"
+
+
+def test_numeric_column_skips_unparseable_values():
+    rows = [{"gpa": "3.5"}, {"gpa": "N/A"}, {"gpa": None}, {}, {"gpa": float("nan")}, {"gpa": 2.0}]
+
+    assert list(numeric_column(rows, "gpa")) == [2.0, 3.5]
+
+
+def test_describe_interpolates_quartiles():
+    stats = describe(numeric_column([{"v": v} for v in (4, 1, 3, 2)], "v"))
+
+    assert stats == {
+        "count": 4,
+        "mean": 2.5,
+        "stdev": 1.12,
+        "min": 1.0,
+        "q1": 1.75,
+        "median": 2.5,
+        "q3": 3.25,
+        "max": 4.0,
+    }
+    assert describe(numeric_column([], "v"))["median"] == "N/A"
+
+
+def test_numeric_stats_histograms_include_empty_buckets():
+    stats = numeric_stats(
+        [
+            {"gpa": 3.47, "grad_year": 2025},
+            {"gpa": 3.71, "grad_year": 2027},
+            {"gpa": "3.4", "grad_year": 2027},
+        ]
+    )
+
+    assert stats["gpa"]["histogram"] == [
+        {"bucket": "3.4", "count": 2},
+        {"bucket": "3.5", "count": 0},
+        {"bucket": "3.6", "count": 0},
+        {"bucket": "3.7", "count": 1},
+    ]
+    assert stats["gradYear"]["spread"] == [
+        {"year": 2025, "count": 1},
+        {"year": 2026, "count": 0},
+        {"year": 2027, "count": 2},
+    ]
+    assert numeric_stats([]) == {
+        "gpa": {**describe(numeric_column([], "gpa")), "histogram": []},
+        "gradYear": {**describe(numeric_column([], "grad_year")), "spread": []},
+    }
+
+
+def test_numeric_stats_histograms_leave_out_outliers():
+    applications = [
+        {"gpa": 3.47, "grad_year": 2026},
+        {"gpa": 350000, "grad_year": 100000000},
+        {"gpa": -1, "grad_year": 1},
+    ]
+
+    stats = numeric_stats(applications)
+
+    assert stats["gpa"]["histogram"] == [{"bucket": "3.4", "count": 1}]
+    assert (stats["gpa"]["count"], stats["gpa"]["max"]) == (3, 350000)
+    assert grad_year_spread(numeric_column(applications, "grad_year"), current_year=2026) == [
+        {"year": 2026, "count": 1}
+    ]
+    assert grad_year_spread(numeric_column(applications, "grad_year"), current_year=2040) == []
+
+
+RUSH_EVENTS = [
+    {"id": "e-1", "name": "Info Session 1"},
+    {"id": "e-2", "name": "Professional Panel"},
+    {"id": "e-3", "name": "Resume Night"},
+    {"id": "e-4", "name": "Professional Panel"},
+]
+
+
+def test_compile_threshold_rules_defaults():
+    threshold = compile_threshold_rules(None, RUSH_EVENTS)
+
+    assert (threshold.mandatory_mask, threshold.remaining_mask) == (0b0001, 0b1110)
+    assert threshold.is_met(0b0111)
+    # both Professional Panels count
+    assert threshold.is_met(0b1011)
+    assert not threshold.is_met(0b1110)
+    assert not threshold.is_met(0b0011)
+
+
+def test_compile_threshold_rules_without_mandatory_events():
+    threshold = compile_threshold_rules(
+        {"mandatory_events": [], "minimum_mandatory_events": 0, "minimum_remaining_events": 1},
+        RUSH_EVENTS,
+    )
+
+    assert threshold.is_met(0b0100)
+    assert not threshold.is_met(0b0001)
+
+
+@pytest.mark.parametrize(
+    "rules",
+    [
+        [],
+        {"mandatory": ["Info Session 1"]},
+        {"remaining_events": "Social Event"},
+        {"minimum_remaining_events": -1},
+        {"minimum_mandatory_events": True},
+    ],
+)
+def test_validate_threshold_rules_rejects_bad_rules(rules):
+    with pytest.raises(BadRequestError):
+        validate_threshold_rules(rules)
+
+
+def test_validate_threshold_rules_fills_in_defaults():
+    assert validate_threshold_rules({"minimum_remaining_events": 3}) == {
+        **DEFAULT_THRESHOLD_RULES,
+        "minimum_remaining_events": 3,
+    }
@@ -0,0 +1,135 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# Runs inside a fresh interpreter: stubs every AWS/Supabase/Google client so that
+# `import app` and lazy singleton construction can be timed without network I/O.
+CHILD_SCRIPT = r"""
+import json
+import time
+from unittest.mock import MagicMock, patch
+
+def stub_get_parameters(Names, WithDecryption=True):
+    return {"Parameters": [{"Name": name, "Value": "{}"} for name in Names]}
+
+ssm_client = MagicMock()
+ssm_client.get_parameters.side_effect = stub_get_parameters
+
+patches = [
+    patch("boto3.client", side_effect=lambda service, *a, **kw: ssm_client if service == "ssm" else MagicMock()),
+    patch("boto3.resource", return_value=MagicMock()),
+    patch("supabase.create_client", return_value=MagicMock()),
+    patch("googleapiclient.discovery.build", return_value=MagicMock()),
+    patch("google.oauth2.service_account.Credentials.from_service_account_info", return_value=MagicMock()),
+    patch("pymongo.mongo_client.MongoClient", return_value=MagicMock()),
+]
+for p in patches:
+    p.start()
+
+start = time.perf_counter()
+import app  # noqa: F401
+import_seconds = time.perf_counter() - start
+
+from chalicelib.config import get_settings
+from chalicelib.utils.lazy import registered_providers
+
+init = {}
+for provider in registered_providers():
+    provider._lazy_get()
+    init[provider._lazy_name] = provider._lazy_init_seconds
+
+print(json.dumps({
+    "import_app_seconds": import_seconds,
+    "config_seconds": get_settings().load_seconds,
+    "ssm_round_trips": get_settings().ssm_round_trips,
+    "ssm_calls": ssm_client.get_parameters.call_count + ssm_client.get_parameter.call_count,
+    "lazy_init_seconds": init,
+}))
+"""
+
+
+def parse_importtime(stderr: str) -> list:
+    """Parses `-X importtime` output into (module, self_us, cumulative_us) rows for Zap modules."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        try:
+            _, self_us, cumulative_us, module = [
+                part.strip() for part in line.replace("import time:", "|", 1).split("|")
+            ]
+            self_us, cumulative_us = int(self_us), int(cumulative_us)
+        except ValueError:
+            continue  # header line
+
+        name = module.strip()
+        if name == "app" or name.startswith("chalicelib"):
+            rows.append((name, self_us, cumulative_us))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure cold-start import and singleton init time of `app`"
+    )
+    parser.add_argument(
+        "--top", type=int, default=15, help="Number of modules to list (default: 15)"
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="Print raw results as JSON instead of a table"
+    )
+    args = parser.parse_args()
+
+    env = {
+        **os.environ,
+        "ENV": "local",
+        "AWS_DEFAULT_REGION": "us-east-1",
+        "SUPABASE_URL": "http://localhost:54321",
+        "SUPABASE_KEY": "stub-key",
+    }
+    env.pop("CHALICE_TESTING", None)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CHILD_SCRIPT],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        print(result.stderr[-4000:], file=sys.stderr)
+        sys.exit(result.returncode)
+
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+    modules = parse_importtime(result.stderr)
+    modules.sort(key=lambda row: row[2], reverse=True)
+    report["imports"] = [
+        {"module": name, "self_ms": s / 1000, "cumulative_ms": c / 1000}
+        for name, s, c in modules[: args.top]
+    ]
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"\nimport app: {report['import_app_seconds'] * 1000:.1f} ms")
+    print(
+        f"config: {report['config_seconds'] * 1000:.1f} ms "
+        f"({report['ssm_round_trips']} SSM round trip(s), {report['ssm_calls']} stubbed SSM call(s))"
+    )
+
+    print(f"\n{'module':<50}{'self ms':>10}{'cumul. ms':>12}")
+    for row in report["imports"]:
+        print(f"{row['module']:<50}{row['self_ms']:>10.1f}{row['cumulative_ms']:>12.1f}")
+
+    print(f"\n{'lazy singleton (first use)':<50}{'init ms':>10}")
+    for name, seconds in report["lazy_init_seconds"].items():
+        print(f"{name:<50}{seconds * 1000:>10.1f}")
+    print()
+
+
+if __name__ == "__main__":
+    main()
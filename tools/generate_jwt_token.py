@@ -1,18 +1,13 @@
 import argparse
 import jwt
 from datetime import datetime, timedelta, timezone
-import boto3
 
 import sys
 import os
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 from chalicelib.models.roles import Roles
-
-ssm_client = boto3.client("ssm")
-AUTH_SECRET = ssm_client.get_parameter(Name="/Zap/AUTH_SECRET", WithDecryption=True)[
-    "Parameter"
-]["Value"]
+from chalicelib.modules.secret_provider import auth_secret
 
 
 def generate_token(expiry_hours: int, roles: list[str]) -> str:
@@ -22,7 +17,7 @@ def generate_token(expiry_hours: int, roles: list[str]) -> str:
         "iat": datetime.now(timezone.utc),
     }
 
-    token = jwt.encode(payload, AUTH_SECRET, algorithm="HS256")
+    token = jwt.encode(payload, auth_secret.get(), algorithm="HS256")
     return token
 
 